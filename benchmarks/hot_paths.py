@@ -0,0 +1,234 @@
+"""
+Measures the query building, encoding and decoding hot paths against representative models.
+
+Cursors come from the in-memory FakeConnection, so no database is needed. Every case reports
+operations per second (best of --repeat rounds) and the peak memory allocated by a single
+operation. Results can be saved as a baseline and compared against later runs; the
+comparison exits with status 1 when a case is slower than the baseline by more than --threshold.
+
+    python -m benchmarks.hot_paths --save baseline.json
+    python -m benchmarks.hot_paths --compare baseline.json --threshold 0.1
+"""
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from typing import Callable
+
+from benchmarks.models import (
+    Narrow,
+    Wide,
+    Encoded,
+    connect_models,
+    create_narrow,
+    create_wide,
+    create_encoded,
+    create_narrow_row,
+    create_wide_row,
+    create_encoded_row
+)
+from model_connect.integrations.psycopg2 import (
+    create_select_query,
+    create_insert_query,
+    stream_select,
+    stream_insert,
+    select_count
+)
+from model_connect.integrations.psycopg2.common.processing import process_filter_options
+from model_connect.integrations.psycopg2.common.streaming import (
+    stream_dataclass_types_to_insert_tuples,
+    stream_to_dataclass_type
+)
+from model_connect.integrations.psycopg2.testing import FakeConnection
+
+ROWS = 1000
+
+
+def create_cases() -> dict[str, Callable[[], object]]:
+    narrow = [create_narrow(index) for index in range(ROWS)]
+    wide = [create_wide(index) for index in range(ROWS)]
+    encoded = [create_encoded(index) for index in range(ROWS)]
+
+    narrow_rows = [create_narrow_row(index) for index in range(ROWS)]
+    wide_rows = [create_wide_row(index) for index in range(ROWS)]
+    encoded_rows = [create_encoded_row(index) for index in range(ROWS)]
+
+    filter_options = {
+        'id': {'>': 10, '<': 1000},
+        'name': ['a', 'b', 'c']
+    }
+
+    def select_query(dataclass_type):
+        return lambda: create_select_query(
+            dataclass_type,
+            filter_options={'id': {'>': 10}},
+            sort_options={'id': 'desc'},
+            pagination_options={'limit': 100, 'skip': 100}
+        )
+
+    def insert_query(dataclass_type, data):
+        return lambda: create_insert_query(
+            dataclass_type,
+            data,
+            on_conflict_options={'do': 'update'}
+        )
+
+    def insert_tuples(dataclass_type, data, columns):
+        return lambda: stream_dataclass_types_to_insert_tuples(
+            dataclass_type,
+            data,
+            columns
+        )
+
+    def decode(dataclass_type, rows):
+        return lambda: list(stream_to_dataclass_type(iter(rows), dataclass_type))
+
+    connection = FakeConnection({
+        'narrows': narrow_rows,
+        'wides': wide_rows
+    })
+
+    def select(dataclass_type):
+        return lambda: list(stream_select(connection.cursor(), dataclass_type))
+
+    def insert(dataclass_type, data):
+        def operation():
+            list(stream_insert(connection.cursor(), dataclass_type, data))
+            connection.rollback()
+
+        return operation
+
+    return {
+        'create_select_query[narrow]': select_query(Narrow),
+        'create_select_query[wide]': select_query(Wide),
+        'create_insert_query[narrow x1000]': insert_query(Narrow, narrow),
+        'create_insert_query[wide x1000]': insert_query(Wide, wide),
+        'process_filter_options[narrow]': lambda: process_filter_options(Narrow, filter_options, []),
+        'insert_tuples[narrow x1000]': insert_tuples(Narrow, narrow, ('name',)),
+        'insert_tuples[wide x1000]': insert_tuples(Wide, wide, tuple(create_wide_row(0))[1:]),
+        'insert_tuples[encoded x1000]': insert_tuples(Encoded, encoded, ('payload', 'tags', 'created_at')),
+        'stream_to_dataclass_type[narrow x1000]': decode(Narrow, narrow_rows),
+        'stream_to_dataclass_type[wide x1000]': decode(Wide, wide_rows),
+        'stream_to_dataclass_type[encoded x1000]': decode(Encoded, encoded_rows),
+        'stream_select[narrow x1000]': select(Narrow),
+        'stream_select[wide x1000]': select(Wide),
+        'select_count[narrow x1000]': lambda: select_count(connection.cursor(), Narrow, {'id': {'>': 10}}),
+        'stream_insert[narrow x1000]': insert(Narrow, narrow),
+    }
+
+
+def measure_ops_per_sec(operation: Callable, repeat: int, min_time: float) -> float:
+    number = 1
+
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            operation()
+        elapsed = time.perf_counter() - start
+
+        if elapsed >= min_time:
+            break
+
+        number *= 2
+
+    best = elapsed / number
+
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            operation()
+        best = min(best, (time.perf_counter() - start) / number)
+
+    return 1 / best
+
+
+def measure_peak_bytes(operation: Callable) -> int:
+    operation()
+
+    tracemalloc.start()
+
+    try:
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+        operation()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return peak - baseline
+
+
+def run(repeat: int, min_time: float, selected: str = None) -> dict[str, dict]:
+    connect_models()
+
+    results = {}
+
+    for name, operation in create_cases().items():
+        if selected and selected not in name:
+            continue
+
+        results[name] = {
+            'ops_per_sec': measure_ops_per_sec(operation, repeat, min_time),
+            'peak_bytes': measure_peak_bytes(operation)
+        }
+
+    return results
+
+
+def print_results(results: dict[str, dict], baseline: dict[str, dict] = None, threshold: float = 0.1) -> bool:
+    regressed = False
+
+    header = f'{"case":<42} {"ops/sec":>12} {"peak KiB/op":>12}'
+
+    if baseline is not None:
+        header += f' {"vs baseline":>12}'
+
+    print(header)
+
+    for name, result in results.items():
+        line = f'{name:<42} {result["ops_per_sec"]:>12.1f} {result["peak_bytes"] / 1024:>12.1f}'
+
+        if baseline is not None and name in baseline:
+            ratio = result['ops_per_sec'] / baseline[name]['ops_per_sec']
+            line += f' {ratio:>11.2f}x'
+
+            if ratio < 1 - threshold:
+                line += '  REGRESSION'
+                regressed = True
+
+        print(line)
+
+    return regressed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--min-time', type=float, default=0.2)
+    parser.add_argument('--filter', default=None)
+    parser.add_argument('--save', default=None)
+    parser.add_argument('--compare', default=None)
+    parser.add_argument('--threshold', type=float, default=0.1)
+    args = parser.parse_args()
+
+    results = run(args.repeat, args.min_time, args.filter)
+
+    baseline = None
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+
+    regressed = print_results(results, baseline, args.threshold)
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    if regressed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+"""
+Measures the import time of model_connect, with and without each integration.
+
+Every scenario runs in a fresh interpreter so module caches do not leak between runs.
+
+    python -m benchmarks.import_time --repeat 10
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+
+SCENARIOS = {
+    'model_connect': (
+        'import model_connect'
+    ),
+    'model_connect + psycopg2': (
+        'import model_connect\n'
+        'from model_connect.connect import connect_psycopg2_integration\n'
+        'connect_psycopg2_integration()\n'
+        'from model_connect.integrations.psycopg2 import stream_select, stream_insert'
+    ),
+    'model_connect + fastapi': (
+        'import model_connect\n'
+        'from model_connect.connect import connect_fastapi_integration\n'
+        'connect_fastapi_integration()\n'
+        'from model_connect.integrations.fastapi import create_response_dtos, get_query_options'
+    ),
+    'model_connect + psycopg2 + fastapi': (
+        'import model_connect\n'
+        'from model_connect.connect import connect_psycopg2_integration, connect_fastapi_integration\n'
+        'connect_psycopg2_integration()\n'
+        'connect_fastapi_integration()\n'
+        'from model_connect.integrations.psycopg2 import stream_select, stream_insert\n'
+        'from model_connect.integrations.fastapi import create_router'
+    ),
+    'model_connect + connect(model)': (
+        'from dataclasses import dataclass\n'
+        'import model_connect\n'
+        '@dataclass\n'
+        'class User:\n'
+        '    id: int\n'
+        'model_connect.connect(User)'
+    ),
+}
+
+TEMPLATE = '''
+import time
+start = time.perf_counter()
+{statement}
+print(time.perf_counter() - start)
+'''
+
+
+def measure(statement: str) -> float:
+    output = subprocess.check_output(
+        [sys.executable, '-c', TEMPLATE.format(statement=statement)],
+        text=True
+    )
+
+    return float(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    print(f'{"scenario":<40} {"min (ms)":>10} {"median (ms)":>12}')
+
+    for name, statement in SCENARIOS.items():
+        timings = [measure(statement) * 1000 for _ in range(args.repeat)]
+
+        print(f'{name:<40} {min(timings):>10.1f} {statistics.median(timings):>12.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,141 @@
+"""
+Representative models for the benchmarks: a narrow table, a wide table and a table whose
+columns go through encoders and decoders.
+"""
+import json
+from dataclasses import dataclass, make_dataclass, field
+from datetime import datetime
+from typing import Optional
+
+from model_connect import connect
+from model_connect.connect import connect_psycopg2_integration
+from model_connect.integrations.psycopg2 import Psycopg2ModelField
+from model_connect.options import ConnectOptions, ModelFields, ModelField
+
+WIDE_COLUMNS = 40
+
+
+@dataclass
+class Narrow:
+    id: Optional[int]
+    name: str
+
+
+Wide = make_dataclass(
+    'Wide',
+    [('id', Optional[int])] + [
+        (f'column_{index}', str if index % 2 else int)
+        for index in range(WIDE_COLUMNS)
+    ]
+)
+
+
+@dataclass
+class Encoded:
+    id: Optional[int]
+    payload: dict
+    tags: list
+    created_at: datetime = field(
+        default=None
+    )
+
+
+def encode_json(_, value):
+    return json.dumps(value)
+
+
+def decode_json(_, value):
+    return json.loads(value)
+
+
+def decode_datetime(_, value):
+    return datetime.fromisoformat(value)
+
+
+def identifier_options(**model_fields) -> ConnectOptions:
+    return ConnectOptions(
+        model_fields=ModelFields(
+            id=ModelField(
+                is_identifier=True
+            ),
+            **model_fields
+        )
+    )
+
+
+def connect_models():
+    connect_psycopg2_integration()
+
+    connect(Narrow, identifier_options())
+    connect(Wide, identifier_options())
+    connect(
+        Encoded,
+        identifier_options(
+            payload=ModelField(
+                override_integrations=(
+                    Psycopg2ModelField(
+                        encoder=encode_json,
+                        decoder=decode_json
+                    ),
+                )
+            ),
+            tags=ModelField(
+                override_integrations=(
+                    Psycopg2ModelField(
+                        encoder=encode_json,
+                        decoder=decode_json
+                    ),
+                )
+            ),
+            created_at=ModelField(
+                override_integrations=(
+                    Psycopg2ModelField(
+                        decoder=decode_datetime
+                    ),
+                )
+            )
+        )
+    )
+
+
+def create_narrow(index: int) -> Narrow:
+    return Narrow(None, f'name {index}')
+
+
+def create_wide(index: int) -> Wide:
+    values = [
+        f'value {index}' if column % 2 else index
+        for column in range(WIDE_COLUMNS)
+    ]
+
+    return Wide(None, *values)
+
+
+def create_encoded(index: int) -> Encoded:
+    return Encoded(
+        None,
+        {'index': index, 'nested': {'value': index * 2}},
+        ['a', 'b', str(index)]
+    )
+
+
+def create_narrow_row(index: int) -> dict:
+    return {'id': index, 'name': f'name {index}'}
+
+
+def create_wide_row(index: int) -> dict:
+    row = {'id': index}
+
+    for column in range(WIDE_COLUMNS):
+        row[f'column_{column}'] = f'value {index}' if column % 2 else index
+
+    return row
+
+
+def create_encoded_row(index: int) -> dict:
+    return {
+        'id': index,
+        'payload': json.dumps({'index': index, 'nested': {'value': index * 2}}),
+        'tags': json.dumps(['a', 'b', str(index)]),
+        'created_at': '2024-01-01T00:00:00'
+    }
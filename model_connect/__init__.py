@@ -1 +1,4 @@
-from model_connect.connect import connect
+from model_connect.connect import connect, resolve_all
+from model_connect.cache import enable_cache, disable_cache
+from model_connect.warmup import warmup
+from model_connect.hooks import add_hook, remove_hook
@@ -0,0 +1,250 @@
+import atexit
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from dataclasses import MISSING, fields, is_dataclass
+from enum import Enum
+from threading import RLock
+from types import CodeType
+from typing import TYPE_CHECKING, Any
+
+from model_connect.constants import is_undefined
+from model_connect.integrations import type_registry
+
+if TYPE_CHECKING:
+    from model_connect.options import ConnectOptions
+
+CACHE_VERSION = 2
+
+_cache = None
+_lock = RLock()
+
+
+class MetadataCache:
+    def __init__(self, path: str):
+        self.path = os.fspath(path)
+        self.entries = self.load()
+        self.dirty = False
+        self.hits = 0
+        self.misses = 0
+
+    def load(self) -> dict[str, dict]:
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+        if not isinstance(data, dict) or data.get('version') != CACHE_VERSION:
+            return {}
+
+        entries = data.get('entries')
+
+        if not isinstance(entries, dict):
+            return {}
+
+        return entries
+
+    def get(self, key: str) -> dict | None:
+        with _lock:
+            entry = self.entries.get(key)
+
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+            return entry
+
+    def set(self, key: str, entry: dict):
+        with _lock:
+            if self.entries.get(key) == entry:
+                return
+
+            self.entries[key] = entry
+            self.dirty = True
+
+    def save(self):
+        with _lock:
+            if not self.dirty:
+                return
+
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+
+            fd, tmp_path = tempfile.mkstemp(
+                dir=directory,
+                prefix='.model-connect-',
+                suffix='.tmp'
+            )
+
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump({
+                        'version': CACHE_VERSION,
+                        'entries': self.entries
+                    }, f)
+
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+
+            self.dirty = False
+
+
+def enable_cache(path: str) -> MetadataCache:
+    global _cache
+
+    with _lock:
+        if _cache is None:
+            atexit.register(save_cache)
+
+        _cache = MetadataCache(path)
+
+    return _cache
+
+
+def disable_cache():
+    global _cache
+
+    with _lock:
+        save_cache()
+        _cache = None
+
+
+def get_cache() -> MetadataCache | None:
+    return _cache
+
+
+def save_cache():
+    cache = _cache
+
+    if cache is not None:
+        cache.save()
+
+
+class Unfingerprintable(Exception):
+    pass
+
+
+def describe(value: Any) -> Any:
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+
+    if is_undefined(value):
+        return '<UNDEFINED>'
+
+    if isinstance(value, Enum):
+        return repr(value)
+
+    if isinstance(value, type) and not is_dataclass(value):
+        return f'{value.__module__}.{value.__qualname__}'
+
+    if is_dataclass(value):
+        if isinstance(value, type):
+            # noinspection PyDataclass
+            return [
+                f'{value.__module__}.{value.__qualname__}',
+                [
+                    [
+                        dataclass_field.name,
+                        repr(dataclass_field.type),
+                        dataclass_field.init,
+                        dataclass_field.default is MISSING and dataclass_field.default_factory is MISSING
+                    ]
+                    for dataclass_field in fields(value)
+                ]
+            ]
+
+        # noinspection PyDataclass
+        return [
+            f'{type(value).__module__}.{type(value).__qualname__}',
+            [
+                [dataclass_field.name, describe(getattr(value, dataclass_field.name))]
+                for dataclass_field in fields(value) if
+                dataclass_field.init
+            ]
+        ]
+
+    if isinstance(value, dict):
+        return [
+            f'{type(value).__module__}.{type(value).__qualname__}',
+            sorted(
+                [str(key), describe(item)] for
+                key, item in
+                value.items()
+            )
+        ]
+
+    if isinstance(value, (list, tuple)):
+        return [
+            describe(item) for
+            item in
+            value
+        ]
+
+    if isinstance(value, (set, frozenset)):
+        return sorted(
+            json.dumps(describe(item)) for
+            item in
+            value
+        )
+
+    code = getattr(value, '__code__', None)
+
+    if code is not None:
+        return [
+            f'{value.__module__}.{value.__qualname__}',
+            describe_code(code)
+        ]
+
+    if callable(value) and hasattr(value, '__qualname__'):
+        return f'{getattr(value, "__module__", None)}.{value.__qualname__}'
+
+    raise Unfingerprintable(value)
+
+
+def describe_code(code: CodeType) -> list:
+    """
+    Describes the bytecode and constants, recursing into nested code objects (comprehensions,
+    lambdas), whose repr contains a memory address that changes in every process.
+    """
+    return [
+        code.co_code.hex(),
+        list(code.co_names),
+        [describe_constant(constant) for constant in code.co_consts]
+    ]
+
+
+def describe_constant(value: Any) -> Any:
+    if isinstance(value, CodeType):
+        return describe_code(value)
+
+    if isinstance(value, (tuple, frozenset)):
+        items = [describe_constant(item) for item in value]
+        return items if isinstance(value, tuple) else sorted(items, key=json.dumps)
+
+    if value is None or value is Ellipsis or isinstance(value, (bool, int, float, complex, str, bytes)):
+        return repr(value)
+
+    raise Unfingerprintable(value)
+
+
+def fingerprint(dataclass_type: type, options: 'ConnectOptions') -> str | None:
+    try:
+        description = [
+            CACHE_VERSION,
+            list(sys.version_info[:2]),
+            [name for name, _, _ in type_registry.iterate()],
+            describe(dataclass_type),
+            describe(options)
+        ]
+    except Unfingerprintable:
+        return None
+
+    data = json.dumps(description, sort_keys=True, default=repr)
+
+    return hashlib.sha256(data.encode()).hexdigest()
@@ -1,30 +1,43 @@
 from dataclasses import is_dataclass
 
 from model_connect import registry
-from model_connect.integrations.psycopg2 import Psycopg2ModelField, Psycopg2Model
 from model_connect.options.connect import ConnectOptions
-
-from model_connect.integrations.fastapi import FastAPIModel, FastAPIModelField
+from model_connect.schema import compile_schema
 from model_connect.integrations import type_registry
 
 
-def connect(dataclass_type: type, options: ConnectOptions = None):
+def connect(dataclass_type: type, options: ConnectOptions = None, lazy: bool = False):
     assert is_dataclass(dataclass_type)
 
     if options is None:
         options = ConnectOptions()
 
+    if lazy:
+        registry.add_pending(
+            dataclass_type,
+            options
+        )
+
+        return dataclass_type
+
     options.resolve(dataclass_type)
 
     registry.add(
         dataclass_type,
-        options
+        options,
+        compile_schema(options)
     )
 
     return dataclass_type
 
 
+def resolve_all():
+    registry.resolve_all()
+
+
 def connect_psycopg2_integration():
+    from model_connect.integrations.psycopg2 import Psycopg2Model, Psycopg2ModelField
+
     type_registry.add(
         'psycopg2',
         Psycopg2Model,
@@ -33,6 +46,8 @@ def connect_psycopg2_integration():
 
 
 def connect_fastapi_integration():
+    from model_connect.integrations.fastapi import FastAPIModel, FastAPIModelField
+
     type_registry.add(
         'fastapi',
         FastAPIModel,
@@ -0,0 +1,182 @@
+import logging
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from itertools import count
+from threading import Lock
+from time import perf_counter
+from typing import Any, Callable, Optional
+
+PHASES = (
+    'process_options',
+    'render',
+    'encode',
+    'dedupe',
+    'execute',
+    'fetch',
+    'decode',
+    'rows'
+)
+
+_global_hooks: tuple[Callable[['HookEvent'], Any], ...] = ()
+_model_hooks: dict[type, tuple[Callable[['HookEvent'], Any], ...]] = {}
+_lock = Lock()
+_timer_ids = count()
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class HookEvent:
+    phase: str
+    operation: str
+    dataclass_type: type
+    duration: float
+    size: Optional[int] = None
+    query: Any = None
+    timer_id: Optional[int] = None
+
+
+class PhaseTimer:
+    __slots__ = ('id', 'operation', 'dataclass_type', 'hooks', 'started', 'last', 'query')
+
+    def __init__(self, operation: str, dataclass_type: type, hooks: tuple):
+        # Never reused, unlike id(), so events of different timers are never confused
+        self.id = next(_timer_ids)
+        self.operation = operation
+        self.dataclass_type = dataclass_type
+        self.hooks = hooks
+        self.started = self.last = perf_counter()
+        self.query = None
+
+    def reset(self):
+        self.last = perf_counter()
+
+    def mark(self, phase: str, size: int = None, query: Any = None):
+        now = perf_counter()
+        self.emit(phase, now - self.last, size, query)
+        self.last = perf_counter()
+
+    def finish(self, phase: str, size: int = None, query: Any = None):
+        self.emit(phase, perf_counter() - self.started, size, query)
+
+    def emit(self, phase: str, duration: float, size: int = None, query: Any = None):
+        # Events after execute carry the executed query, so hooks can correlate them
+        if query is None:
+            query = self.query
+        else:
+            self.query = query
+
+        event = HookEvent(
+            phase,
+            self.operation,
+            self.dataclass_type,
+            duration,
+            size,
+            query,
+            self.id
+        )
+
+        for hook in self.hooks:
+            # A failing metrics hook must not abort the query it observes
+            try:
+                hook(event)
+            except Exception:
+                logger.exception('Hook %r failed on the %r phase of %s', hook, phase, self.operation)
+
+
+def add_hook(hook: Callable[[HookEvent], Any], dataclass_type: type = None):
+    global _global_hooks
+
+    with _lock:
+        if dataclass_type is None:
+            _global_hooks = (*_global_hooks, hook)
+        else:
+            _model_hooks[dataclass_type] = (*_model_hooks.get(dataclass_type, ()), hook)
+
+
+def remove_hook(hook: Callable[[HookEvent], Any], dataclass_type: type = None):
+    global _global_hooks
+
+    with _lock:
+        if dataclass_type is None:
+            _global_hooks = tuple(h for h in _global_hooks if h != hook)
+            return
+
+        hooks = tuple(h for h in _model_hooks.get(dataclass_type, ()) if h != hook)
+
+        if hooks:
+            _model_hooks[dataclass_type] = hooks
+        else:
+            _model_hooks.pop(dataclass_type, None)
+
+
+def start_timer(operation: str, dataclass_type: type) -> Optional[PhaseTimer]:
+    if not _global_hooks and not _model_hooks:
+        return None
+
+    hooks = _global_hooks + _model_hooks.get(dataclass_type, ())
+
+    if not hooks:
+        return None
+
+    return PhaseTimer(
+        operation,
+        dataclass_type,
+        hooks
+    )
+
+
+class QueryRecorder(ABC):
+    """
+    Base for hooks that need the per-phase durations of a whole query. Durations of
+    the recorded phases are summed per executed query (i.e. per timer) and passed to
+    record() once its rows are exhausted.
+    """
+    phases = ('execute', 'fetch', 'decode')
+    max_pending = 10000
+
+    def __init__(self, dataclass_type: type = None):
+        self.dataclass_type = dataclass_type
+        self._pending: dict[int, dict[str, float]] = {}
+        self._pending_lock = Lock()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def start(self):
+        add_hook(self.on_event, self.dataclass_type)
+
+    def stop(self):
+        remove_hook(self.on_event, self.dataclass_type)
+
+    def on_event(self, event: HookEvent):
+        if event.query is None:
+            return
+
+        key = event.timer_id
+
+        if event.phase == 'rows':
+            with self._pending_lock:
+                durations = self._pending.pop(key, {})
+
+            self.record(event, durations)
+            return
+
+        if event.phase not in self.phases:
+            return
+
+        with self._pending_lock:
+            durations = self._pending.setdefault(key, {})
+            durations[event.phase] = durations.get(event.phase, 0.0) + event.duration
+
+            # Results that are never exhausted do not emit 'rows', so bound what is kept
+            if len(self._pending) > self.max_pending:
+                self._pending.pop(next(iter(self._pending)))
+
+    @abstractmethod
+    def record(self, event: HookEvent, durations: dict[str, float]):
+        pass
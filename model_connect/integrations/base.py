@@ -1,14 +1,15 @@
 from abc import abstractmethod, ABC
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, TypeVar
+from typing import TYPE_CHECKING, TypeVar, Any, Optional
 
 if TYPE_CHECKING:
     from model_connect.options import ConnectOptions, ModelField
+    from model_connect.schema import ModelSchema
 
 _T = TypeVar('_T')
 
 
-@dataclass
+@dataclass(slots=True)
 class BaseIntegrationModel(ABC):
     @classmethod
     @property
@@ -20,8 +21,14 @@ class BaseIntegrationModel(ABC):
     def resolve(self, options: 'ConnectOptions'):
         ...
 
+    def compile(self, options: 'ConnectOptions') -> Optional[Any]:
+        return None
 
-@dataclass
+    def warmup(self, schema: 'ModelSchema'):
+        pass
+
+
+@dataclass(slots=True)
 class BaseIntegrationModelField(ABC):
     @classmethod
     @property
@@ -35,8 +42,8 @@ class BaseIntegrationModelField(ABC):
 
 
 class ModelIntegrations(dict[str, _T]):
-    pass
+    __slots__ = ()
 
 
 class ModelFieldIntegrations(dict[str, _T]):
-    pass
+    __slots__ = ()
@@ -1,2 +1,89 @@
+from importlib import import_module
+from typing import TYPE_CHECKING
+
 from model_connect.integrations.fastapi.options.model import FastAPIModel
 from model_connect.integrations.fastapi.options.model_field import FastAPIModelField
+
+if TYPE_CHECKING:
+    from model_connect.integrations.fastapi.response import (
+        create_response_serializer,
+        create_response_dto,
+        create_response_dtos,
+        serialize_response_dto,
+        serialize_response_dtos,
+        stream_response_dtos
+    )
+    from model_connect.integrations.fastapi.request import (
+        RequestDtoValidationError,
+        create_request_parser,
+        parse_request_dto,
+        parse_request_dtos,
+        get_from_post_request_dto,
+        get_from_post_request_dtos,
+        get_from_put_request_dto,
+        get_from_patch_request_dto
+    )
+    from model_connect.integrations.fastapi.ingest import (
+        IngestSummary,
+        insert_request,
+        stream_insert_request
+    )
+    from model_connect.integrations.fastapi.query_params import (
+        QueryOptions,
+        create_query_params_parser,
+        parse_query_params,
+        get_query_options,
+        get_filter_options,
+        get_sort_options,
+        get_pagination_options
+    )
+    from model_connect.integrations.fastapi.router import (
+        create_router,
+        attach_router,
+        get_router_prefix
+    )
+
+# Submodules below import fastapi (and psycopg2 for ingestion), so they are only loaded on first use
+_lazy_imports = {
+    'create_response_serializer': 'model_connect.integrations.fastapi.response',
+    'create_response_dto': 'model_connect.integrations.fastapi.response',
+    'create_response_dtos': 'model_connect.integrations.fastapi.response',
+    'serialize_response_dto': 'model_connect.integrations.fastapi.response',
+    'serialize_response_dtos': 'model_connect.integrations.fastapi.response',
+    'stream_response_dtos': 'model_connect.integrations.fastapi.response',
+    'RequestDtoValidationError': 'model_connect.integrations.fastapi.request',
+    'create_request_parser': 'model_connect.integrations.fastapi.request',
+    'parse_request_dto': 'model_connect.integrations.fastapi.request',
+    'parse_request_dtos': 'model_connect.integrations.fastapi.request',
+    'get_from_post_request_dto': 'model_connect.integrations.fastapi.request',
+    'get_from_post_request_dtos': 'model_connect.integrations.fastapi.request',
+    'get_from_put_request_dto': 'model_connect.integrations.fastapi.request',
+    'get_from_patch_request_dto': 'model_connect.integrations.fastapi.request',
+    'IngestSummary': 'model_connect.integrations.fastapi.ingest',
+    'insert_request': 'model_connect.integrations.fastapi.ingest',
+    'stream_insert_request': 'model_connect.integrations.fastapi.ingest',
+    'QueryOptions': 'model_connect.integrations.fastapi.query_params',
+    'create_query_params_parser': 'model_connect.integrations.fastapi.query_params',
+    'parse_query_params': 'model_connect.integrations.fastapi.query_params',
+    'get_query_options': 'model_connect.integrations.fastapi.query_params',
+    'get_filter_options': 'model_connect.integrations.fastapi.query_params',
+    'get_sort_options': 'model_connect.integrations.fastapi.query_params',
+    'get_pagination_options': 'model_connect.integrations.fastapi.query_params',
+    'create_router': 'model_connect.integrations.fastapi.router',
+    'attach_router': 'model_connect.integrations.fastapi.router',
+    'get_router_prefix': 'model_connect.integrations.fastapi.router',
+}
+
+
+def __getattr__(name: str):
+    if name not in _lazy_imports:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    value = getattr(import_module(_lazy_imports[name]), name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+    return sorted([*globals(), *_lazy_imports])
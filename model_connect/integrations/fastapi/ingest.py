@@ -0,0 +1,468 @@
+import asyncio
+import codecs
+import json
+import re
+from contextlib import aclosing
+from dataclasses import dataclass, field
+from typing import Any, AsyncGenerator, TypeVar
+
+from fastapi import HTTPException, Request
+from psycopg2.extras import DictCursor
+from starlette.concurrency import run_in_threadpool
+
+from model_connect.integrations.fastapi.request import (
+    RequestDtoValidationError,
+    create_request_parser
+)
+from model_connect.integrations.json.decoder import loads, DecodeError
+from model_connect.integrations.psycopg2.insert import insert_count
+
+_T = TypeVar('_T')
+
+MAX_ITEM_SIZE = 1024 * 1024
+
+ARRAY_SEPARATORS = re.compile(r'[\s,]*')
+STRING_SPECIALS = re.compile(r'["\\]')
+SCALAR_ENDS = re.compile(r'[\s,\]]')
+CONTAINER_SPECIALS = re.compile(r'["\[\]{}]')
+VALUE_ENDS = frozenset(' \t\r\n,]')
+
+_json_decoder = json.JSONDecoder()
+
+
+class InvalidItem:
+    def __init__(self, error: dict):
+        self.error = error
+
+
+@dataclass
+class IngestChunk:
+    start_index: int
+    received: int = 0
+    inserted: int = 0
+    errors: list[dict] = field(default_factory=list)
+
+
+@dataclass
+class IngestSummary:
+    received: int = 0
+    inserted: int = 0
+    errors: list[dict] = field(default_factory=list)
+
+
+def create_invalid_item(index: int, e: Exception) -> InvalidItem:
+    return InvalidItem({
+        'loc': ['body', index],
+        'msg': f'Invalid JSON: {e}',
+        'type': 'json_invalid'
+    })
+
+
+def raise_item_too_large(max_item_size: int):
+    raise HTTPException(
+        status_code=413,
+        detail=f'An item exceeds the maximum size of {max_item_size}'
+    )
+
+
+async def stream_ndjson_items(
+        chunks: AsyncGenerator[bytes, None],
+        max_item_size: int = MAX_ITEM_SIZE
+) -> AsyncGenerator[Any, None]:
+    parts = []
+    size = 0
+    index = 0
+
+    async for chunk in chunks:
+        lines = chunk.split(b'\n')
+        last = lines.pop()
+
+        for line in lines:
+            if parts:
+                line = b''.join(parts) + line
+                parts = []
+                size = 0
+
+            if len(line) > max_item_size:
+                raise_item_too_large(max_item_size)
+
+            if not line.strip():
+                continue
+
+            try:
+                yield loads(line)
+            except DecodeError as e:
+                yield create_invalid_item(index, e)
+
+            index += 1
+
+        if last:
+            parts.append(last)
+            size += len(last)
+
+            if size > max_item_size:
+                raise_item_too_large(max_item_size)
+
+    line = b''.join(parts)
+
+    if line.strip():
+        try:
+            yield loads(line)
+        except DecodeError as e:
+            yield create_invalid_item(index, e)
+
+
+class JsonArrayScanner:
+    """
+    Splits a JSON array body into its items as it arrives. Items that are complete within the
+    decoded chunk are decoded in place; an item that continues in the next chunk is scanned
+    once (tracking the nesting depth and whether the scan is inside a string) until it ends,
+    and only then decoded, so no byte is parsed more than twice.
+    """
+
+    def __init__(self, max_item_size: int = MAX_ITEM_SIZE):
+        self.max_item_size = max_item_size
+        self.decoder = codecs.getincrementaldecoder('utf-8')()
+        self.index = 0
+        self.is_started = False
+        self.is_finished = False
+        self.parts = []
+        self.size = 0
+        self.in_item = False
+        self.in_scalar = False
+        self.in_string = False
+        self.is_escaped = False
+        self.depth = 0
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        items = []
+        text = self.decoder.decode(chunk)
+        position = 0
+        start = 0
+        length = len(text)
+
+        while position < length and not self.is_finished:
+            if not self.in_item:
+                position = ARRAY_SEPARATORS.match(text, position).end()
+
+                if position >= length:
+                    break
+
+                char = text[position]
+
+                if not self.is_started:
+                    if char != '[':
+                        raise HTTPException(
+                            status_code=400,
+                            detail='Expected a JSON array or NDJSON body'
+                        )
+
+                    self.is_started = True
+                    position += 1
+                    continue
+
+                if char == ']':
+                    self.is_finished = True
+                    break
+
+                try:
+                    value, end = _json_decoder.raw_decode(text, position)
+                except json.JSONDecodeError:
+                    pass
+                else:
+                    # A number may continue in the next chunk, so a value is complete only once what follows it is known
+                    if end < length and text[end] in VALUE_ENDS:
+                        items.append(value)
+                        self.index += 1
+                        position = end
+                        continue
+
+                self.in_item = True
+                start = position
+
+                if char == '"':
+                    self.in_string = True
+                    position += 1
+                elif char in '[{':
+                    self.depth = 1
+                    position += 1
+                else:
+                    self.in_scalar = True
+
+                continue
+
+            if self.is_escaped:
+                self.is_escaped = False
+                position += 1
+                continue
+
+            if self.in_string:
+                match = STRING_SPECIALS.search(text, position)
+
+                if match is None:
+                    position = length
+                    break
+
+                position = match.end()
+
+                if match.group() == '\\':
+                    self.is_escaped = True
+                    continue
+
+                self.in_string = False
+
+                if self.depth == 0:
+                    items.append(self.complete(text, start, position))
+
+                continue
+
+            if self.in_scalar:
+                match = SCALAR_ENDS.search(text, position)
+
+                if match is None:
+                    position = length
+                    break
+
+                position = match.start()
+                self.in_scalar = False
+                items.append(self.complete(text, start, position))
+                continue
+
+            match = CONTAINER_SPECIALS.search(text, position)
+
+            if match is None:
+                position = length
+                break
+
+            position = match.end()
+            char = match.group()
+
+            if char == '"':
+                self.in_string = True
+            elif char in '[{':
+                self.depth += 1
+            else:
+                self.depth -= 1
+
+                if self.depth == 0:
+                    items.append(self.complete(text, start, position))
+
+        if self.in_item:
+            self.parts.append(text[start:])
+            self.size += length - start
+
+            if self.size > self.max_item_size:
+                raise_item_too_large(self.max_item_size)
+
+        return items
+
+    def complete(self, text: str, start: int, end: int) -> Any:
+        item = text[start:end]
+
+        if self.parts:
+            item = ''.join(self.parts) + item
+            self.parts = []
+            self.size = 0
+
+        if len(item) > self.max_item_size:
+            raise_item_too_large(self.max_item_size)
+
+        self.in_item = False
+        self.index += 1
+
+        try:
+            return loads(item)
+        except DecodeError as e:
+            return create_invalid_item(self.index - 1, e)
+
+
+async def stream_json_array_items(
+        chunks: AsyncGenerator[bytes, None],
+        max_item_size: int = MAX_ITEM_SIZE
+) -> AsyncGenerator[Any, None]:
+    scanner = JsonArrayScanner(max_item_size)
+
+    async for chunk in chunks:
+        for item in scanner.feed(chunk):
+            yield item
+
+        if scanner.is_finished:
+            break
+
+    if not scanner.is_finished:
+        raise HTTPException(
+            status_code=400,
+            detail='Unexpected end of JSON array body'
+        )
+
+
+async def stream_request_items(
+        request: Request,
+        max_item_size: int = MAX_ITEM_SIZE
+) -> AsyncGenerator[Any, None]:
+    chunks = request.stream()
+
+    first = b''
+
+    async for chunk in chunks:
+        first += chunk
+
+        if first.strip():
+            break
+
+    async def replay() -> AsyncGenerator[bytes, None]:
+        yield first
+
+        async for chunk_ in chunks:
+            yield chunk_
+
+    content_type = request.headers.get('content-type', '')
+
+    is_ndjson = (
+            'ndjson' in content_type or
+            'jsonlines' in content_type or
+            not first.lstrip().startswith(b'[')
+    )
+
+    if is_ndjson:
+        items = stream_ndjson_items(replay(), max_item_size)
+    else:
+        items = stream_json_array_items(replay(), max_item_size)
+
+    async for item in items:
+        yield item
+
+
+def insert_chunk(
+        cursor: DictCursor,
+        dataclass_type: type[_T],
+        chunk: IngestChunk,
+        data: list[_T],
+        columns: list[str] = None,
+        on_conflict_options: dict = None
+) -> IngestChunk:
+    chunk.inserted = insert_count(
+        cursor,
+        dataclass_type,
+        data,
+        columns,
+        on_conflict_options
+    )
+
+    return chunk
+
+
+async def stream_insert_request(
+        request: Request,
+        cursor: DictCursor,
+        dataclass_type: type[_T],
+        chunk_size: int = 1000,
+        columns: list[str] = None,
+        on_conflict_options: dict = None,
+        max_item_size: int = MAX_ITEM_SIZE
+) -> AsyncGenerator[IngestChunk, None]:
+    """
+    Parses the body incrementally and inserts it in chunks of chunk_size items, parsing the next
+    chunk while the previous one is inserted in a worker thread. The insert in flight is always
+    waited for before the generator finishes, so the cursor is idle afterwards even when parsing
+    fails or the client disconnects.
+    """
+    parser = create_request_parser(
+        dataclass_type,
+        'post'
+    )
+
+    pending = None
+    index = 0
+
+    chunk = IngestChunk(0)
+    data = []
+
+    async def flush():
+        nonlocal pending
+
+        result = None
+
+        if pending is not None:
+            result = await pending
+
+        pending = asyncio.ensure_future(
+            run_in_threadpool(
+                insert_chunk,
+                cursor,
+                dataclass_type,
+                chunk,
+                data,
+                columns,
+                on_conflict_options
+            )
+        )
+
+        return result
+
+    try:
+        async with aclosing(stream_request_items(request, max_item_size)) as items:
+            async for item in items:
+                chunk.received += 1
+
+                if isinstance(item, InvalidItem):
+                    chunk.errors.append(item.error)
+                else:
+                    try:
+                        data.append(parser(item, ('body', index)))
+                    except RequestDtoValidationError as e:
+                        chunk.errors.extend(e.errors)
+
+                index += 1
+
+                if len(data) >= chunk_size:
+                    completed = await flush()
+
+                    if completed is not None:
+                        yield completed
+
+                    chunk = IngestChunk(index)
+                    data = []
+
+        if chunk.received:
+            completed = await flush()
+
+            if completed is not None:
+                yield completed
+
+        if pending is not None:
+            yield await pending
+    finally:
+        if pending is not None:
+            # Waits without raising, as the insert's own error (if any) was raised or is moot
+            await asyncio.gather(pending, return_exceptions=True)
+
+
+async def insert_request(
+        request: Request,
+        cursor: DictCursor,
+        dataclass_type: type[_T],
+        chunk_size: int = 1000,
+        columns: list[str] = None,
+        on_conflict_options: dict = None,
+        max_item_size: int = MAX_ITEM_SIZE
+) -> IngestSummary:
+    summary = IngestSummary()
+
+    chunks = stream_insert_request(
+        request,
+        cursor,
+        dataclass_type,
+        chunk_size,
+        columns,
+        on_conflict_options,
+        max_item_size
+    )
+
+    async with aclosing(chunks):
+        async for chunk in chunks:
+            summary.received += chunk.received
+            summary.inserted += chunk.inserted
+            summary.errors.extend(chunk.errors)
+
+    return summary
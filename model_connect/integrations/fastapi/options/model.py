@@ -1,11 +1,15 @@
 from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
 
 from model_connect.constants import UNDEFINED, coalesce
 from model_connect.integrations.base import BaseIntegrationModel
 from model_connect.options import ConnectOptions
 
+if TYPE_CHECKING:
+    from model_connect.schema import ModelSchema
 
-@dataclass
+
+@dataclass(slots=True)
 class FastAPIModel(BaseIntegrationModel):
     resource_path: str = UNDEFINED
     resource_version: int = UNDEFINED
@@ -37,3 +41,8 @@ class FastAPIModel(BaseIntegrationModel):
             self.tag_name,
             ' '.join(self._connect_options.model.name_plural_parts)
         )
+
+    def warmup(self, schema: 'ModelSchema'):
+        from model_connect.integrations.fastapi.warmup import warmup_schema
+
+        warmup_schema(schema)
@@ -3,6 +3,8 @@ from model_connect.options import ConnectOptions, ModelField
 
 
 class FastAPIModelField(BaseIntegrationModelField):
+    __slots__ = ()
+
     @classmethod
     @property
     def integration_name(cls) -> str:
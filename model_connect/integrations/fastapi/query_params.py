@@ -0,0 +1,269 @@
+from dataclasses import dataclass, field
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from functools import cache
+from typing import Any, Callable, Iterable, TypeVar
+from uuid import UUID
+
+from fastapi import HTTPException, Request
+
+from model_connect.registry import get_schema
+from model_connect.schema import ModelSchema
+
+_T = TypeVar('_T')
+
+FILTER_OPERATORS = {
+    'eq': '=',
+    'ne': '!=',
+    'lt': '<',
+    'lte': '<=',
+    'gt': '>',
+    'gte': '>=',
+    'like': 'LIKE',
+    'ilike': 'ILIKE',
+    'in': 'IN',
+    'nin': 'NOT IN'
+}
+
+LIST_OPERATORS = ('IN', 'NOT IN')
+
+
+@dataclass
+class QueryOptions:
+    filter_options: dict = field(default_factory=dict)
+    sort_options: dict = field(default_factory=dict)
+    pagination_options: dict = field(default_factory=dict)
+    count: bool = False
+
+
+def coerce_bool(value: str) -> bool:
+    value = value.lower()
+
+    if value in ('true', '1', 'yes'):
+        return True
+
+    if value in ('false', '0', 'no'):
+        return False
+
+    raise ValueError(f'Invalid boolean: {value!r}')
+
+
+def create_coercer(inferred_type: Any) -> Callable[[str], Any]:
+    if inferred_type is bool:
+        return coerce_bool
+
+    if inferred_type in (int, float, Decimal, UUID):
+        return inferred_type
+
+    if inferred_type in (datetime, date, time):
+        return inferred_type.fromisoformat
+
+    if isinstance(inferred_type, type) and issubclass(inferred_type, Enum):
+        return inferred_type
+
+    return str
+
+
+def create_query_error(loc: tuple, msg: str) -> HTTPException:
+    return HTTPException(
+        status_code=422,
+        detail=[{
+            'loc': ['query', *loc],
+            'msg': msg,
+            'type': 'value_error'
+        }]
+    )
+
+
+def parse_int(label: str, value: str) -> int:
+    try:
+        value = int(value)
+    except ValueError:
+        raise create_query_error((label,), 'Input should be a valid integer')
+
+    if value < 0:
+        raise create_query_error((label,), 'Input should be greater than or equal to 0')
+
+    return value
+
+
+def create_query_params_parser(
+        dataclass_type: type[_T]
+) -> Callable[[Iterable[tuple[str, str]]], QueryOptions]:
+    return compile_query_params_parser(
+        get_schema(dataclass_type)
+    )
+
+
+@cache
+def compile_query_params_parser(
+        schema: ModelSchema
+) -> Callable[[Iterable[tuple[str, str]]], QueryOptions]:
+    options = schema.query_params
+
+    filters = {}
+    sortable = schema.sortable
+
+    for name in schema.filterable:
+        model_field = schema.model_fields[name]
+
+        coercer = create_coercer(model_field.inferred_type)
+
+        filters[model_field.name] = (model_field.name, '=', coercer)
+
+        for suffix, operator in FILTER_OPERATORS.items():
+            filters[f'{model_field.name}[{suffix}]'] = (model_field.name, operator, coercer)
+
+    if not options.enable_filtering:
+        filters = {}
+
+    if not options.enable_sorting:
+        sortable = frozenset()
+
+    limit_label = options.pagination_limit_label
+    skip_label = options.pagination_offset_label
+    count_label = options.count_flag_label
+    sort_label = options.sort_label
+
+    enable_pagination = options.enable_pagination
+    enable_count = options.enable_count
+    default_limit = options.pagination_default_limit
+    max_limit = options.pagination_max_limit
+
+    def parse(query_params: Iterable[tuple[str, str]]) -> QueryOptions:
+        result = QueryOptions()
+
+        filter_options = result.filter_options
+        limit = default_limit
+        skip = None
+
+        for key, value in query_params:
+            filter_ = filters.get(key)
+
+            if filter_ is not None:
+                name, operator, coercer = filter_
+
+                try:
+                    if operator in LIST_OPERATORS:
+                        value = tuple(coercer(value_) for value_ in value.split(','))
+                    else:
+                        value = coercer(value)
+                except (ValueError, ArithmeticError) as e:
+                    raise create_query_error((key,), str(e) or 'Invalid value')
+
+                operators = filter_options.setdefault(name, {})
+
+                # Equal and IN values for the same field match any of them, whatever their order
+                if operator in ('=', 'IN') and ('=' in operators or 'IN' in operators):
+                    previous = (operators.pop('='),) if '=' in operators else ()
+
+                    if operator == '=':
+                        value = (value,)
+
+                    operator = 'IN'
+                    value = operators.get('IN', ()) + previous + value
+
+                elif operator == 'NOT IN' and operator in operators:
+                    value = operators[operator] + value
+
+                elif operator in operators:
+                    previous = operators[operator]
+
+                    if not isinstance(previous, list):
+                        previous = [previous]
+
+                    previous.append(value)
+                    value = previous
+
+                operators[operator] = value
+
+            elif key == limit_label:
+                limit = parse_int(key, value)
+
+                if max_limit is not None and limit > max_limit:
+                    raise create_query_error(
+                        (key,),
+                        f'Input should be less than or equal to {max_limit}'
+                    )
+
+            elif key == skip_label:
+                skip = parse_int(key, value)
+
+            elif key == count_label:
+                result.count = enable_count and value.lower() not in ('false', '0', 'no')
+
+            elif key == sort_label and sortable:
+                for name in value.split(','):
+                    direction = 'ASC'
+
+                    if name.startswith('-'):
+                        name = name[1:]
+                        direction = 'DESC'
+
+                    if name not in sortable:
+                        raise create_query_error((key,), f'Cannot sort by {name!r}')
+
+                    result.sort_options[name] = direction
+
+        if enable_pagination:
+            if limit is not None:
+                result.pagination_options['limit'] = limit
+
+            if skip is not None:
+                result.pagination_options['skip'] = skip
+
+        return result
+
+    return parse
+
+
+def parse_query_params(
+        dataclass_type: type[_T],
+        query_params: Iterable[tuple[str, str]]
+) -> QueryOptions:
+    parser = create_query_params_parser(
+        dataclass_type
+    )
+
+    return parser(query_params)
+
+
+def get_query_options(dataclass_type: type[_T]):
+    def dependency(request: Request) -> QueryOptions:
+        return parse_query_params(
+            dataclass_type,
+            request.query_params.multi_items()
+        )
+
+    return dependency
+
+
+def get_filter_options(dataclass_type: type[_T]):
+    def dependency(request: Request) -> dict:
+        return parse_query_params(
+            dataclass_type,
+            request.query_params.multi_items()
+        ).filter_options
+
+    return dependency
+
+
+def get_sort_options(dataclass_type: type[_T]):
+    def dependency(request: Request) -> dict:
+        return parse_query_params(
+            dataclass_type,
+            request.query_params.multi_items()
+        ).sort_options
+
+    return dependency
+
+
+def get_pagination_options(dataclass_type: type[_T]):
+    def dependency(request: Request) -> dict:
+        return parse_query_params(
+            dataclass_type,
+            request.query_params.multi_items()
+        ).pagination_options
+
+    return dependency
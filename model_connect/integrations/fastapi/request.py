@@ -0,0 +1,212 @@
+from functools import cache
+from typing import Any, Callable, TypeVar
+
+from fastapi import HTTPException, Request
+from starlette.concurrency import run_in_threadpool
+
+from model_connect.constants import UNDEFINED
+from model_connect.integrations.json.decoder import loads, DecodeError
+from model_connect.registry import get_schema
+from model_connect.schema import ModelSchema
+
+_T = TypeVar('_T')
+
+
+class RequestDtoValidationError(Exception):
+    def __init__(self, errors: list[dict]):
+        super().__init__(errors)
+        self.errors = errors
+
+
+def create_validation_error(loc: tuple, msg: str, type_: str) -> dict:
+    return {
+        'loc': list(loc),
+        'msg': msg,
+        'type': type_
+    }
+
+
+def create_request_parser(
+        dataclass_type: type[_T],
+        method: str = 'post'
+) -> Callable[[dict, tuple], _T]:
+    return compile_request_parser(
+        get_schema(dataclass_type),
+        method.lower()
+    )
+
+
+@cache
+def compile_request_parser(
+        schema: ModelSchema,
+        method: str
+) -> Callable[[dict, tuple], _T]:
+    dataclass_type = schema.dataclass_type
+
+    plan = []
+
+    for model_field in schema.model_fields.values():
+        if not model_field.dataclass_field.init:
+            continue
+
+        dto = model_field.request_dtos[method]
+
+        if not dto.include:
+            if model_field.is_required_on_init:
+                plan.append((model_field.name, False, None, True, False))
+            continue
+
+        plan.append((
+            model_field.name,
+            True,
+            dto.preprocessor,
+            model_field.is_required_on_init,
+            dto.require
+        ))
+
+    plan = tuple(plan)
+
+    def parse(data: dict, loc: tuple = ('body',)) -> _T:
+        if not isinstance(data, dict):
+            raise RequestDtoValidationError([
+                create_validation_error(loc, 'Input should be an object', 'dict_type')
+            ])
+
+        kwargs = {}
+        errors = []
+
+        for name, include, preprocessor, is_required_on_init, require in plan:
+            if not include or name not in data:
+                if require:
+                    errors.append(
+                        create_validation_error((*loc, name), 'Field required', 'missing')
+                    )
+                elif is_required_on_init:
+                    kwargs[name] = UNDEFINED
+                continue
+
+            value = data[name]
+
+            if preprocessor:
+                try:
+                    value = preprocessor(value)
+                except (TypeError, ValueError) as e:
+                    errors.append(
+                        create_validation_error((*loc, name), str(e), 'value_error')
+                    )
+                    continue
+
+            kwargs[name] = value
+
+        if errors:
+            raise RequestDtoValidationError(errors)
+
+        return dataclass_type(**kwargs)
+
+    return parse
+
+
+def parse_request_dto(
+        dataclass_type: type[_T],
+        data: dict,
+        method: str = 'post'
+) -> _T:
+    parser = create_request_parser(
+        dataclass_type,
+        method
+    )
+
+    return parser(data)
+
+
+def parse_request_dtos(
+        dataclass_type: type[_T],
+        data: list[dict],
+        method: str = 'post'
+) -> list[_T]:
+    if not isinstance(data, list):
+        raise RequestDtoValidationError([
+            create_validation_error(('body',), 'Input should be a list', 'list_type')
+        ])
+
+    parser = create_request_parser(
+        dataclass_type,
+        method
+    )
+
+    result = []
+    errors = []
+
+    for index, item in enumerate(data):
+        try:
+            result.append(parser(item, ('body', index)))
+        except RequestDtoValidationError as e:
+            errors.extend(e.errors)
+
+    if errors:
+        raise RequestDtoValidationError(errors)
+
+    return result
+
+
+async def read_request_body(request: Request) -> Any:
+    body = await request.body()
+
+    try:
+        return loads(body)
+    except DecodeError as e:
+        raise HTTPException(
+            status_code=400,
+            detail=f'Invalid JSON body: {e}'
+        )
+
+
+def get_from_request_dto(dataclass_type: type[_T], method: str):
+    async def dependency(request: Request) -> _T:
+        data = await read_request_body(request)
+
+        try:
+            return parse_request_dto(dataclass_type, data, method)
+        except RequestDtoValidationError as e:
+            raise HTTPException(
+                status_code=422,
+                detail=e.errors
+            )
+
+    return dependency
+
+
+def get_from_request_dtos(dataclass_type: type[_T], method: str):
+    async def dependency(request: Request) -> list[_T]:
+        data = await read_request_body(request)
+
+        try:
+            return await run_in_threadpool(
+                parse_request_dtos,
+                dataclass_type,
+                data,
+                method
+            )
+        except RequestDtoValidationError as e:
+            raise HTTPException(
+                status_code=422,
+                detail=e.errors
+            )
+
+    return dependency
+
+
+def get_from_post_request_dto(dataclass_type: type[_T]):
+    return get_from_request_dto(dataclass_type, 'post')
+
+
+def get_from_post_request_dtos(dataclass_type: type[_T]):
+    return get_from_request_dtos(dataclass_type, 'post')
+
+
+def get_from_put_request_dto(dataclass_type: type[_T]):
+    return get_from_request_dto(dataclass_type, 'put')
+
+
+def get_from_patch_request_dto(dataclass_type: type[_T]):
+    return get_from_request_dto(dataclass_type, 'patch')
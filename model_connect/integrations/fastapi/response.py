@@ -0,0 +1,166 @@
+from dataclasses import is_dataclass
+from functools import cache
+from operator import attrgetter
+from typing import Any, Callable, Generator, Iterable, TypeVar
+
+from fastapi import HTTPException, Response
+
+from model_connect.integrations.json.encoder import dumps
+from model_connect.registry import get_schema
+from model_connect.schema import ModelSchema
+
+_T = TypeVar('_T')
+
+
+def create_response_serializer(
+        dataclass_type: type[_T],
+        method: str = 'get'
+) -> Callable[[_T], dict[str, Any]]:
+    return compile_response_serializer(
+        get_schema(dataclass_type),
+        method.lower()
+    )
+
+
+@cache
+def compile_response_serializer(
+        schema: ModelSchema,
+        method: str
+) -> Callable[[_T], dict[str, Any]]:
+    names = []
+    preprocessors = []
+
+    for model_field in schema.model_fields.values():
+        dto = model_field.response_dtos[method]
+
+        if not dto.include:
+            continue
+
+        names.append(model_field.name)
+
+        if dto.preprocessor:
+            preprocessors.append(
+                (model_field.name, dto.preprocessor)
+            )
+
+    names = tuple(names)
+    preprocessors = tuple(preprocessors)
+
+    if not names:
+        return lambda item: {}
+
+    if len(names) == 1:
+        getter = attrgetter(names[0])
+        values_getter = lambda item: (getter(item),)
+    else:
+        values_getter = attrgetter(*names)
+
+    def serialize(item: _T) -> dict[str, Any]:
+        result = dict(zip(names, values_getter(item)))
+
+        for name, preprocessor in preprocessors:
+            result[name] = preprocessor(result[name])
+
+        return result
+
+    return serialize
+
+
+def serialize_response_dto(
+        data: _T,
+        method: str = 'get'
+) -> bytes:
+    serializer = create_response_serializer(
+        type(data),
+        method
+    )
+
+    return dumps(serializer(data))
+
+
+def serialize_response_dtos(
+        data: Iterable[_T],
+        method: str = 'get'
+) -> bytes:
+    iterator = iter(data)
+
+    first = next(iterator, None)
+
+    if first is None:
+        return b'[]'
+
+    serializer = create_response_serializer(
+        type(first),
+        method
+    )
+
+    result = [serializer(first)]
+    result.extend(map(serializer, iterator))
+
+    return dumps(result)
+
+
+def stream_response_dtos(
+        data: Iterable[_T],
+        method: str = 'get',
+        chunk_size: int = 1000
+) -> Generator[bytes, None, None]:
+    iterator = iter(data)
+
+    first = next(iterator, None)
+
+    if first is None:
+        yield b'[]'
+        return
+
+    serializer = create_response_serializer(
+        type(first),
+        method
+    )
+
+    chunk = [b'[', dumps(serializer(first))]
+
+    for item in iterator:
+        chunk.append(b',')
+        chunk.append(dumps(serializer(item)))
+
+        if len(chunk) >= chunk_size * 2:
+            yield b''.join(chunk)
+            chunk = []
+
+    chunk.append(b']')
+
+    yield b''.join(chunk)
+
+
+def create_response_dto(
+        data: _T | Iterable[_T],
+        method: str = 'get',
+        status_code: int = 200
+) -> Response:
+    if not is_dataclass(data):
+        data = next(iter(data), None)
+
+    if data is None:
+        raise HTTPException(
+            status_code=404,
+            detail='Resource not found'
+        )
+
+    return Response(
+        content=serialize_response_dto(data, method),
+        status_code=status_code,
+        media_type='application/json'
+    )
+
+
+def create_response_dtos(
+        data: Iterable[_T],
+        method: str = 'get',
+        status_code: int = 200
+) -> Response:
+    return Response(
+        content=serialize_response_dtos(data, method),
+        status_code=status_code,
+        media_type='application/json'
+    )
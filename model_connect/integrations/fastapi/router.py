@@ -1,6 +1,26 @@
-from fastapi import APIRouter, FastAPI
+from fastapi import APIRouter, Depends, FastAPI, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from psycopg2.extras import DictCursor
+from psycopg2.pool import AbstractConnectionPool
+from starlette.concurrency import run_in_threadpool
 
-from model_connect.registry import get_model
+from model_connect.constants import is_undefined
+from model_connect.integrations.fastapi.ingest import insert_request
+from model_connect.integrations.fastapi.query_params import QueryOptions, get_query_options
+from model_connect.integrations.fastapi.request import (
+    create_validation_error,
+    get_from_post_request_dto,
+    get_from_put_request_dto,
+    get_from_patch_request_dto
+)
+from model_connect.integrations.fastapi.response import create_response_dto, stream_response_dtos
+from model_connect.integrations.psycopg2.common.processing import IdentifierFilterOptions
+from model_connect.integrations.psycopg2.delete import stream_delete
+from model_connect.integrations.psycopg2.insert import stream_insert
+from model_connect.integrations.psycopg2.pool import pooled_cursor
+from model_connect.integrations.psycopg2.select import stream_select, select_count
+from model_connect.integrations.psycopg2.update import stream_partial_update
+from model_connect.registry import get_model, get_schema
 from model_connect.globals import registry as global_options
 
 
@@ -48,3 +68,185 @@ def attach_router(
         prefix=resource_path,
         tags=[model.tag_name]
     )
+
+
+def get_missing_put_fields(dataclass_type: type, data) -> list[dict]:
+    return [
+        create_validation_error(('body', field.model_field.name), 'Field required', 'missing') for
+        field in
+        get_schema(dataclass_type, 'psycopg2').update_fields if
+        field.model_field.request_dtos['put'].include and
+        is_undefined(getattr(data, field.model_field.name))
+    ]
+
+
+def create_router(
+        dataclass_type: type,
+        pool: AbstractConnectionPool,
+        chunk_size: int = 1000
+) -> APIRouter:
+    router = APIRouter()
+
+    schema = get_schema(dataclass_type)
+
+    @router.get('')
+    def get_many(query_options: QueryOptions = Depends(get_query_options(dataclass_type))):
+
+        headers = {}
+
+        connection = pool.getconn()
+
+        try:
+            cursor = connection.cursor(cursor_factory=DictCursor)
+
+            if query_options.count:
+                headers['X-Total-Count'] = str(
+                    select_count(
+                        cursor,
+                        dataclass_type,
+                        query_options.filter_options
+                    )
+                )
+
+            results = stream_select(
+                cursor,
+                dataclass_type,
+                chunk_size=chunk_size,
+                filter_options=query_options.filter_options,
+                sort_options=query_options.sort_options,
+                pagination_options=query_options.pagination_options
+            )
+
+            content = stream_response_dtos(
+                results,
+                'get',
+                chunk_size
+            )
+
+            # Prime the generator so that query errors surface before the response starts
+            first = next(content)
+        except BaseException:
+            connection.rollback()
+            pool.putconn(connection)
+            raise
+
+        def stream():
+            try:
+                yield first
+                yield from content
+            finally:
+                cursor.close()
+                connection.rollback()
+                pool.putconn(connection)
+
+        return StreamingResponse(
+            stream(),
+            media_type='application/json',
+            headers=headers
+        )
+
+    @router.post('', status_code=201)
+    def post_one(data=Depends(get_from_post_request_dto(dataclass_type))):
+        with pooled_cursor(pool) as cursor:
+            result = list(stream_insert(cursor, dataclass_type, [data]))
+
+        return create_response_dto(result, 'post', 201)
+
+    @router.post('/bulk', status_code=201)
+    async def post_many(request: Request):
+        # A slow or exhausted pool must not block the event loop
+        connection = await run_in_threadpool(pool.getconn)
+
+        try:
+            cursor = connection.cursor(cursor_factory=DictCursor)
+
+            summary = await insert_request(
+                request,
+                cursor,
+                dataclass_type,
+                chunk_size
+            )
+
+            if summary.errors:
+                await run_in_threadpool(connection.rollback)
+
+                raise HTTPException(
+                    status_code=422,
+                    detail=summary.errors
+                )
+
+            await run_in_threadpool(connection.commit)
+        except BaseException:
+            await run_in_threadpool(connection.rollback)
+            raise
+        finally:
+            await run_in_threadpool(pool.putconn, connection)
+
+        return {
+            'received': summary.received,
+            'inserted': summary.inserted
+        }
+
+    if not schema.identifier_names:
+        return router
+
+    identifier_name = schema.identifier_names[0]
+    identifier_type = schema.model_fields[identifier_name].inferred_type
+
+    @router.get('/{resource_id}')
+    def get_one(resource_id: identifier_type):
+        with pooled_cursor(pool) as cursor:
+            results = list(stream_select(
+                cursor,
+                dataclass_type,
+                filter_options=IdentifierFilterOptions({identifier_name: resource_id}),
+                pagination_options={'limit': 1}
+            ))
+
+        return create_response_dto(results, 'get')
+
+    @router.put('/{resource_id}')
+    def put_one(
+            resource_id: identifier_type,
+            data=Depends(get_from_put_request_dto(dataclass_type))
+    ):
+        setattr(data, identifier_name, resource_id)
+
+        errors = get_missing_put_fields(dataclass_type, data)
+
+        if errors:
+            raise HTTPException(
+                status_code=422,
+                detail=errors
+            )
+
+        # Fields excluded from the PUT DTO are left as they are
+        with pooled_cursor(pool) as cursor:
+            results = list(stream_partial_update(cursor, dataclass_type, data))
+
+        return create_response_dto(results, 'put')
+
+    @router.patch('/{resource_id}')
+    def patch_one(
+            resource_id: identifier_type,
+            data=Depends(get_from_patch_request_dto(dataclass_type))
+    ):
+        setattr(data, identifier_name, resource_id)
+
+        with pooled_cursor(pool) as cursor:
+            results = list(stream_partial_update(cursor, dataclass_type, data))
+
+        return create_response_dto(results, 'patch')
+
+    @router.delete('/{resource_id}')
+    def delete_one(resource_id: identifier_type):
+        with pooled_cursor(pool) as cursor:
+            results = list(stream_delete(
+                cursor,
+                dataclass_type,
+                filter_options=IdentifierFilterOptions({identifier_name: resource_id})
+            ))
+
+        return create_response_dto(results, 'delete')
+
+    return router
@@ -0,0 +1,17 @@
+from model_connect.constants import iter_http_methods
+from model_connect.integrations.fastapi.query_params import compile_query_params_parser
+from model_connect.integrations.fastapi.request import compile_request_parser
+from model_connect.integrations.fastapi.response import compile_response_serializer
+from model_connect.schema import ModelSchema
+
+
+def warmup_schema(schema: ModelSchema):
+    for method in iter_http_methods():
+        method = method.lower()
+
+        compile_response_serializer(schema, method)
+
+        if method in ('post', 'put', 'patch'):
+            compile_request_parser(schema, method)
+
+    compile_query_params_parser(schema)
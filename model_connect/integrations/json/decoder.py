@@ -0,0 +1,20 @@
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+if orjson is not None:
+    DecodeError = orjson.JSONDecodeError
+else:
+    DecodeError = json.JSONDecodeError
+
+
+def loads(value: bytes | str) -> Any:
+    if orjson is not None:
+        return orjson.loads(value)
+
+    return json.loads(value)
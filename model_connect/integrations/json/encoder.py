@@ -0,0 +1,47 @@
+import json
+from dataclasses import asdict, is_dataclass
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from typing import Any
+from uuid import UUID
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def default(value: Any) -> Any:
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+
+    if isinstance(value, (Decimal, UUID)):
+        return str(value)
+
+    if isinstance(value, Enum):
+        return value.value
+
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+
+    if is_dataclass(value):
+        return asdict(value)
+
+    raise TypeError(
+        f'Object of type {type(value).__name__} is not JSON serializable'
+    )
+
+
+def dumps(value: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(
+            value,
+            default=default
+        )
+
+    return json.dumps(
+        value,
+        default=default,
+        separators=(',', ':')
+    ).encode()
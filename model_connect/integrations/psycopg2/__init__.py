@@ -1,11 +1,109 @@
+from importlib import import_module
+from typing import TYPE_CHECKING
+
 from model_connect.integrations.psycopg2.options.model import Psycopg2Model
 from model_connect.integrations.psycopg2.options.model_field import Psycopg2ModelField
-from model_connect.integrations.psycopg2.select import (
-    create_select_query,
-    stream_select,
-    select_count
-)
-from model_connect.integrations.psycopg2.insert import (
-    create_insert_query,
-    stream_insert
-)
+
+if TYPE_CHECKING:
+    from model_connect.integrations.psycopg2.select import (
+        create_select_query,
+        stream_select,
+        select_count
+    )
+    from model_connect.integrations.psycopg2.insert import (
+        create_insert_query,
+        stream_insert,
+        insert_count
+    )
+    from model_connect.integrations.psycopg2.update import (
+        create_update_query,
+        stream_update,
+        stream_partial_update
+    )
+    from model_connect.integrations.psycopg2.delete import (
+        create_delete_query,
+        stream_delete
+    )
+    from model_connect.integrations.psycopg2.pool import (
+        pooled_connection,
+        pooled_cursor
+    )
+    from model_connect.integrations.psycopg2.slow_query_log import (
+        SlowQueryLog,
+        SlowQuery
+    )
+    from model_connect.integrations.psycopg2.stats import (
+        QueryStatsCollector,
+        QueryStats
+    )
+    from model_connect.integrations.psycopg2.index_advisor import (
+        advise,
+        check_filterable_indexes
+    )
+    from model_connect.integrations.psycopg2.columnar import (
+        stream_select_columns,
+        select_columns
+    )
+    from model_connect.integrations.psycopg2.export import (
+        copy_to,
+        stream_export,
+        export_parquet
+    )
+    from model_connect.integrations.psycopg2.bulk_import import (
+        import_records,
+        import_csv,
+        import_ndjson
+    )
+    from model_connect.integrations.psycopg2.session import Session
+    from model_connect.integrations.psycopg2.write_behind import (
+        WriteBehindInserter,
+        WriteBehindMetrics
+    )
+
+# Submodules below import psycopg2.extras and jinja2, so they are only loaded on first use
+_lazy_imports = {
+    'create_select_query': 'model_connect.integrations.psycopg2.select',
+    'stream_select': 'model_connect.integrations.psycopg2.select',
+    'select_count': 'model_connect.integrations.psycopg2.select',
+    'create_insert_query': 'model_connect.integrations.psycopg2.insert',
+    'stream_insert': 'model_connect.integrations.psycopg2.insert',
+    'insert_count': 'model_connect.integrations.psycopg2.insert',
+    'create_update_query': 'model_connect.integrations.psycopg2.update',
+    'stream_update': 'model_connect.integrations.psycopg2.update',
+    'stream_partial_update': 'model_connect.integrations.psycopg2.update',
+    'create_delete_query': 'model_connect.integrations.psycopg2.delete',
+    'stream_delete': 'model_connect.integrations.psycopg2.delete',
+    'pooled_connection': 'model_connect.integrations.psycopg2.pool',
+    'pooled_cursor': 'model_connect.integrations.psycopg2.pool',
+    'SlowQueryLog': 'model_connect.integrations.psycopg2.slow_query_log',
+    'SlowQuery': 'model_connect.integrations.psycopg2.slow_query_log',
+    'QueryStatsCollector': 'model_connect.integrations.psycopg2.stats',
+    'QueryStats': 'model_connect.integrations.psycopg2.stats',
+    'advise': 'model_connect.integrations.psycopg2.index_advisor',
+    'check_filterable_indexes': 'model_connect.integrations.psycopg2.index_advisor',
+    'stream_select_columns': 'model_connect.integrations.psycopg2.columnar',
+    'select_columns': 'model_connect.integrations.psycopg2.columnar',
+    'copy_to': 'model_connect.integrations.psycopg2.export',
+    'stream_export': 'model_connect.integrations.psycopg2.export',
+    'export_parquet': 'model_connect.integrations.psycopg2.export',
+    'import_records': 'model_connect.integrations.psycopg2.bulk_import',
+    'import_csv': 'model_connect.integrations.psycopg2.bulk_import',
+    'import_ndjson': 'model_connect.integrations.psycopg2.bulk_import',
+    'Session': 'model_connect.integrations.psycopg2.session',
+    'WriteBehindInserter': 'model_connect.integrations.psycopg2.write_behind',
+    'WriteBehindMetrics': 'model_connect.integrations.psycopg2.write_behind',
+}
+
+
+def __getattr__(name: str):
+    if name not in _lazy_imports:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    value = getattr(import_module(_lazy_imports[name]), name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+    return sorted([*globals(), *_lazy_imports])
@@ -0,0 +1,522 @@
+import csv
+import io
+from contextlib import suppress
+from dataclasses import dataclass, field
+from datetime import date, datetime, time
+from functools import cache, lru_cache
+from itertools import islice
+from time import perf_counter
+from typing import Any, Callable, IO, Iterable, Iterator, Optional, TypeVar
+
+from jinja2 import Template
+from psycopg2 import DatabaseError
+from psycopg2.extras import DictCursor, Json
+
+from model_connect.integrations.json.decoder import loads
+from model_connect.integrations.json.encoder import dumps
+from model_connect.integrations.psycopg2.common.processing import (
+    ProcessedOnConflictOptions,
+    process_on_conflict_options
+)
+from model_connect.integrations.psycopg2.schema import Psycopg2ModelSchema
+from model_connect.registry import get_schema
+
+_T = TypeVar('_T')
+
+COPY_TEXT_ESCAPES = str.maketrans({
+    '\\': '\\\\',
+    '\t': '\\t',
+    '\n': '\\n',
+    '\r': '\\r'
+})
+
+MERGE_TEMPLATE = '''
+        INSERT INTO
+            {{ tablename }}
+            (
+                {%- for column in columns %}
+                {{ column }}
+                {%- if not loop.last %}
+                    ,
+                {%- endif %}
+                {%- endfor %}
+            )
+        SELECT
+            {%- for column in columns %}
+            {{ column }}
+            {%- if not loop.last %}
+            ,
+            {%- endif %}
+            {%- endfor %}
+        FROM
+            {{ staging_tablename }}
+
+        {%- if on_conflict_options %}
+            ON CONFLICT (
+                {%- for column in on_conflict_options.conflict_targets %}
+                {{ column }}
+                {%- if not loop.last %}
+                ,
+                {%- endif %}
+                {%- endfor %}
+            )
+
+            {%- if on_conflict_options.do_nothing or not on_conflict_options.update_columns %}
+            DO NOTHING
+
+            {%- else %}
+            DO UPDATE SET
+                {%- for column in on_conflict_options.update_columns %}
+                {{ column }} = EXCLUDED.{{ column }}
+                {%- if not loop.last %}
+                ,
+                {%- endif %}
+                {%- endfor %}
+            {%- endif %}
+        {%- endif %}
+    '''
+
+
+@dataclass(slots=True)
+class StageStats:
+    rows: int = 0
+    duration: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        return self.rows / self.duration if self.duration else 0.0
+
+
+@dataclass(slots=True)
+class ImportStats:
+    batches: int = 0
+    merged: int = 0
+    collapsed: int = 0
+    ignored_keys: set[str] = field(
+        default_factory=set
+    )
+    read: StageStats = field(
+        default_factory=StageStats
+    )
+    encode: StageStats = field(
+        default_factory=StageStats
+    )
+    copy: StageStats = field(
+        default_factory=StageStats
+    )
+    merge: StageStats = field(
+        default_factory=StageStats
+    )
+
+    @property
+    def rows(self) -> int:
+        return self.read.rows
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            'batches': self.batches,
+            'rows': self.rows,
+            'merged': self.merged,
+            'collapsed': self.collapsed,
+            'ignored_keys': sorted(self.ignored_keys),
+            **{
+                stage: {
+                    'rows': stats.rows,
+                    'duration': stats.duration,
+                    'throughput': stats.throughput
+                } for
+                stage, stats in
+                (('read', self.read), ('encode', self.encode), ('copy', self.copy), ('merge', self.merge))
+            }
+        }
+
+    def report(self) -> str:
+        lines = [f'{"stage":<8} {"rows":>10} {"seconds":>10} {"rows/s":>12}']
+
+        for stage, stats in (('read', self.read), ('encode', self.encode), ('copy', self.copy), ('merge', self.merge)):
+            lines.append(f'{stage:<8} {stats.rows:>10} {stats.duration:>10.3f} {stats.throughput:>12.0f}')
+
+        return '\n'.join(lines)
+
+
+def format_copy_value(value: Any) -> str:
+    if value is None:
+        return '\\N'
+
+    if value is True:
+        return 't'
+
+    if value is False:
+        return 'f'
+
+    if isinstance(value, Json):
+        value = value.dumps(value.adapted)
+    elif isinstance(value, (dict, list)):
+        value = dumps(value).decode()
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        value = '\\x' + bytes(value).hex()
+    elif isinstance(value, (datetime, date, time)):
+        value = value.isoformat()
+    else:
+        value = str(value)
+
+    return value.translate(COPY_TEXT_ESCAPES)
+
+
+def read_csv(file: IO[str], delimiter: str = ',', null: Optional[str] = '') -> Iterator[dict]:
+    for record in csv.DictReader(file, delimiter=delimiter):
+        if null is not None:
+            record = {key: None if value == null else value for key, value in record.items()}
+
+        yield record
+
+
+def read_ndjson(file: IO) -> Iterator[dict]:
+    for line in file:
+        if line.strip():
+            yield loads(line)
+
+
+@cache
+def get_merge_template() -> Template:
+    return Template(MERGE_TEMPLATE)
+
+
+@lru_cache(maxsize=256)
+def render_merge_sql(
+        tablename: str,
+        staging_tablename: str,
+        columns: tuple[str, ...],
+        on_conflict: tuple[str, tuple[str, ...], tuple[str, ...]] = None
+) -> str:
+    on_conflict_options = None
+
+    if on_conflict is not None:
+        do, conflict_targets, update_columns = on_conflict
+
+        on_conflict_options = {
+            'do_nothing': do == 'NOTHING',
+            'conflict_targets': conflict_targets,
+            'update_columns': update_columns
+        }
+
+    sql = get_merge_template().render(
+        tablename=tablename,
+        staging_tablename=staging_tablename,
+        columns=columns,
+        on_conflict_options=on_conflict_options
+    )
+
+    return ' '.join(sql.split())
+
+
+@cache
+def compile_record_encoder(
+        schema: Psycopg2ModelSchema,
+        keys: tuple[str, ...],
+        column_map: tuple[tuple[str, str], ...]
+) -> tuple[tuple[str, ...], tuple[str, ...], Callable[[dict], str]]:
+    column_map = dict(column_map)
+
+    fields = []
+    ignored = []
+
+    for key in keys:
+        column = column_map.get(key, key)
+
+        if column in schema.column_indexes:
+            db_field = schema.fields[schema.column_indexes[column]]
+        elif column in schema.fields_by_name:
+            db_field = schema.fields_by_name[column]
+        else:
+            ignored.append(key)
+            continue
+
+        if not db_field.model_field.is_db_column:
+            ignored.append(key)
+            continue
+
+        fields.append((key, db_field.encoder, db_field))
+
+    fields = tuple(fields)
+
+    def encode(record: dict) -> str:
+        values = []
+
+        for key, encoder, db_field in fields:
+            value = record.get(key)
+
+            if encoder and value is not None:
+                value = encoder(db_field, value)
+
+            values.append(format_copy_value(value))
+
+        return '\t'.join(values) + '\n'
+
+    return tuple(db_field.column_name for _, _, db_field in fields), tuple(ignored), encode
+
+
+def create_merge_sql(
+        schema: Psycopg2ModelSchema,
+        staging_tablename: str,
+        columns: tuple[str, ...],
+        on_conflict_options: ProcessedOnConflictOptions = None
+) -> str:
+    on_conflict = None
+
+    if on_conflict_options is not None:
+        assert set(on_conflict_options.conflict_targets) <= set(columns), (
+            'The conflict targets must be imported columns'
+        )
+
+        # Columns that are not imported would be overwritten with NULL
+        on_conflict = (
+            on_conflict_options.do,
+            tuple(on_conflict_options.conflict_targets),
+            tuple(
+                column for
+                column in
+                on_conflict_options.update_columns if
+                column in columns
+            )
+        )
+
+    return render_merge_sql(
+        schema.tablename,
+        staging_tablename,
+        columns,
+        on_conflict
+    )
+
+
+def collapse_conflicting_lines(
+        records: list[dict],
+        lines: list[str],
+        indexes: tuple[int, ...],
+        merge: Callable[[dict, dict], dict] = None,
+        encode: Callable[[dict], str] = None
+) -> tuple[list[str], int]:
+    """
+    Same as collapse_conflicting_tuples, keyed on the encoded values of the conflict targets.
+    """
+    positions = {}
+    kept_records = []
+    kept_lines = []
+
+    for record, line in zip(records, lines):
+        values = line[:-1].split('\t')
+        key = tuple(values[index] for index in indexes)
+
+        if '\\N' in key:
+            kept_records.append(record)
+            kept_lines.append(line)
+            continue
+
+        position = positions.get(key)
+
+        if position is None:
+            positions[key] = len(kept_lines)
+            kept_records.append(record)
+            kept_lines.append(line)
+            continue
+
+        if merge is not None:
+            record = merge(kept_records[position], record)
+            line = encode(record)
+
+        kept_records[position] = record
+        kept_lines[position] = line
+
+    return kept_lines, len(lines) - len(kept_lines)
+
+
+def import_records(
+        cursor: DictCursor,
+        dataclass_type: type[_T],
+        records: Iterable[dict],
+        column_map: dict[str, str] = None,
+        on_conflict_options: dict = None,
+        batch_size: int = 10000,
+        staging_tablename: str = None
+) -> ImportStats:
+    """
+    Loads records (dicts keyed by field or column name, or renamed through column_map) into the
+    dataclass' table: each batch is encoded to COPY text, copied into a temporary staging table
+    and merged with INSERT ... SELECT, applying the processed on conflict options. Only one batch
+    is held in memory at a time. Records are merged per set of keys, so that a key missing from a
+    record is never written as NULL over an existing value; the staging table has every column
+    and is created once.
+    """
+    schema = get_schema(dataclass_type, 'psycopg2')
+    stats = ImportStats()
+
+    if staging_tablename is None:
+        staging_tablename = f'{schema.tablename}_import_staging'
+
+    if on_conflict_options is not None:
+        on_conflict_options = process_on_conflict_options(
+            dataclass_type,
+            on_conflict_options
+        )
+
+    staging_columns = tuple(
+        db_field.column_name for
+        db_field in
+        schema.fields if
+        db_field.model_field.is_db_column
+    )
+
+    records = iter(records)
+    column_map = tuple((column_map or {}).items())
+    plans = {}
+    has_staging_table = False
+
+    def plan(keys: frozenset, record: dict) -> tuple:
+        columns, ignored, encode = compile_record_encoder(schema, tuple(record), column_map)
+        stats.ignored_keys.update(ignored)
+
+        assert columns, 'No record keys match a column'
+
+        sql = create_merge_sql(schema, staging_tablename, columns, on_conflict_options)
+        indexes = None
+
+        if on_conflict_options is not None and on_conflict_options.do_update:
+            indexes = tuple(columns.index(target) for target in on_conflict_options.conflict_targets)
+
+        plans[keys] = (columns, encode, sql, indexes)
+
+        return plans[keys]
+
+    def merge(buckets: dict[frozenset, tuple[list[dict], list[str]]]):
+        nonlocal has_staging_table
+
+        if not has_staging_table:
+            cursor.execute(f'DROP TABLE IF EXISTS {staging_tablename}')
+            cursor.execute(
+                f'CREATE TEMP TABLE {staging_tablename} AS '
+                f'SELECT {", ".join(staging_columns)} FROM {schema.tablename} WITH NO DATA'
+            )
+            has_staging_table = True
+
+        for keys, (bucket, lines) in buckets.items():
+            columns, encode, sql, indexes = plans[keys]
+
+            if indexes is not None:
+                started = perf_counter()
+                lines, collapsed = collapse_conflicting_lines(
+                    bucket,
+                    lines,
+                    indexes,
+                    on_conflict_options.merge,
+                    encode
+                )
+                stats.collapsed += collapsed
+                stats.encode.duration += perf_counter() - started
+
+            started = perf_counter()
+            cursor.copy_expert(
+                f'COPY {staging_tablename} ({", ".join(columns)}) FROM STDIN WITH (FORMAT text)',
+                io.StringIO(''.join(lines))
+            )
+            stats.copy.rows += len(lines)
+            stats.copy.duration += perf_counter() - started
+
+            started = perf_counter()
+            cursor.execute(sql)
+            stats.merged += max(cursor.rowcount, 0)
+            cursor.execute(f'TRUNCATE {staging_tablename}')
+            stats.merge.rows += len(lines)
+            stats.merge.duration += perf_counter() - started
+
+    try:
+        while True:
+            started = perf_counter()
+            batch = list(islice(records, batch_size))
+            stats.read.duration += perf_counter() - started
+
+            if not batch:
+                break
+
+            stats.read.rows += len(batch)
+
+            started = perf_counter()
+            buckets = {}
+            owners = {}
+
+            for record in batch:
+                keys = frozenset(record)
+                columns, encode, sql, indexes = plans.get(keys) or plan(keys, record)
+                line = encode(record)
+
+                if indexes is not None:
+                    values = line[:-1].split('\t')
+                    key = tuple(values[index] for index in indexes)
+
+                    # Buckets are merged one after the other, so a conflict target already written
+                    # by another bucket has to be merged before this record to keep the last write
+                    if '\\N' not in key and owners.setdefault(key, keys) != keys:
+                        stats.encode.duration += perf_counter() - started
+                        merge(buckets)
+                        started = perf_counter()
+                        buckets = {}
+                        owners = {key: keys}
+
+                bucket, lines = buckets.setdefault(keys, ([], []))
+                bucket.append(record)
+                lines.append(line)
+
+            stats.encode.rows += len(batch)
+            stats.encode.duration += perf_counter() - started
+
+            merge(buckets)
+            stats.batches += 1
+    except BaseException:
+        if has_staging_table:
+            # An aborted transaction rejects the DROP, but its rollback discards the table anyway
+            with suppress(DatabaseError):
+                cursor.execute(f'DROP TABLE IF EXISTS {staging_tablename}')
+
+        raise
+
+    if has_staging_table:
+        cursor.execute(f'DROP TABLE IF EXISTS {staging_tablename}')
+
+    return stats
+
+
+def import_csv(
+        cursor: DictCursor,
+        dataclass_type: type[_T],
+        file: IO[str],
+        column_map: dict[str, str] = None,
+        on_conflict_options: dict = None,
+        batch_size: int = 10000,
+        delimiter: str = ',',
+        null: Optional[str] = ''
+) -> ImportStats:
+    return import_records(
+        cursor,
+        dataclass_type,
+        read_csv(file, delimiter, null),
+        column_map,
+        on_conflict_options,
+        batch_size
+    )
+
+
+def import_ndjson(
+        cursor: DictCursor,
+        dataclass_type: type[_T],
+        file: IO,
+        column_map: dict[str, str] = None,
+        on_conflict_options: dict = None,
+        batch_size: int = 10000
+) -> ImportStats:
+    return import_records(
+        cursor,
+        dataclass_type,
+        read_ndjson(file),
+        column_map,
+        on_conflict_options,
+        batch_size
+    )
@@ -0,0 +1,251 @@
+from datetime import date, datetime
+from decimal import Decimal
+from functools import cache
+from typing import Any, Callable, Generator, Sequence, TypeVar
+
+from psycopg2.extras import DictCursor
+
+from model_connect.hooks import start_timer
+from model_connect.integrations.psycopg2.schema import Psycopg2ModelSchema
+from model_connect.integrations.psycopg2.select import create_select_query
+from model_connect.registry import get_schema
+
+_T = TypeVar('_T')
+
+ColumnarChunk = dict[str, Sequence]
+
+NUMPY_DTYPES = {
+    bool: 'bool',
+    int: 'int64',
+    float: 'float64',
+    datetime: 'datetime64[us]',
+    date: 'datetime64[D]',
+}
+
+
+def get_numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError('numpy is required for array_type="numpy"')
+
+    return numpy
+
+
+def create_numpy_array(values: list, inferred_type: Any):
+    numpy = get_numpy()
+
+    dtype = NUMPY_DTYPES.get(inferred_type)
+
+    if dtype is not None and None not in values:
+        try:
+            return numpy.array(values, dtype=dtype)
+        except (TypeError, ValueError):
+            pass
+
+    if inferred_type is float or inferred_type is Decimal:
+        try:
+            return numpy.array([numpy.nan if value is None else value for value in values], dtype='float64')
+        except (TypeError, ValueError):
+            pass
+
+    array = numpy.empty(len(values), dtype=object)
+    array[:] = values
+
+    return array
+
+
+@cache
+def compile_column_decoders(
+        schema: Psycopg2ModelSchema,
+        columns: tuple[str, ...]
+) -> tuple[tuple[Callable[[list], list] | None, Any], ...]:
+    result = []
+
+    for column in columns:
+        index = schema.column_indexes.get(column)
+
+        if index is None:
+            result.append((None, None))
+            continue
+
+        field = schema.fields[index]
+
+        if field.batch_decoder:
+            def decode(values: list, field=field) -> list:
+                decoded = list(field.batch_decoder(field, values))
+
+                if len(decoded) != len(values):
+                    raise ValueError(
+                        f'The batch decoder of {field.column_name} returned {len(decoded)} values '
+                        f'for {len(values)} rows'
+                    )
+
+                return decoded
+
+        elif field.decoder:
+            def decode(values: list, field=field) -> list:
+                decoder = field.decoder
+                return [decoder(field, value) for value in values]
+
+        else:
+            decode = None
+
+        result.append((decode, field.model_field.inferred_type))
+
+    return tuple(result)
+
+
+def transpose_rows(rows: list, columns: tuple[str, ...]) -> list[list]:
+    if isinstance(rows[0], dict) and not isinstance(rows[0], list):
+        return [[row[column] for row in rows] for column in columns]
+
+    return [list(values) for values in zip(*rows)]
+
+
+def decode_columns(
+        dataclass_type: type[_T],
+        rows: list,
+        columns: tuple[str, ...],
+        array_type: str = 'list'
+) -> ColumnarChunk:
+    decoders = compile_column_decoders(
+        get_schema(dataclass_type, 'psycopg2'),
+        columns
+    )
+
+    result = {}
+
+    for column, values, (decode, inferred_type) in zip(columns, transpose_rows(rows, columns), decoders):
+        if decode is not None:
+            values = decode(values)
+
+        if array_type == 'numpy':
+            values = create_numpy_array(values, inferred_type)
+
+        result[column] = values
+
+    return result
+
+
+def stream_select_columns(
+        cursor: DictCursor,
+        dataclass_type: type[_T],
+        columns: list[str] = None,
+        chunk_size: int = 10000,
+        filter_options: dict = None,
+        sort_options: dict = None,
+        pagination_options: dict = None,
+        group_by_options: list[str] = None,
+        array_type: str = 'list'
+) -> Generator[ColumnarChunk, None, None]:
+    """
+    Yields one {column: values} mapping per fetched chunk instead of dataclass instances.
+    Values are lists, or numpy arrays typed by the field's inferred type with array_type="numpy".
+    """
+    assert array_type in ('list', 'numpy')
+
+    if array_type == 'numpy':
+        get_numpy()
+
+    query = create_select_query(
+        dataclass_type,
+        columns,
+        filter_options,
+        sort_options,
+        pagination_options,
+        group_by_options
+    )
+
+    timer = start_timer('select', dataclass_type)
+
+    cursor.execute(query.sql, query.vars)
+
+    if timer:
+        timer.mark('execute', query=query)
+
+    result_columns = tuple(column[0] for column in cursor.description)
+    rows = 0
+
+    while True:
+        chunk = cursor.fetchmany(chunk_size)
+
+        if timer:
+            timer.mark('fetch', size=len(chunk))
+
+        if not chunk:
+            break
+
+        decoded = decode_columns(dataclass_type, chunk, result_columns, array_type)
+
+        if timer:
+            timer.mark('decode', size=len(chunk))
+
+        rows += len(chunk)
+
+        yield decoded
+
+        if timer:
+            timer.reset()
+
+    if timer:
+        timer.finish('rows', size=rows)
+
+
+def concatenate_columns(
+        chunks: Sequence[ColumnarChunk],
+        columns: Sequence[str] = (),
+        array_type: str = 'list'
+) -> ColumnarChunk:
+    if not chunks:
+        if array_type == 'numpy':
+            numpy = get_numpy()
+            return {column: numpy.array([], dtype=object) for column in columns}
+
+        return {column: [] for column in columns}
+
+    if array_type == 'numpy':
+        numpy = get_numpy()
+
+        return {
+            column: numpy.concatenate([chunk[column] for chunk in chunks]) for
+            column in
+            chunks[0]
+        }
+
+    result = {column: [] for column in chunks[0]}
+
+    for chunk in chunks:
+        for column, values in chunk.items():
+            result[column].extend(values)
+
+    return result
+
+
+def select_columns(
+        cursor: DictCursor,
+        dataclass_type: type[_T],
+        columns: list[str] = None,
+        chunk_size: int = 10000,
+        filter_options: dict = None,
+        sort_options: dict = None,
+        pagination_options: dict = None,
+        group_by_options: list[str] = None,
+        array_type: str = 'list'
+) -> ColumnarChunk:
+    chunks = list(stream_select_columns(
+        cursor,
+        dataclass_type,
+        columns,
+        chunk_size,
+        filter_options,
+        sort_options,
+        pagination_options,
+        group_by_options,
+        array_type
+    ))
+
+    if columns is None:
+        columns = get_schema(dataclass_type, 'psycopg2').select_columns
+
+    return concatenate_columns(chunks, columns, array_type)
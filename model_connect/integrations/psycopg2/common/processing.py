@@ -1,9 +1,8 @@
 from dataclasses import dataclass, field as dataclass_field
-from typing import TypeVar, Optional
+from typing import Any, Callable, TypeVar, Optional
 
-from model_connect import registry
 from model_connect.constants import is_undefined, UNDEFINED
-from model_connect.registry import get_model_field, get_model_fields
+from model_connect.registry import get_schema
 
 _T = TypeVar('_T')
 
@@ -17,6 +16,13 @@ class ProcessedFilters(list['ProcessedFilter']):
         self.vars = vars_
 
 
+class IdentifierFilterOptions(dict):
+    """
+    Filter options that look a row up by its identifier fields, which are accepted even when
+    they are not filterable (can_filter only restricts what clients may filter on).
+    """
+
+
 class ProcessedSortingOptions(list['ProcessedSortingOption']):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -51,6 +57,7 @@ class ProcessedOnConflictOptions:
     do: str = None
     conflict_targets: list[str] = dataclass_field(default_factory=list)
     update_columns: list[str] = dataclass_field(default_factory=list)
+    merge: Optional[Callable[[Any, Any], Any]] = None
 
     @property
     def do_nothing(self) -> bool:
@@ -73,13 +80,14 @@ def process_filter_options(
     if not filter_options:
         return result
 
-    for field, operators_object in filter_options.items():
-        field = get_model_field(dataclass_type, field)
+    schema = get_schema(dataclass_type)
+    filterable = schema.filterable
 
-        if not field:
-            continue
+    if isinstance(filter_options, IdentifierFilterOptions):
+        filterable = filterable | frozenset(schema.identifier_names)
 
-        if not field.can_filter:
+    for field, operators_object in filter_options.items():
+        if field not in filterable:
             continue
 
         if isinstance(operators_object, (list, set, tuple)):
@@ -103,7 +111,7 @@ def process_filter_options(
                 result.vars.append(value)
                 result.append(
                     ProcessedFilter(
-                        column=field.name,
+                        column=field,
                         operator=operator,
                         value='%s'
                     )
@@ -123,7 +131,7 @@ def process_filter_options(
                 result.vars.append(value_)
                 result.append(
                     ProcessedFilter(
-                        column=field.name,
+                        column=field,
                         operator=operator,
                         value='%s'
                     )
@@ -141,13 +149,10 @@ def process_sort_options(
     if not sort_options:
         return result
 
-    for field, direction in sort_options.items():
-        field = get_model_field(dataclass_type, field)
-
-        if not field:
-            continue
+    sortable = get_schema(dataclass_type).sortable
 
-        if not field.can_sort:
+    for field, direction in sort_options.items():
+        if field not in sortable:
             continue
 
         direction = direction.upper()
@@ -157,7 +162,7 @@ def process_sort_options(
 
         result.append(
             ProcessedSortingOption(
-                column=field.name,
+                column=field,
                 direction=direction
             )
         )
@@ -194,18 +199,13 @@ def process_group_by_options(
     if not group_by_options:
         return result
 
-    model_fields = registry.get(dataclass_type).model_fields
+    groupable = get_schema(dataclass_type).groupable
 
     for column in group_by_options:
-        if column not in model_fields:
-            continue
-
-        model_field = model_fields[column]
-
-        if not model_field.can_group:
+        if column not in groupable:
             continue
 
-        result.append(model_field.name)
+        result.append(column)
 
     return result
 
@@ -243,28 +243,56 @@ def process_on_conflict_options(
         'update_columns' in on_conflict_options
     )
 
-    model_fields = get_model_fields(dataclass_type, 'psycopg2')
-    model_fields = list(model_fields)
+    schema = get_schema(dataclass_type, 'psycopg2')
 
-    for field in model_fields:
-        if is_conflict_targets_specified:
-            if field.column_name in conflict_targets:
-                result.conflict_targets.append(field.column_name)
-        else:
-            if field.include_in_on_conflict_targets:
-                result.conflict_targets.append(field.column_name)
+    if is_conflict_targets_specified:
+        result.conflict_targets = [
+            column for
+            column in
+            schema.column_indexes if
+            column in conflict_targets
+        ]
+    else:
+        result.conflict_targets = schema.on_conflict_targets
 
     if do != 'NOTHING':
-        for field in model_fields:
-            if is_update_columns_specified:
-                if field.column_name in update_columns:
-                    result.update_columns.append(field.column_name)
-            else:
-                if field.include_in_on_conflict_update:
-                    result.update_columns.append(field.column_name)
+        if is_update_columns_specified:
+            result.update_columns = [
+                column for
+                column in
+                schema.column_indexes if
+                column in update_columns
+            ]
+        else:
+            result.update_columns = schema.on_conflict_update_columns
 
     result.do = do
+    result.merge = on_conflict_options.get('merge')
     result.conflict_targets = tuple(result.conflict_targets)
     result.update_columns = tuple(result.update_columns)
 
     return result
+
+
+def process_returning_options(
+        dataclass_type: type[_T],
+        returning: str | list[str] | None
+) -> tuple[str, ...]:
+    if returning is None:
+        return ()
+
+    if returning == '*':
+        return ('*',)
+
+    schema = get_schema(dataclass_type, 'psycopg2')
+
+    if returning == 'identifiers':
+        assert schema.identifier_columns, 'The model has no identifier columns'
+        return schema.identifier_columns
+
+    assert not isinstance(returning, str), f'Invalid returning option: {returning}'
+
+    for column in returning:
+        assert column in schema.column_indexes, f'Unknown returning column: {column}'
+
+    return tuple(returning)
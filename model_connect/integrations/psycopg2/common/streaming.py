@@ -1,12 +1,14 @@
-from dataclasses import asdict
 from functools import cache
-from typing import Iterator, TypeVar, Generator, Iterable
+from itertools import islice, repeat
+from typing import Any, Callable, Iterator, TypeVar, Generator, Iterable
 
 from psycopg2.extras import DictCursor
 
 from model_connect.constants import UNDEFINED
+from model_connect.hooks import PhaseTimer
 from model_connect.integrations.psycopg2 import Psycopg2ModelField
-from model_connect.registry import get_model_fields
+from model_connect.integrations.psycopg2.schema import Psycopg2ModelSchema
+from model_connect.registry import get_schema
 
 _T = TypeVar("_T")
 
@@ -17,88 +19,355 @@ class TuplesToInsert(list[tuple]):
         self.columns = None
 
 
+def generate_insert_columns(dataclass_type: type[_T]) -> tuple[Psycopg2ModelField, ...]:
+    return get_schema(dataclass_type, 'psycopg2').insert_fields
+
+
+def stream_from_cursor(cursor: DictCursor, max_chunk_size: int = 1000) -> Generator[dict, None, None]:
+    while True:
+        results = cursor.fetchmany(max_chunk_size)
+
+        if not results:
+            break
+
+        for result in results:
+            yield result
+
+
+def create_row_decoder(dataclass_type: type[_T]) -> Callable[[dict], _T]:
+    return compile_row_decoder(
+        get_schema(dataclass_type, 'psycopg2'),
+        dataclass_type
+    )
+
+
 @cache
-def generate_insert_columns(dataclass_type: type[_T]) -> list[Psycopg2ModelField]:
-    columns = []
+def compile_row_decoder(
+        schema: Psycopg2ModelSchema,
+        dataclass_type: type[_T]
+) -> Callable[[dict], _T]:
+    required_on_init_columns = schema.required_on_init_columns
 
-    fields = get_model_fields(
-        dataclass_type,
-        'psycopg2'
+    decode_fields = tuple(
+        (field.column_name, field.decoder, field) for
+        field in
+        schema.decode_fields
     )
 
-    for field in fields:
-        if not field.include_in_insert:
-            continue
-        columns.append(field)
+    def decode(row: dict) -> _T:
+        row = dict(row)
 
-    return columns
+        for column in required_on_init_columns:
+            if column not in row:
+                row[column] = UNDEFINED
 
+        for column, decoder, field in decode_fields:
+            value = row.get(column, UNDEFINED)
+
+            if value is not UNDEFINED:
+                row[column] = decoder(
+                    field,
+                    value
+                )
+
+        return dataclass_type(**row)
+
+    return decode
+
+
+def create_chunk_decoder(dataclass_type: type[_T]) -> Callable[[list[dict]], list[_T]]:
+    return compile_chunk_decoder(
+        get_schema(dataclass_type, 'psycopg2'),
+        dataclass_type
+    )
+
+
+@cache
+def compile_chunk_decoder(
+        schema: Psycopg2ModelSchema,
+        dataclass_type: type[_T]
+) -> Callable[[list[dict]], list[_T]]:
+    decode_row = compile_row_decoder(schema, dataclass_type)
+
+    batch_decode_fields = tuple(
+        (field.column_name, field.batch_decoder, field) for
+        field in
+        schema.batch_decode_fields
+    )
+
+    if not batch_decode_fields:
+        def decode(rows: list[dict]) -> list[_T]:
+            return [decode_row(row) for row in rows]
+
+        return decode
+
+    def decode(rows: list[dict]) -> list[_T]:
+        if not rows:
+            return []
+
+        rows = [dict(row) for row in rows]
+        first = rows[0]
+
+        for column, batch_decoder, field in batch_decode_fields:
+            if column not in first:
+                continue
+
+            values = batch_decoder(
+                field,
+                [row[column] for row in rows]
+            )
+
+            # A batch decoder returning the wrong number of values must not leave raw values behind
+            for row, value in zip(rows, values, strict=True):
+                row[column] = value
+
+        return [decode_row(row) for row in rows]
+
+    return decode
+
+
+def create_dict_chunk_decoder(dataclass_type: type[_T]) -> Callable[[list[dict]], list[dict]]:
+    return compile_dict_chunk_decoder(
+        get_schema(dataclass_type, 'psycopg2')
+    )
+
+
+@cache
+def compile_dict_chunk_decoder(schema: Psycopg2ModelSchema) -> Callable[[list[dict]], list[dict]]:
+    """
+    Applies the field decoders like compile_chunk_decoder, for rows that are only a subset of
+    the columns and are returned as dicts instead of dataclasses.
+    """
+    decode_fields = tuple(
+        (field.column_name, field.decoder, field) for
+        field in
+        schema.decode_fields
+    )
+
+    batch_decode_fields = tuple(
+        (field.column_name, field.batch_decoder, field) for
+        field in
+        schema.batch_decode_fields
+    )
+
+    def decode(rows: list[dict]) -> list[dict]:
+        rows = [dict(row) for row in rows]
+
+        if not rows:
+            return rows
+
+        first = rows[0]
+
+        for column, batch_decoder, field in batch_decode_fields:
+            if column not in first:
+                continue
+
+            values = batch_decoder(
+                field,
+                [row[column] for row in rows]
+            )
+
+            # A batch decoder returning the wrong number of values must not leave raw values behind
+            for row, value in zip(rows, values, strict=True):
+                row[column] = value
+
+        decoders = tuple(item for item in decode_fields if item[0] in first)
+
+        if decoders:
+            for row in rows:
+                for column, decoder, field in decoders:
+                    row[column] = decoder(field, row[column])
+
+        return rows
+
+    return decode
+
+
+def stream_decoded_rows(
+        cursor: DictCursor,
+        dataclass_type: type[_T],
+        chunk_size: int = 1000,
+        timer: PhaseTimer = None
+) -> Generator[_T, None, None]:
+    decode = create_chunk_decoder(dataclass_type)
+
+    if timer is None:
+        while True:
+            results = cursor.fetchmany(chunk_size)
+
+            if not results:
+                break
+
+            for result in decode(results):
+                yield result
+
+        return
+
+    rows = 0
 
-def stream_from_cursor(cursor: DictCursor, max_chunk_size: int = 1000) -> Generator[dict, None, None]:
     while True:
-        results = cursor.fetchmany(max_chunk_size)
+        timer.reset()
+        results = cursor.fetchmany(chunk_size)
+        timer.mark('fetch', size=len(results))
 
         if not results:
             break
 
+        results = decode(results)
+        timer.mark('decode', size=len(results))
+
+        rows += len(results)
+
         for result in results:
             yield result
 
+    timer.finish('rows', size=rows)
 
-def stream_to_dataclass_type(results: Iterator[dict], dataclass_type: type[_T]) -> Generator[_T, None, None]:
-    fields = get_model_fields(dataclass_type, 'psycopg2')
-    fields = list(fields)
 
-    for result in results:
-        result = dict(result)
-        for field in fields:
-            if field.column_name not in result and field.model_field.is_required_on_init:
-                result[field.column_name] = UNDEFINED
-                continue
+def stream_to_dataclass_type(
+        results: Iterator[dict],
+        dataclass_type: type[_T],
+        chunk_size: int = 1000
+) -> Generator[_T, None, None]:
+    schema = get_schema(dataclass_type, 'psycopg2')
 
-            if field.decoder:
-                result[field.column_name] = field.decoder(
-                    field,
-                    result[field.column_name]
-                )
+    if not schema.batch_decode_fields:
+        decode = compile_row_decoder(schema, dataclass_type)
 
-        yield dataclass_type(**result)
+        for result in results:
+            yield decode(result)
 
+        return
 
-def stream_dataclass_types_to_insert_tuples(
+    # Batch decoders need whole columns, so rows are decoded in chunks
+    decode = compile_chunk_decoder(schema, dataclass_type)
+    results = iter(results)
+
+    while True:
+        chunk = list(islice(results, chunk_size))
+
+        if not chunk:
+            break
+
+        for result in decode(chunk):
+            yield result
+
+
+def create_insert_encoder(
+        dataclass_type: type[_T],
+        columns: Iterable[str]
+) -> Callable[[_T | dict], tuple]:
+    return compile_insert_encoder(
+        get_schema(dataclass_type, 'psycopg2'),
+        tuple(columns)
+    )
+
+
+@cache
+def compile_insert_encoder(
+        schema: Psycopg2ModelSchema,
+        columns: tuple[str, ...]
+) -> Callable[[Any], tuple]:
+    fields = tuple(
+        (field.model_field.name, field.column_name, field.encoder, field) for
+        field in
+        schema.insert_fields if
+        field.column_name in columns
+    )
+
+    def encode(item) -> tuple:
+        is_dict = isinstance(item, dict)
+
+        values = []
+
+        for name, column, encoder, field in fields:
+            if is_dict:
+                value = item[column]
+            else:
+                value = getattr(item, name)
+
+            if encoder:
+                value = encoder(field, value)
+
+            values.append(value)
+
+        return tuple(values)
+
+    return encode
+
+
+def collapse_conflicting_tuples(
         dataclass_type: type[_T],
         data: Iterable[_T],
-        columns: list[str]
-) -> TuplesToInsert:
-    fields = generate_insert_columns(dataclass_type)
-    fields = [field for field in fields if field.column_name in columns]
+        values: TuplesToInsert,
+        conflict_targets: Iterable[str],
+        merge: Callable[[_T, _T], _T] = None
+) -> tuple[TuplesToInsert, int]:
+    """
+    Postgres rejects an ON CONFLICT DO UPDATE that affects the same row twice, so rows sharing
+    the (encoded) conflict target values are collapsed into the position of the first one. The
+    last row wins, unless a merge function combines the previous and the next item. Rows with a
+    NULL conflict target never conflict, so they are kept as they are.
+    """
+    columns = list(values.columns)
 
-    result = []
+    if not all(target in columns for target in conflict_targets):
+        return values, 0
 
-    for item in data:
-        item_tuple = []
+    indexes = tuple(columns.index(target) for target in conflict_targets)
 
-        if not isinstance(item, dict):
-            item = asdict(item)
+    # Without a merge function only the encoded values are needed, and data may be exhausted
+    if merge is not None:
+        encode = create_insert_encoder(dataclass_type, columns)
+    else:
+        data = repeat(None)
 
-        for field in fields:
-            if field.encoder:
-                item[field.column_name] = field.encoder(
-                    field,
-                    item[field.column_name]
-                )
+    positions = {}
+    items = []
+    result = TuplesToInsert()
+    result.columns = values.columns
 
-            item_tuple.append(item[field.column_name])
+    for item, value in zip(data, values):
+        key = tuple(value[index] for index in indexes)
 
-        result.append(
-            tuple(
-                item[field.column_name] for
-                field in
-                fields
-            )
-        )
+        if None in key:
+            result.append(value)
+            items.append(item)
+            continue
+
+        position = positions.get(key)
 
-    result = TuplesToInsert(result)
+        if position is None:
+            positions[key] = len(result)
+            result.append(value)
+            items.append(item)
+            continue
+
+        if merge is not None:
+            item = merge(items[position], item)
+            value = encode(item)
+
+        items[position] = item
+        result[position] = value
+
+    return result, len(values) - len(result)
+
+
+def stream_dataclass_types_to_insert_tuples(
+        dataclass_type: type[_T],
+        data: Iterable[_T],
+        columns: list[str]
+) -> TuplesToInsert:
+    encode = create_insert_encoder(
+        dataclass_type,
+        columns
+    )
+
+    result = TuplesToInsert(
+        encode(item) for
+        item in
+        data
+    )
     result.columns = columns
 
     return result
@@ -0,0 +1,126 @@
+from dataclasses import dataclass, field as dataclass_field
+from functools import cache, lru_cache
+from typing import Any, TypeVar, Generator
+
+from jinja2 import Template
+from psycopg2.extras import DictCursor
+
+from model_connect.integrations.psycopg2.common.processing import process_filter_options
+from model_connect.hooks import start_timer
+from model_connect.integrations.psycopg2.common.streaming import stream_decoded_rows
+from model_connect.registry import get_schema
+
+_T = TypeVar('_T')
+
+
+DELETE_TEMPLATE = '''
+        DELETE FROM
+            {{ tablename }}
+
+        {%- if filter_options %}
+            WHERE
+            {%- for filter in filter_options %}
+            {{ filter.column }} {{ filter.operator }} %s
+            {%- if not loop.last %}
+            AND
+            {%- endif %}
+            {%- endfor %}
+        {%- endif %}
+
+        RETURNING
+            *
+    '''
+
+
+@dataclass
+class DeleteSQL:
+    sql: str
+    vars: list[Any] = dataclass_field(
+        default_factory=list
+    )
+
+
+@cache
+def get_delete_template() -> Template:
+    return Template(DELETE_TEMPLATE)
+
+
+@lru_cache(maxsize=1024)
+def render_delete_sql(
+        tablename: str,
+        filters: tuple[tuple[str, str], ...] = ()
+) -> str:
+    sql = get_delete_template().render(
+        tablename=tablename,
+        filter_options=[
+            {'column': column, 'operator': operator} for
+            column, operator in
+            filters
+        ]
+    )
+
+    return ' '.join(sql.split())
+
+
+def create_delete_query(
+        dataclass_type: type[_T],
+        filter_options: dict = None
+) -> DeleteSQL:
+    vars_ = []
+
+    schema = get_schema(dataclass_type, 'psycopg2')
+
+    timer = start_timer('delete', dataclass_type)
+
+    filter_options = process_filter_options(
+        dataclass_type,
+        filter_options,
+        vars_
+    )
+
+    if not filter_options:
+        raise ValueError('Refusing to delete without filter options')
+
+    if timer:
+        timer.mark('process_options')
+
+    sql = render_delete_sql(
+        schema.tablename,
+        tuple((option.column, option.operator) for option in filter_options)
+    )
+
+    query = DeleteSQL(
+        sql,
+        vars_
+    )
+
+    if timer:
+        timer.mark('render', query=query)
+
+    return query
+
+
+def stream_delete(
+        cursor: DictCursor,
+        dataclass_type: type[_T],
+        filter_options: dict = None
+) -> Generator[_T, None, None]:
+    query = create_delete_query(
+        dataclass_type,
+        filter_options
+    )
+
+    timer = start_timer('delete', dataclass_type)
+
+    cursor.execute(
+        query.sql,
+        query.vars
+    )
+
+    if timer:
+        timer.mark('execute', query=query)
+
+    results = stream_decoded_rows(cursor, dataclass_type, timer=timer)
+
+    for result in results:
+        yield result
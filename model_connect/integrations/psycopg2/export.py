@@ -0,0 +1,313 @@
+from datetime import date, datetime, time
+from queue import Queue
+from threading import Thread
+from typing import Any, BinaryIO, Generator, TextIO, TypeVar
+
+from psycopg2.extensions import encodings
+from psycopg2.extras import DictCursor
+
+from model_connect.hooks import start_timer
+from model_connect.integrations.psycopg2.columnar import stream_select_columns
+from model_connect.integrations.psycopg2.select import create_select_query
+from model_connect.registry import get_schema
+
+_T = TypeVar('_T')
+
+COPY_FORMATS = ('csv', 'text', 'binary')
+
+PYARROW_TYPES = {
+    bool: lambda pyarrow: pyarrow.bool_(),
+    int: lambda pyarrow: pyarrow.int64(),
+    float: lambda pyarrow: pyarrow.float64(),
+    str: lambda pyarrow: pyarrow.string(),
+    bytes: lambda pyarrow: pyarrow.binary(),
+    datetime: lambda pyarrow: pyarrow.timestamp('us'),
+    date: lambda pyarrow: pyarrow.date32(),
+    time: lambda pyarrow: pyarrow.time64('us'),
+}
+
+_DONE = object()
+
+
+class CopyCancelled(Exception):
+    pass
+
+
+class QueueWriter:
+    """
+    File-like target for copy_expert that hands the data to another thread in chunks of at least
+    chunk_size bytes. Postgres sends roughly one message per row, so writes are buffered first.
+    """
+
+    def __init__(self, queue: Queue, chunk_size: int):
+        self.queue = queue
+        self.chunk_size = chunk_size
+        self.buffer = bytearray()
+        self.cancelled = False
+
+    def write(self, data: bytes | str) -> int:
+        if self.cancelled:
+            raise CopyCancelled()
+
+        if isinstance(data, str):
+            data = data.encode()
+
+        self.buffer += data
+
+        if len(self.buffer) >= self.chunk_size:
+            self.flush()
+
+        return len(data)
+
+    def flush(self):
+        if self.buffer:
+            self.queue.put(bytes(self.buffer))
+            self.buffer.clear()
+
+
+def quote_copy_option(value: str) -> str:
+    # COPY options cannot be parameters; an escape string reads the same whatever standard_conforming_strings is
+    return "E'" + value.replace('\\', '\\\\').replace("'", "''") + "'"
+
+
+def create_copy_to_sql(
+        select_sql: str,
+        format_: str = 'csv',
+        header: bool = True,
+        delimiter: str = None,
+        null: str = None
+) -> str:
+    assert format_ in COPY_FORMATS
+
+    options = [f'FORMAT {format_}']
+
+    if header and format_ == 'csv':
+        options.append('HEADER true')
+
+    if delimiter is not None:
+        if len(delimiter) != 1:
+            raise ValueError('The delimiter must be a single character')
+
+        options.append(f'DELIMITER {quote_copy_option(delimiter)}')
+
+    if null is not None:
+        options.append(f'NULL {quote_copy_option(null)}')
+
+    return f'COPY ({select_sql}) TO STDOUT WITH ({", ".join(options)})'
+
+
+def copy_to(
+        cursor: DictCursor,
+        dataclass_type: type[_T],
+        file: BinaryIO | TextIO,
+        columns: list[str] = None,
+        filter_options: dict = None,
+        sort_options: dict = None,
+        pagination_options: dict = None,
+        group_by_options: list[str] = None,
+        format_: str = 'csv',
+        header: bool = True,
+        delimiter: str = None,
+        null: str = None
+) -> int:
+    """
+    Exports the rows of the equivalent select with COPY ... TO STDOUT, writing Postgres' own
+    formatting to the file. Returns the number of rows copied.
+    """
+    query = create_select_query(
+        dataclass_type,
+        columns,
+        filter_options,
+        sort_options,
+        pagination_options,
+        group_by_options
+    )
+
+    timer = start_timer('export', dataclass_type)
+
+    # COPY does not accept parameters, so the select is inlined with the values quoted by psycopg2
+    select_sql = cursor.mogrify(query.sql, query.vars).decode(
+        encodings.get(cursor.connection.encoding, 'utf-8')
+    )
+
+    cursor.copy_expert(
+        create_copy_to_sql(select_sql, format_, header, delimiter, null),
+        file
+    )
+
+    if timer:
+        timer.mark('execute', query=query)
+        timer.finish('rows', size=cursor.rowcount)
+
+    return cursor.rowcount
+
+
+def stream_export(
+        cursor: DictCursor,
+        dataclass_type: type[_T],
+        columns: list[str] = None,
+        filter_options: dict = None,
+        sort_options: dict = None,
+        pagination_options: dict = None,
+        group_by_options: list[str] = None,
+        format_: str = 'csv',
+        header: bool = True,
+        delimiter: str = None,
+        null: str = None,
+        chunk_size: int = 65536,
+        max_pending_chunks: int = 16
+) -> Generator[bytes, None, None]:
+    """
+    Same as copy_to, but yields the output in chunks, i.e. for a StreamingResponse. The COPY runs
+    in a background thread that blocks once max_pending_chunks are waiting, so memory stays bounded
+    by the slower side. The cursor must not be used elsewhere until the generator is exhausted or
+    closed; closing it early aborts the COPY.
+    """
+    queue = Queue(max_pending_chunks)
+    writer = QueueWriter(queue, chunk_size)
+
+    def run():
+        try:
+            copy_to(
+                cursor,
+                dataclass_type,
+                writer,
+                columns,
+                filter_options,
+                sort_options,
+                pagination_options,
+                group_by_options,
+                format_,
+                header,
+                delimiter,
+                null
+            )
+            writer.flush()
+        except BaseException as e:
+            queue.put(e)
+        else:
+            queue.put(_DONE)
+
+    thread = Thread(target=run, name='model-connect-export', daemon=True)
+    thread.start()
+
+    try:
+        while True:
+            item = queue.get()
+
+            if item is _DONE:
+                break
+
+            if isinstance(item, BaseException):
+                raise item
+
+            yield item
+    finally:
+        if thread.is_alive():
+            writer.cancelled = True
+
+            # Unblock the writer so that it notices the cancellation
+            while thread.is_alive():
+                while not queue.empty():
+                    queue.get_nowait()
+
+                thread.join(0.01)
+
+
+def get_pyarrow() -> Any:
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError('pyarrow is required for export_parquet')
+
+    return pyarrow
+
+
+def create_parquet_schema(
+        pyarrow: Any,
+        dataclass_type: type[_T],
+        columns: list[str]
+) -> tuple[Any, set[str]]:
+    """
+    Returns the arrow schema of the export, and the columns written as strings because their
+    type has no arrow equivalent here (e.g. Decimal, UUID or enums).
+    """
+    schema = get_schema(dataclass_type, 'psycopg2')
+
+    fields = []
+    string_columns = set()
+
+    for column in columns:
+        index = schema.column_indexes.get(column)
+        inferred_type = None if index is None else schema.fields[index].model_field.inferred_type
+        create_type = PYARROW_TYPES.get(inferred_type)
+
+        if create_type is None:
+            string_columns.add(column)
+            fields.append(pyarrow.field(column, pyarrow.string()))
+        else:
+            fields.append(pyarrow.field(column, create_type(pyarrow)))
+
+    return pyarrow.schema(fields), string_columns
+
+
+def export_parquet(
+        cursor: DictCursor,
+        dataclass_type: type[_T],
+        file: str | BinaryIO,
+        columns: list[str] = None,
+        filter_options: dict = None,
+        sort_options: dict = None,
+        pagination_options: dict = None,
+        group_by_options: list[str] = None,
+        chunk_size: int = 65536,
+        compression: str = 'snappy'
+) -> int:
+    """
+    Typed export: rows are decoded column-wise (see stream_select_columns) and written as one
+    parquet row group per chunk, with a schema taken from the fields' types rather than inferred
+    per chunk. Returns the number of rows written.
+    """
+    pyarrow = get_pyarrow()
+
+    if columns is None:
+        columns = get_schema(dataclass_type, 'psycopg2').select_columns
+
+    chunks = stream_select_columns(
+        cursor,
+        dataclass_type,
+        columns,
+        chunk_size,
+        filter_options,
+        sort_options,
+        pagination_options,
+        group_by_options
+    )
+
+    arrow_schema, string_columns = create_parquet_schema(pyarrow, dataclass_type, columns)
+
+    writer = None
+    rows = 0
+
+    try:
+        for chunk in chunks:
+            for column in string_columns:
+                chunk[column] = [None if value is None else str(value) for value in chunk[column]]
+
+            batch = pyarrow.RecordBatch.from_pydict(chunk, schema=arrow_schema)
+
+            if writer is None:
+                writer = pyarrow.parquet.ParquetWriter(file, arrow_schema, compression=compression)
+
+            writer.write_batch(batch)
+            rows += batch.num_rows
+
+        if writer is None:
+            table = arrow_schema.empty_table()
+            pyarrow.parquet.write_table(table, file, compression=compression)
+    finally:
+        if writer is not None:
+            writer.close()
+
+    return rows
@@ -0,0 +1,280 @@
+import re
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+from psycopg2.extras import DictCursor
+
+from model_connect import registry
+from model_connect.integrations.psycopg2.stats import QueryStats, QueryStatsCollector
+
+INDEX_DEFINITION_PATTERN = re.compile(
+    r'^CREATE (?P<unique>UNIQUE )?INDEX .+? ON (?:ONLY )?(?P<table>[\w."]+) USING (?P<method>\w+) '
+    r'\((?P<columns>.+?)\)(?: INCLUDE \(.+?\))?(?P<where> WHERE .+)?$',
+    re.IGNORECASE
+)
+
+
+@dataclass(slots=True)
+class IndexInfo:
+    tablename: str
+    name: str
+    columns: tuple[str, ...]
+    method: str = 'btree'
+    unique: bool = False
+    partial: bool = False
+    definition: str = ''
+
+
+@dataclass(slots=True)
+class IndexSuggestion:
+    tablename: str
+    columns: tuple[str, ...]
+    statement: str
+    calls: int
+    total_duration: float
+    models: tuple[str, ...]
+
+
+@dataclass(slots=True)
+class UnindexedField:
+    dataclass_type: type
+    field_name: str
+    tablename: str
+    column: str
+    statement: str
+
+
+def parse_index_definition(tablename: str, name: str, definition: str) -> Optional[IndexInfo]:
+    match = INDEX_DEFINITION_PATTERN.match(definition)
+
+    if not match:
+        return None
+
+    columns = []
+
+    for column in match.group('columns').split(','):
+        column = column.strip().split(' ')[0].strip('"')
+        columns.append(column)
+
+    return IndexInfo(
+        tablename=tablename,
+        name=name,
+        columns=tuple(columns),
+        method=match.group('method').lower(),
+        unique=bool(match.group('unique')),
+        partial=bool(match.group('where')),
+        definition=definition
+    )
+
+
+def read_indexes(
+        cursor: DictCursor,
+        tablenames: Iterable[str],
+        schemaname: str = 'public'
+) -> dict[str, list[IndexInfo]]:
+    tablenames = tuple(set(tablenames))
+    result = {tablename: [] for tablename in tablenames}
+
+    if not tablenames:
+        return result
+
+    cursor.execute(
+        'SELECT tablename, indexname, indexdef FROM pg_indexes WHERE schemaname = %s AND tablename IN %s',
+        (schemaname, tablenames)
+    )
+
+    for tablename, name, definition in cursor.fetchall():
+        index = parse_index_definition(tablename, name, definition)
+
+        if index is not None:
+            result[tablename].append(index)
+
+    return result
+
+
+def create_index_statement(tablename: str, columns: Iterable[str]) -> str:
+    columns = tuple(columns)
+    name = '_'.join(('ix', tablename, *columns))[:63]
+
+    return f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {tablename} ({", ".join(columns)})'
+
+
+def is_supported(
+        filter_columns: tuple[str, ...],
+        sort_columns: tuple[str, ...],
+        index: IndexInfo
+) -> bool:
+    if index.method != 'btree' or index.partial:
+        return False
+
+    count = len(filter_columns)
+
+    if set(index.columns[:count]) != set(filter_columns):
+        return False
+
+    return index.columns[count:count + len(sort_columns)] == sort_columns
+
+
+def get_candidate(stats: QueryStats) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    filter_columns = tuple(dict.fromkeys(stats.filter_columns))
+
+    if stats.group_by_columns and not filter_columns:
+        return tuple(dict.fromkeys(stats.group_by_columns)), ()
+
+    sort_columns = tuple(
+        column for
+        column in
+        dict.fromkeys(column for column, _ in stats.sort_columns) if
+        column not in filter_columns
+    )
+
+    return filter_columns, sort_columns
+
+
+def suggest_indexes(
+        stats: QueryStatsCollector | Iterable[QueryStats],
+        indexes: dict[str, list[IndexInfo]],
+        min_calls: int = 1
+) -> list[IndexSuggestion]:
+    if isinstance(stats, QueryStatsCollector):
+        stats = stats.get_stats()
+
+    suggestions: dict[tuple[str, tuple[str, ...]], IndexSuggestion] = {}
+
+    for query_stats in stats:
+        if query_stats.operation not in ('select', 'select_count'):
+            continue
+
+        filter_columns, sort_columns = get_candidate(query_stats)
+
+        if not filter_columns and not sort_columns:
+            continue
+
+        tablename = registry.get_schema(query_stats.dataclass_type, 'psycopg2').tablename
+
+        if any(
+                is_supported(filter_columns, sort_columns, index) for
+                index in
+                indexes.get(tablename, ())
+        ):
+            continue
+
+        columns = filter_columns + sort_columns
+        key = (tablename, columns)
+
+        suggestion = suggestions.get(key)
+
+        if suggestion is None:
+            suggestion = suggestions[key] = IndexSuggestion(
+                tablename=tablename,
+                columns=columns,
+                statement=create_index_statement(tablename, columns),
+                calls=0,
+                total_duration=0.0,
+                models=()
+            )
+
+        suggestion.calls += query_stats.calls
+        suggestion.total_duration += query_stats.total_duration
+
+        model = query_stats.dataclass_type.__name__
+
+        if model not in suggestion.models:
+            suggestion.models += (model,)
+
+    return sorted(
+        (suggestion for suggestion in suggestions.values() if suggestion.calls >= min_calls),
+        key=lambda suggestion: suggestion.total_duration,
+        reverse=True
+    )
+
+
+def find_unindexed_fields(
+        indexes: dict[str, list[IndexInfo]],
+        dataclass_types: Iterable[type] = None
+) -> list[UnindexedField]:
+    if dataclass_types is None:
+        dataclass_types = registry.iterate()
+
+    result = []
+
+    for dataclass_type in dataclass_types:
+        schema = registry.get_schema(dataclass_type)
+
+        if 'psycopg2' not in schema.integrations:
+            continue
+
+        psycopg2_schema = schema.integrations['psycopg2']
+        tablename = psycopg2_schema.tablename
+
+        leading_columns = {
+            index.columns[0] for
+            index in
+            indexes.get(tablename, ()) if
+            index.columns and not index.partial
+        }
+
+        for name in schema.field_names:
+            if name not in schema.filterable:
+                continue
+
+            field = psycopg2_schema.fields_by_name[name]
+
+            if not field.model_field.is_db_column or field.column_name in leading_columns:
+                continue
+
+            result.append(
+                UnindexedField(
+                    dataclass_type=dataclass_type,
+                    field_name=name,
+                    tablename=tablename,
+                    column=field.column_name,
+                    statement=create_index_statement(tablename, (field.column_name,))
+                )
+            )
+
+    return result
+
+
+def check_filterable_indexes(
+        cursor: DictCursor,
+        dataclass_types: Iterable[type] = None,
+        schemaname: str = 'public'
+) -> list[UnindexedField]:
+    dataclass_types = list(registry.iterate() if dataclass_types is None else dataclass_types)
+
+    tablenames = [
+        registry.get_schema(dataclass_type).integrations['psycopg2'].tablename for
+        dataclass_type in
+        dataclass_types if
+        'psycopg2' in registry.get_schema(dataclass_type).integrations
+    ]
+
+    return find_unindexed_fields(
+        read_indexes(cursor, tablenames, schemaname),
+        dataclass_types
+    )
+
+
+def advise(
+        cursor: DictCursor,
+        stats: QueryStatsCollector | Iterable[QueryStats],
+        min_calls: int = 1,
+        schemaname: str = 'public'
+) -> list[IndexSuggestion]:
+    if isinstance(stats, QueryStatsCollector):
+        stats = stats.get_stats()
+
+    stats = list(stats)
+
+    tablenames = [
+        registry.get_schema(query_stats.dataclass_type, 'psycopg2').tablename for
+        query_stats in
+        stats
+    ]
+
+    return suggest_indexes(
+        stats,
+        read_indexes(cursor, tablenames, schemaname),
+        min_calls
+    )
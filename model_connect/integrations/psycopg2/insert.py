@@ -1,45 +1,138 @@
-from dataclasses import dataclass, field, asdict
-from typing import Iterable, TypeVar, Generator
+from dataclasses import dataclass, field
+from functools import cache, lru_cache
+from typing import Any, Iterable, TypeVar, Generator
 
 from jinja2 import Template
 from psycopg2.extras import DictCursor, execute_values
 
-from model_connect.integrations.psycopg2.common.processing import process_on_conflict_options
+from model_connect.integrations.psycopg2.common.processing import (
+    process_on_conflict_options,
+    process_returning_options
+)
+from model_connect.hooks import start_timer
 from model_connect.integrations.psycopg2.common.streaming import (
-    stream_from_cursor,
-    stream_to_dataclass_type,
-    stream_dataclass_types_to_insert_tuples,
-    generate_insert_columns
+    collapse_conflicting_tuples,
+    create_dict_chunk_decoder,
+    stream_decoded_rows,
+    stream_dataclass_types_to_insert_tuples
 )
-from model_connect.registry import get_model
+from model_connect.registry import get_schema
 
 _T = TypeVar('_T')
 
 
+INSERT_TEMPLATE = '''
+        INSERT INTO
+            {{ tablename }}
+            (
+                {%- for column in columns %}
+                {{ column }}
+                {%- if not loop.last %}
+                    ,
+                {%- endif %}
+                {%- endfor %}
+            )
+        VALUES
+            %s
+
+        {%- if on_conflict_options %}
+            ON CONFLICT (
+                {%- for column in on_conflict_options.conflict_targets %}
+                {{ column }}
+                {%- if not loop.last %}
+                ,
+                {%- endif %}
+                {%- endfor %}
+            )
+
+            {%- if on_conflict_options.do_nothing %}
+            DO NOTHING
+
+            {%- elif on_conflict_options.do_update %}
+            DO UPDATE SET
+                {%- for column in on_conflict_options.update_columns %}
+                {{ column }} = EXCLUDED.{{ column }}
+                {%- if not loop.last %}
+                ,
+                {%- endif %}
+                {%- endfor %}
+            {%- endif %}
+        {%- endif %}
+
+        {%- if returning %}
+            RETURNING
+            {%- for column in returning %}
+            {{ column }}
+            {%- if not loop.last %}
+            ,
+            {%- endif %}
+            {%- endfor %}
+        {%- endif %}
+    '''
+
+
 @dataclass
 class InsertSQL:
     sql: str
     vars: list = field(
         default_factory=list
     )
+    collapsed: int = 0
+    returning: tuple[str, ...] = ('*',)
+
+
+@cache
+def get_insert_template() -> Template:
+    return Template(INSERT_TEMPLATE)
+
+
+@lru_cache(maxsize=1024)
+def render_insert_sql(
+        tablename: str,
+        columns: tuple[str, ...],
+        on_conflict: tuple[str, tuple[str, ...], tuple[str, ...]] = None,
+        returning: tuple[str, ...] = ('*',)
+) -> str:
+    on_conflict_options = None
+
+    if on_conflict is not None:
+        do, conflict_targets, update_columns = on_conflict
+
+        on_conflict_options = {
+            'do_nothing': do == 'NOTHING',
+            'do_update': do == 'UPDATE',
+            'conflict_targets': conflict_targets,
+            'update_columns': update_columns
+        }
+
+    sql = get_insert_template().render(
+        tablename=tablename,
+        columns=columns,
+        on_conflict_options=on_conflict_options,
+        returning=returning
+    )
+
+    return ' '.join(sql.split())
 
 
 def create_insert_query(
         dataclass_type: type[_T],
         data: Iterable[_T],
         columns: list[str] = None,
-        on_conflict_options: dict = None
+        on_conflict_options: dict = None,
+        returning: str | list[str] | None = '*'
 ) -> InsertSQL:
     vars_ = []
 
-    model = get_model(
+    schema = get_schema(
         dataclass_type,
         'psycopg2'
     )
 
+    timer = start_timer('insert', dataclass_type)
+
     if not columns:
-        columns = generate_insert_columns(dataclass_type)
-        columns = [column.column_name for column in columns]
+        columns = schema.insert_columns
 
     if on_conflict_options is not None:
         on_conflict_options = process_on_conflict_options(
@@ -47,78 +140,104 @@ def create_insert_query(
             on_conflict_options
         )
 
+    returning = process_returning_options(
+        dataclass_type,
+        returning
+    )
+
+    if timer:
+        timer.mark('process_options')
+
+    if on_conflict_options is not None and on_conflict_options.merge is not None:
+        data = list(data)
+
     values = stream_dataclass_types_to_insert_tuples(
         dataclass_type,
         data,
         columns
     )
 
+    if timer:
+        timer.mark('encode', size=len(values))
+
+    collapsed = 0
+
+    if on_conflict_options is not None and on_conflict_options.do_update:
+        values, collapsed = collapse_conflicting_tuples(
+            dataclass_type,
+            data,
+            values,
+            on_conflict_options.conflict_targets,
+            on_conflict_options.merge
+        )
+
+        if timer:
+            timer.mark('dedupe', size=collapsed)
+
     vars_.extend(values)
 
-    template = Template('''
-        INSERT INTO
-            {{ tablename }}
-            (
-                {%- for column in columns %}
-                {{ column }}
-                {%- if not loop.last %}
-                    ,
-                {%- endif %}
-                {%- endfor %}
-            )
-        VALUES
-            %s
-        
-        {%- if on_conflict_options %}
-            ON CONFLICT (
-                {%- for column in on_conflict_options.conflict_targets %}
-                {{ column }}
-                {%- if not loop.last %}
-                ,
-                {%- endif %}
-                {%- endfor %}
-            )
-            
-            {%- if on_conflict_options.do_nothing %}
-            DO NOTHING
-            
-            {%- elif on_conflict_options.do_update %}
-            DO UPDATE SET
-                {%- for column in on_conflict_options.update_columns %}
-                {{ column }} = EXCLUDED.{{ column }}
-                {%- if not loop.last %}
-                ,
-                {%- endif %}
-                {%- endfor %}
-            {%- endif %}
-        {%- endif %}
-        
-        RETURNING
-            *
-    ''')
-
-    sql = template.render(
-        tablename=model.tablename,
-        columns=values.columns,
-        on_conflict_options=on_conflict_options
-    )
+    if on_conflict_options is not None:
+        on_conflict = (
+            on_conflict_options.do,
+            tuple(on_conflict_options.conflict_targets),
+            tuple(on_conflict_options.update_columns)
+        )
+    else:
+        on_conflict = None
 
-    sql = ' '.join(sql.split())
-    sql = sql.strip()
+    sql = render_insert_sql(
+        schema.tablename,
+        tuple(values.columns),
+        on_conflict,
+        returning
+    )
 
-    return InsertSQL(
+    query = InsertSQL(
         sql,
-        vars_
+        vars_,
+        collapsed,
+        returning
     )
 
+    if timer:
+        timer.mark('render', query=query)
+
+    return query
+
+
+def execute_insert_query(
+        cursor: DictCursor,
+        dataclass_type: type[_T],
+        insert_query: InsertSQL
+):
+    timer = start_timer('insert', dataclass_type)
+
+    execute_values(
+        cursor,
+        insert_query.sql,
+        insert_query.vars,
+        page_size=len(insert_query.vars)
+    )
+
+    if timer:
+        timer.mark('execute', size=len(insert_query.vars), query=insert_query)
+
+    return timer
+
 
 def stream_insert(
         cursor: DictCursor,
         dataclass_type: type[_T],
         data: Iterable[_T],
         columns: list[str] = None,
-        on_conflict_options: dict = None
-) -> Generator[_T, None, None]:
+        on_conflict_options: dict = None,
+        returning: str | list[str] | None = '*'
+) -> Generator[_T | Any, None, None]:
+    """
+    Yields the inserted rows as dataclasses (returning='*'), their identifier values
+    ('identifiers'; tuples for composite identifiers), dicts of the given columns (a list), or
+    nothing (None; see insert_count).
+    """
     if not data:
         return
 
@@ -126,17 +245,73 @@ def stream_insert(
         dataclass_type,
         data,
         columns,
-        on_conflict_options
+        on_conflict_options,
+        returning
     )
 
-    execute_values(
-        cursor,
-        insert_query.sql,
-        insert_query.vars
-    )
+    if not insert_query.vars:
+        return
+
+    timer = execute_insert_query(cursor, dataclass_type, insert_query)
+
+    if insert_query.returning == ('*',):
+        results = stream_decoded_rows(cursor, dataclass_type, timer=timer)
+
+        for result in results:
+            yield result
+
+        return
+
+    if not insert_query.returning:
+        if timer:
+            timer.finish('rows', size=cursor.rowcount)
+
+        return
+
+    if returning == 'identifiers':
+        if len(insert_query.returning) == 1:
+            results = [row[0] for row in cursor.fetchall()]
+        else:
+            results = [tuple(row) for row in cursor.fetchall()]
+    else:
+        results = create_dict_chunk_decoder(dataclass_type)(cursor.fetchall())
 
-    results = stream_from_cursor(cursor)
-    results = stream_to_dataclass_type(results, dataclass_type)
+    if timer:
+        timer.mark('fetch', size=len(results))
+        timer.finish('rows', size=len(results))
 
     for result in results:
         yield result
+
+
+def insert_count(
+        cursor: DictCursor,
+        dataclass_type: type[_T],
+        data: Iterable[_T],
+        columns: list[str] = None,
+        on_conflict_options: dict = None
+) -> int:
+    """
+    Inserts without a RETURNING clause and returns the number of rows inserted (or updated).
+    """
+    if not data:
+        return 0
+
+    insert_query = create_insert_query(
+        dataclass_type,
+        data,
+        columns,
+        on_conflict_options,
+        None
+    )
+
+    # An empty generator passes the check above, and leaves the cursor's rowcount stale
+    if not insert_query.vars:
+        return 0
+
+    timer = execute_insert_query(cursor, dataclass_type, insert_query)
+
+    if timer:
+        timer.finish('rows', size=cursor.rowcount)
+
+    return cursor.rowcount
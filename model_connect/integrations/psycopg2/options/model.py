@@ -3,14 +3,16 @@ from typing import TypeVar, TYPE_CHECKING
 
 from model_connect.constants import UNDEFINED, coalesce
 from model_connect.integrations.base import BaseIntegrationModel
+from model_connect.integrations.psycopg2.schema import Psycopg2ModelSchema, compile_psycopg2_schema
 
 if TYPE_CHECKING:
     from model_connect.options import ConnectOptions
+    from model_connect.schema import ModelSchema
 
 _T = TypeVar('_T')
 
 
-@dataclass
+@dataclass(slots=True)
 class Psycopg2Model(BaseIntegrationModel):
     tablename: str = UNDEFINED
 
@@ -31,3 +33,14 @@ class Psycopg2Model(BaseIntegrationModel):
             self._connect_options.model.name_plural_snake_case,
             self._connect_options.model.name_single_snake_case
         )
+
+    def compile(self, connect_options: 'ConnectOptions') -> 'Psycopg2ModelSchema':
+        return compile_psycopg2_schema(
+            self,
+            connect_options
+        )
+
+    def warmup(self, schema: 'ModelSchema'):
+        from model_connect.integrations.psycopg2.warmup import warmup_schema
+
+        warmup_schema(schema)
@@ -1,12 +1,12 @@
 from dataclasses import dataclass, is_dataclass
-from typing import Callable, Any
+from typing import Callable, Any, Sequence
 
 from model_connect.constants import UNDEFINED, coalesce
 from model_connect.integrations.base import BaseIntegrationModelField
 from model_connect.options import ConnectOptions, ModelField
 
 
-@dataclass
+@dataclass(slots=True)
 class Psycopg2ModelField(BaseIntegrationModelField):
     can_filter: bool = UNDEFINED
     can_sort: bool = UNDEFINED
@@ -15,10 +15,12 @@ class Psycopg2ModelField(BaseIntegrationModelField):
     has_unique_constraint: bool = UNDEFINED
     include_in_insert: bool = UNDEFINED
     include_in_select: bool = UNDEFINED
+    include_in_update: bool = UNDEFINED
     include_in_on_conflict_targets: bool = UNDEFINED
     include_in_on_conflict_update: bool = UNDEFINED
     encoder: Callable[['Psycopg2ModelField', Any], Any] = UNDEFINED
     decoder: Callable[['Psycopg2ModelField', Any], Any] = UNDEFINED
+    batch_decoder: Callable[['Psycopg2ModelField', list], Sequence] = UNDEFINED
 
     _connect_options: 'ConnectOptions' = None
     _model_field: 'ModelField' = None
@@ -60,6 +62,11 @@ class Psycopg2ModelField(BaseIntegrationModelField):
             None
         )
 
+        self.batch_decoder = coalesce(
+            self.batch_decoder,
+            None
+        )
+
         self.encoder = coalesce(
             self.encoder,
             None
@@ -94,6 +101,22 @@ class Psycopg2ModelField(BaseIntegrationModelField):
             include_in_select
         )
 
+        include_in_update = True
+
+        if not model_field.is_db_column:
+            include_in_update = False
+
+        elif model_field.is_identifier:
+            include_in_update = False
+
+        elif is_dataclass(model_field.inferred_type):
+            include_in_update = False
+
+        self.include_in_update = coalesce(
+            self.include_in_update,
+            include_in_update
+        )
+
         include_in_on_conflict_targets = False
 
         if not model_field.is_db_column:
@@ -0,0 +1,30 @@
+from contextlib import contextmanager
+from typing import Generator
+
+from psycopg2.extensions import connection as Connection
+from psycopg2.extras import DictCursor
+from psycopg2.pool import AbstractConnectionPool
+
+
+@contextmanager
+def pooled_connection(pool: AbstractConnectionPool) -> Generator[Connection, None, None]:
+    connection = pool.getconn()
+
+    try:
+        yield connection
+        connection.commit()
+    except BaseException:
+        connection.rollback()
+        raise
+    finally:
+        pool.putconn(connection)
+
+
+@contextmanager
+def pooled_cursor(
+        pool: AbstractConnectionPool,
+        cursor_factory: type = DictCursor
+) -> Generator[DictCursor, None, None]:
+    with pooled_connection(pool) as connection:
+        with connection.cursor(cursor_factory=cursor_factory) as cursor:
+            yield cursor
@@ -0,0 +1,114 @@
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Mapping
+
+from model_connect.schema import get_ordered_model_fields
+
+if TYPE_CHECKING:
+    from model_connect.integrations.psycopg2 import Psycopg2Model, Psycopg2ModelField
+    from model_connect.options import ConnectOptions
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class Psycopg2ModelSchema:
+    tablename: str
+    fields: tuple['Psycopg2ModelField', ...]
+    fields_by_name: Mapping[str, 'Psycopg2ModelField']
+    column_indexes: Mapping[str, int]
+    select_columns: tuple[str, ...]
+    insert_fields: tuple['Psycopg2ModelField', ...]
+    insert_columns: tuple[str, ...]
+    update_fields: tuple['Psycopg2ModelField', ...]
+    decode_fields: tuple['Psycopg2ModelField', ...]
+    batch_decode_fields: tuple['Psycopg2ModelField', ...]
+    required_on_init_columns: tuple[str, ...]
+    identifier_columns: tuple[str, ...]
+    on_conflict_targets: tuple[str, ...]
+    on_conflict_update_columns: tuple[str, ...]
+
+
+def compile_psycopg2_schema(
+        model: 'Psycopg2Model',
+        options: 'ConnectOptions'
+) -> Psycopg2ModelSchema:
+    fields = tuple(
+        model_field.integrations['psycopg2'] for
+        model_field in
+        get_ordered_model_fields(options)
+    )
+
+    insert_fields = tuple(
+        field for
+        field in
+        fields if
+        field.include_in_insert
+    )
+
+    return Psycopg2ModelSchema(
+        tablename=model.tablename,
+        fields=fields,
+        fields_by_name=MappingProxyType({
+            field.model_field.name: field for
+            field in
+            fields
+        }),
+        column_indexes=MappingProxyType({
+            field.column_name: index for
+            index, field in
+            enumerate(fields)
+        }),
+        select_columns=tuple(
+            field.column_name for
+            field in
+            fields if
+            field.include_in_select
+        ),
+        insert_fields=insert_fields,
+        insert_columns=tuple(
+            field.column_name for
+            field in
+            insert_fields
+        ),
+        update_fields=tuple(
+            field for
+            field in
+            fields if
+            field.include_in_update
+        ),
+        decode_fields=tuple(
+            field for
+            field in
+            fields if
+            field.decoder and not field.batch_decoder
+        ),
+        batch_decode_fields=tuple(
+            field for
+            field in
+            fields if
+            field.batch_decoder
+        ),
+        required_on_init_columns=tuple(
+            field.column_name for
+            field in
+            fields if
+            field.model_field.is_required_on_init
+        ),
+        identifier_columns=tuple(
+            field.column_name for
+            field in
+            fields if
+            field.model_field.is_identifier and field.model_field.is_db_column
+        ),
+        on_conflict_targets=tuple(
+            field.column_name for
+            field in
+            fields if
+            field.include_in_on_conflict_targets
+        ),
+        on_conflict_update_columns=tuple(
+            field.column_name for
+            field in
+            fields if
+            field.include_in_on_conflict_update
+        )
+    )
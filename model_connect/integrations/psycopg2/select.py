@@ -1,50 +1,164 @@
 from dataclasses import dataclass, field as dataclass_field
-from functools import cache
+from functools import cache, lru_cache
 from typing import Any, TypeVar
 
 from jinja2 import Template
 from psycopg2.extras import DictCursor
 
-from model_connect import registry
 from model_connect.integrations.psycopg2.common.processing import (
     process_filter_options,
     process_sort_options,
     process_pagination_options, process_group_by_options
 )
-from model_connect.integrations.psycopg2.common.streaming import (
-    stream_to_dataclass_type,
-    stream_from_cursor
-)
-from model_connect.registry import get_model
+from model_connect.hooks import start_timer
+from model_connect.integrations.psycopg2.common.streaming import stream_decoded_rows
+from model_connect.registry import get_schema
 
 _T = TypeVar('_T')
 
 
+SELECT_TEMPLATE = '''
+        SELECT
+            {%- for column in columns %}
+            {{ column }}
+            {%- if not loop.last %}
+            ,
+            {%- endif %}
+            {%- endfor %}
+
+        FROM
+            {{ tablename }}
+
+        {%- if filter_options %}
+            WHERE
+            {%- for filter in filter_options %}
+            {{ filter.column }} {{ filter.operator }} %s
+            {%- if not loop.last %}
+            AND
+            {%- endif %}
+            {%- endfor %}
+        {%- endif %}
+
+        {%- if group_by_options %}
+            GROUP BY
+            {%- for option in group_by_options %}
+            {{ option }}
+            {%- if not loop.last %}
+            ,
+            {%- endif %}
+            {%- endfor %}
+        {%- endif %}
+
+        {%- if sort_options %}
+            ORDER BY
+            {%- for option in sort_options %}
+            {{ option.column }} {{ option.direction }}
+            {%- if not loop.last -%}
+            ,
+            {%- endif -%}
+            {%- endfor %}
+        {%- endif %}
+
+        {%- if pagination_options.limit is not none %}
+            LIMIT %s
+        {%- endif %}
+
+        {%- if pagination_options.skip is not none %}
+            OFFSET %s
+        {%- endif %}
+        '''
+
+SELECT_COUNT_TEMPLATE = '''
+    SELECT
+        COUNT(*)
+    FROM
+        {{ tablename }}
+
+    {%- if filter_options %}
+        WHERE
+        {%- for filter in filter_options %}
+        {{ filter.column }} {{ filter.operator }} %s
+        {%- if not loop.last %}
+        AND
+        {%- endif %}
+        {%- endfor %}
+    {%- endif %}
+    '''
+
+
 @dataclass
 class SelectSQL:
     sql: str
     vars: list[Any] = dataclass_field(
         default_factory=list
     )
+    filter_columns: tuple[str, ...] = ()
+    sort_columns: tuple[tuple[str, str], ...] = ()
+    group_by_columns: tuple[str, ...] = ()
 
 
 @cache
-def generate_select_columns(model_class: type[_T]) -> list[str]:
-    columns = []
+def get_select_template() -> Template:
+    return Template(SELECT_TEMPLATE)
+
 
-    model_fields = registry.get(model_class).model_fields.values()
+@cache
+def get_select_count_template() -> Template:
+    return Template(SELECT_COUNT_TEMPLATE)
+
+
+@lru_cache(maxsize=4096)
+def render_select_sql(
+        tablename: str,
+        columns: tuple[str, ...],
+        filters: tuple[tuple[str, str], ...] = (),
+        group_by: tuple[str, ...] = (),
+        sorts: tuple[tuple[str, str], ...] = (),
+        has_limit: bool = False,
+        has_skip: bool = False
+) -> str:
+    sql = get_select_template().render(
+        columns=columns,
+        tablename=tablename,
+        filter_options=[
+            {'column': column, 'operator': operator} for
+            column, operator in
+            filters
+        ],
+        sort_options=[
+            {'column': column, 'direction': direction} for
+            column, direction in
+            sorts
+        ],
+        pagination_options={
+            'limit': 0 if has_limit else None,
+            'skip': 0 if has_skip else None
+        },
+        group_by_options=group_by
+    )
 
-    for model_field in model_fields:
-        model_field = model_field.integrations.get('psycopg2')
+    return ' '.join(sql.split())
+
+
+@lru_cache(maxsize=1024)
+def render_select_count_sql(
+        tablename: str,
+        filters: tuple[tuple[str, str], ...] = ()
+) -> str:
+    sql = get_select_count_template().render(
+        tablename=tablename,
+        filter_options=[
+            {'column': column, 'operator': operator} for
+            column, operator in
+            filters
+        ]
+    )
 
-        if not model_field.include_in_select:
-            continue
+    return ' '.join(sql.split())
 
-        columns.append(
-            model_field.column_name
-        )
 
-    return columns
+def generate_select_columns(model_class: type[_T]) -> tuple[str, ...]:
+    return get_schema(model_class, 'psycopg2').select_columns
 
 
 def create_select_query(
@@ -57,7 +171,9 @@ def create_select_query(
 ) -> SelectSQL:
     vars_ = []
 
-    model = get_model(dataclass_type, 'psycopg2')
+    schema = get_schema(dataclass_type, 'psycopg2')
+
+    timer = start_timer('select', dataclass_type)
 
     if columns is None:
         columns = generate_select_columns(
@@ -85,74 +201,36 @@ def create_select_query(
         group_by_options
     )
 
-    template = Template('''
-        SELECT
-            {%- for column in columns %}
-            {{ column }}
-            {%- if not loop.last %}
-            ,
-            {%- endif %}
-            {%- endfor %}
-
-        FROM
-            {{ tablename }}
-
-        {%- if filter_options %}
-            WHERE
-            {%- for filter in filter_options %}
-            {{ filter.column }} {{ filter.operator }} %s
-            {%- if not loop.last %}
-            AND
-            {%- endif %}
-            {%- endfor %}
-        {%- endif %}
-        
-        {%- if group_by_options %}
-            GROUP BY
-            {%- for option in group_by_options %}
-            {{ option }}
-            {%- if not loop.last %}
-            ,
-            {%- endif %}
-            {%- endfor %}
-        {%- endif %}
-
-        {%- if sort_options %}
-            ORDER BY
-            {%- for option in sort_options %}
-            {{ option.column }} {{ option.direction }}
-            {%- if not loop.last -%}
-            ,
-            {%- endif -%}
-            {%- endfor %}
-        {%- endif %}
-
-        {%- if pagination_options.limit %}
-            LIMIT %s
-        {%- endif %}
-
-        {%- if pagination_options.offset %}
-            OFFSET %s
-        {%- endif %}
-        ''')
-
-    sql = template.render(
-        columns=columns,
-        tablename=model.tablename,
-        filter_options=filter_options,
-        sort_options=sort_options,
-        pagination_options=pagination_options,
-        group_by_options=group_by_options
+    if timer:
+        timer.mark('process_options')
+
+    filters = tuple((option.column, option.operator) for option in filter_options)
+    sorts = tuple((option.column, option.direction) for option in sort_options)
+    group_by = tuple(group_by_options)
+
+    sql = render_select_sql(
+        schema.tablename,
+        tuple(columns),
+        filters,
+        group_by,
+        sorts,
+        pagination_options.limit is not None,
+        pagination_options.skip is not None
     )
 
-    sql = ' '.join(sql.split())
-    sql = sql.strip()
-
-    return SelectSQL(
+    query = SelectSQL(
         sql,
-        vars_
+        vars_,
+        tuple(column for column, _ in filters),
+        sorts,
+        group_by
     )
 
+    if timer:
+        timer.mark('render', query=query)
+
+    return query
+
 
 def create_select_count_query(
         dataclass_type: type[_T],
@@ -160,44 +238,37 @@ def create_select_count_query(
 ):
     vars_ = []
 
+    timer = start_timer('select_count', dataclass_type)
+
     filter_options = process_filter_options(
         dataclass_type,
         filter_options,
         vars_
     )
 
-    model = get_model(dataclass_type, 'psycopg2')
+    if timer:
+        timer.mark('process_options')
 
-    template = Template('''
-    SELECT
-        COUNT(*)
-    FROM
-        {{ tablename }}
-        
-    {%- if filter_options %}
-        WHERE
-        {%- for filter in filter_options %}
-        {{ filter.column }} {{ filter.operator }} %s
-        {%- if not loop.last %}
-        AND
-        {%- endif %}
-        {%- endfor %}
-    {%- endif %}
-    ''')
+    schema = get_schema(dataclass_type, 'psycopg2')
 
-    sql = template.render(
-        tablename=model.tablename,
-        filter_options=filter_options
-    )
+    filters = tuple((option.column, option.operator) for option in filter_options)
 
-    sql = ' '.join(sql.split())
-    sql = sql.strip()
+    sql = render_select_count_sql(
+        schema.tablename,
+        filters
+    )
 
-    return SelectSQL(
+    query = SelectSQL(
         sql,
-        vars_
+        vars_,
+        tuple(column for column, _ in filters)
     )
 
+    if timer:
+        timer.mark('render', query=query)
+
+    return query
+
 
 def stream_select(
         cursor: DictCursor,
@@ -218,10 +289,14 @@ def stream_select(
         group_by_options
     )
 
+    timer = start_timer('select', dataclass_type)
+
     cursor.execute(query.sql, query.vars)
 
-    results = stream_from_cursor(cursor, chunk_size)
-    results = stream_to_dataclass_type(results, dataclass_type)
+    if timer:
+        timer.mark('execute', query=query)
+
+    results = stream_decoded_rows(cursor, dataclass_type, chunk_size, timer)
 
     for result in results:
         yield result
@@ -237,9 +312,20 @@ def select_count(
         filter_options
     )
 
+    timer = start_timer('select_count', dataclass_type)
+
     cursor.execute(
         query.sql,
         query.vars
     )
 
-    return cursor.fetchone()[0]
+    if timer:
+        timer.mark('execute', query=query)
+
+    result = cursor.fetchone()[0]
+
+    if timer:
+        timer.mark('fetch', size=1)
+        timer.finish('rows', size=1)
+
+    return result
@@ -0,0 +1,190 @@
+from dataclasses import dataclass, is_dataclass
+from functools import cache
+from graphlib import CycleError, TopologicalSorter
+from typing import Any, Iterable, Optional, TypeVar
+
+from psycopg2.extras import DictCursor
+
+from model_connect import registry
+from model_connect.integrations.psycopg2.insert import insert_count, stream_insert
+from model_connect.schema import ModelSchema
+
+_T = TypeVar('_T')
+
+
+@dataclass(frozen=True, slots=True)
+class Dependency:
+    field_name: str
+    dataclass_type: type
+    identifier_name: str
+    foreign_key_name: Optional[str]
+
+
+@dataclass(slots=True)
+class SessionStats:
+    flushes: int = 0
+    statements: int = 0
+    rows: int = 0
+
+
+@cache
+def compile_dependencies(schema: ModelSchema) -> tuple[Dependency, ...]:
+    """
+    A model depends on the connected models it nests as fields (e.g. `author: Person`). When it
+    also has a `<field>_<identifier>` field (e.g. `author_id`), that field is filled from the
+    nested item's identifier once the nested item is flushed.
+    """
+    result = []
+
+    for model_field in schema.model_fields.values():
+        dataclass_type = model_field.inferred_type
+
+        if not is_dataclass(dataclass_type) or not registry.has(dataclass_type):
+            continue
+
+        identifier_names = registry.get_schema(dataclass_type).identifier_names
+
+        if len(identifier_names) != 1:
+            continue
+
+        foreign_key_name = f'{model_field.name}_{identifier_names[0]}'
+
+        result.append(
+            Dependency(
+                field_name=model_field.name,
+                dataclass_type=dataclass_type,
+                identifier_name=identifier_names[0],
+                foreign_key_name=foreign_key_name if foreign_key_name in schema.field_indexes else None
+            )
+        )
+
+    return tuple(result)
+
+
+class Session:
+    """
+    Unit of work that buffers inserts per dataclass and writes each buffer with a single
+    statement, on flush(), commit() or once a buffer reaches flush_threshold items.
+
+    Buffers are flushed in dependency order (see compile_dependencies), and the identifiers
+    returned by the database are set on the buffered items, which must therefore be mutable.
+    A model nesting its own type is written in one statement, so only nested items flushed
+    before fill its foreign key; models nesting each other cannot be ordered.
+    """
+
+    def __init__(self, cursor: DictCursor, flush_threshold: int = 1000):
+        self.cursor = cursor
+        self.flush_threshold = flush_threshold
+        self.stats = SessionStats()
+        self._inserts: dict[type, list] = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+
+    def __len__(self):
+        return sum(len(items) for items in self._inserts.values())
+
+    def add(self, item: Any):
+        dataclass_type = type(item)
+        items = self._inserts.setdefault(dataclass_type, [])
+        items.append(item)
+
+        if len(items) >= self.flush_threshold:
+            self.flush(dataclass_type)
+
+    def add_all(self, items: Iterable[Any]):
+        for item in items:
+            self.add(item)
+
+    def get_flush_order(self, dataclass_types: Iterable[type]) -> list[type]:
+        graph = {}
+        pending = list(dataclass_types)
+
+        while pending:
+            dataclass_type = pending.pop()
+
+            if dataclass_type in graph:
+                continue
+
+            graph[dataclass_type] = {
+                dependency.dataclass_type for
+                dependency in
+                compile_dependencies(registry.get_schema(dataclass_type)) if
+                dependency.dataclass_type is not dataclass_type
+            }
+
+            pending.extend(graph[dataclass_type])
+
+        try:
+            return list(TopologicalSorter(graph).static_order())
+        except CycleError as e:
+            names = ' -> '.join(dataclass_type.__name__ for dataclass_type in e.args[1])
+
+            raise ValueError(f'Cannot order the inserts of models that depend on each other: {names}')
+
+    def flush(self, dataclass_type: type = None):
+        """
+        Writes the buffered inserts of the dataclass type (and of the types it depends on),
+        or of every type when none is given.
+        """
+        if dataclass_type is None:
+            dataclass_types = list(self._inserts)
+        else:
+            dataclass_types = [dataclass_type]
+
+        self.stats.flushes += 1
+
+        for dataclass_type in self.get_flush_order(dataclass_types):
+            items = self._inserts.pop(dataclass_type, None)
+
+            if items:
+                self.insert(dataclass_type, items)
+
+    def insert(self, dataclass_type: type[_T], items: list[_T]):
+        schema = registry.get_schema(dataclass_type)
+
+        for dependency in compile_dependencies(schema):
+            if dependency.foreign_key_name is None:
+                continue
+
+            for item in items:
+                nested = getattr(item, dependency.field_name)
+
+                if nested is not None and getattr(item, dependency.foreign_key_name) is None:
+                    setattr(
+                        item,
+                        dependency.foreign_key_name,
+                        getattr(nested, dependency.identifier_name)
+                    )
+
+        identifier_names = schema.identifier_names
+
+        if not identifier_names:
+            insert_count(self.cursor, dataclass_type, items)
+        else:
+            # Rows are returned in the order of the VALUES list, one per item
+            identifiers = stream_insert(self.cursor, dataclass_type, items, returning='identifiers')
+
+            for item, identifier in zip(items, identifiers, strict=True):
+                if len(identifier_names) == 1:
+                    identifier = (identifier,)
+
+                for name, value in zip(identifier_names, identifier, strict=True):
+                    setattr(item, name, value)
+
+        self.stats.statements += 1
+        self.stats.rows += len(items)
+
+    def commit(self):
+        self.flush()
+        self.cursor.connection.commit()
+
+    def rollback(self):
+        self._inserts.clear()
+        self.cursor.connection.rollback()
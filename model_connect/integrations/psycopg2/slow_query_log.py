@@ -0,0 +1,128 @@
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Any, Callable, Optional
+
+from psycopg2.extensions import connection as Connection
+
+from model_connect.hooks import HookEvent, QueryRecorder
+
+
+@dataclass(slots=True)
+class SlowQuery:
+    dataclass_type: type
+    operation: str
+    sql: str
+    vars: list
+    duration: float
+    rows: Optional[int]
+    recorded_at: float = field(
+        default_factory=time.time
+    )
+    explain: Optional[list[str]] = None
+    explain_error: Optional[str] = None
+
+
+def redact_all(dataclass_type: type, sql: str, vars_: list) -> list:
+    return ['?'] * len(vars_)
+
+
+class SlowQueryLog(QueryRecorder):
+    """
+    Records queries whose database time (execute plus every fetch) exceeds the threshold.
+
+    Entries are kept in a bounded ring buffer and passed to the sink, if any. When an explain
+    connection factory is given, select queries are re-run with EXPLAIN on a connection from
+    it (in a background thread), which is rolled back and closed afterwards.
+    """
+
+    def __init__(
+            self,
+            threshold: float = 0.5,
+            max_entries: int = 100,
+            redact: Callable[[type, str, list], list] = None,
+            sink: Callable[[SlowQuery], Any] = None,
+            explain_connection_factory: Callable[[], Connection] = None,
+            explain_analyze: bool = True,
+            explain_operations: tuple[str, ...] = ('select', 'select_count'),
+            dataclass_type: type = None
+    ):
+        super().__init__(dataclass_type)
+
+        self.threshold = threshold
+        self.entries: deque[SlowQuery] = deque(maxlen=max_entries)
+        self.redact = redact
+        self.sink = sink
+        self.explain_connection_factory = explain_connection_factory
+        self.explain_analyze = explain_analyze
+        self.explain_operations = explain_operations
+        self._lock = Lock()
+        self._executor = None
+
+    def stop(self, wait: bool = True):
+        super().stop()
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+    def record(self, event: HookEvent, durations: dict[str, float]):
+        duration = durations.get('execute', 0.0) + durations.get('fetch', 0.0)
+
+        if duration < self.threshold:
+            return
+
+        vars_ = list(event.query.vars)
+
+        if self.redact is not None:
+            vars_ = self.redact(event.dataclass_type, event.query.sql, vars_)
+
+        entry = SlowQuery(
+            dataclass_type=event.dataclass_type,
+            operation=event.operation,
+            sql=event.query.sql,
+            vars=vars_,
+            duration=duration,
+            rows=event.size
+        )
+
+        self.entries.append(entry)
+
+        if self.explain_connection_factory is None or event.operation not in self.explain_operations:
+            self.emit(entry)
+            return
+
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1)
+
+            executor = self._executor
+
+        executor.submit(self.explain, entry, event.query.sql, list(event.query.vars))
+
+    def explain(self, entry: SlowQuery, sql: str, vars_: list):
+        options = 'ANALYZE, BUFFERS' if self.explain_analyze else 'COSTS'
+
+        try:
+            connection = self.explain_connection_factory()
+
+            try:
+                with connection.cursor() as cursor:
+                    cursor.execute(f'EXPLAIN ({options}) {sql}', vars_)
+                    entry.explain = [row[0] for row in cursor.fetchall()]
+            finally:
+                connection.rollback()
+                connection.close()
+        except Exception as e:
+            entry.explain_error = f'{type(e).__name__}: {e}'
+
+        self.emit(entry)
+
+    def emit(self, entry: SlowQuery):
+        if self.sink is not None:
+            self.sink(entry)
+
+    def clear(self):
+        self.entries.clear()
@@ -0,0 +1,152 @@
+import hashlib
+from collections import deque
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Any, Callable, Iterable
+
+from model_connect.hooks import HookEvent, QueryRecorder
+
+
+def fingerprint_sql(sql: str) -> str:
+    # Values are always bound as parameters, so the rendered SQL already is the normalized shape
+    return hashlib.sha1(' '.join(sql.split()).encode()).hexdigest()[:16]
+
+
+def percentile(values: Iterable[float], p: float) -> float:
+    values = sorted(values)
+
+    if not values:
+        return 0.0
+
+    index = min(len(values) - 1, max(0, round(p / 100 * (len(values) - 1))))
+
+    return values[index]
+
+
+@dataclass(slots=True)
+class QueryStats:
+    dataclass_type: type
+    operation: str
+    fingerprint: str
+    sql: str
+    filter_columns: tuple[str, ...] = ()
+    sort_columns: tuple[tuple[str, str], ...] = ()
+    group_by_columns: tuple[str, ...] = ()
+    calls: int = 0
+    rows: int = 0
+    total_duration: float = 0.0
+    total_decode_duration: float = 0.0
+    max_duration: float = 0.0
+    durations: deque = field(
+        default_factory=lambda: deque(maxlen=1024)
+    )
+
+    @property
+    def mean_duration(self) -> float:
+        return self.total_duration / self.calls if self.calls else 0.0
+
+    def percentile(self, p: float) -> float:
+        return percentile(self.durations, p)
+
+    def add(self, duration: float, decode_duration: float, rows: int):
+        self.calls += 1
+        self.rows += rows or 0
+        self.total_duration += duration
+        self.total_decode_duration += decode_duration
+        self.max_duration = max(self.max_duration, duration)
+        self.durations.append(duration)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            'model': self.dataclass_type.__name__,
+            'operation': self.operation,
+            'fingerprint': self.fingerprint,
+            'sql': self.sql,
+            'filter_columns': list(self.filter_columns),
+            'sort_columns': [list(option) for option in self.sort_columns],
+            'group_by_columns': list(self.group_by_columns),
+            'calls': self.calls,
+            'rows': self.rows,
+            'total_duration': self.total_duration,
+            'total_decode_duration': self.total_decode_duration,
+            'mean_duration': self.mean_duration,
+            'p50_duration': self.percentile(50),
+            'p95_duration': self.percentile(95),
+            'p99_duration': self.percentile(99),
+            'max_duration': self.max_duration
+        }
+
+
+class QueryStatsCollector(QueryRecorder):
+    """
+    Counts calls, rows and database time (execute plus every fetch) per query shape and
+    dataclass. Percentiles are computed over the last `window` calls of each shape.
+    """
+
+    def __init__(self, window: int = 1024, dataclass_type: type = None):
+        super().__init__(dataclass_type)
+
+        self.window = window
+        self.stats: dict[tuple[type, str, str], QueryStats] = {}
+        self._lock = Lock()
+
+    def record(self, event: HookEvent, durations: dict[str, float]):
+        query = event.query
+        key = (event.dataclass_type, event.operation, query.sql)
+
+        with self._lock:
+            stats = self.stats.get(key)
+
+            if stats is None:
+                stats = self.stats[key] = QueryStats(
+                    dataclass_type=event.dataclass_type,
+                    operation=event.operation,
+                    fingerprint=fingerprint_sql(query.sql),
+                    sql=query.sql,
+                    filter_columns=getattr(query, 'filter_columns', ()),
+                    sort_columns=getattr(query, 'sort_columns', ()),
+                    group_by_columns=getattr(query, 'group_by_columns', ()),
+                    durations=deque(maxlen=self.window)
+                )
+
+            stats.add(
+                durations.get('execute', 0.0) + durations.get('fetch', 0.0),
+                durations.get('decode', 0.0),
+                event.size
+            )
+
+    def get_stats(self, dataclass_type: type = None) -> list[QueryStats]:
+        with self._lock:
+            stats = list(self.stats.values())
+
+        if dataclass_type is not None:
+            stats = [s for s in stats if s.dataclass_type is dataclass_type]
+
+        return sorted(
+            stats,
+            key=lambda s: s.total_duration,
+            reverse=True
+        )
+
+    def report(self, dataclass_type: type = None, limit: int = 20) -> str:
+        lines = [
+            f'{"model":<20} {"operation":<12} {"calls":>8} {"rows":>10} '
+            f'{"total ms":>10} {"p50 ms":>8} {"p95 ms":>8} {"p99 ms":>8}  sql'
+        ]
+
+        for stats in self.get_stats(dataclass_type)[:limit]:
+            lines.append(
+                f'{stats.dataclass_type.__name__:<20} {stats.operation:<12} {stats.calls:>8} {stats.rows:>10} '
+                f'{stats.total_duration * 1000:>10.1f} {stats.percentile(50) * 1000:>8.2f} '
+                f'{stats.percentile(95) * 1000:>8.2f} {stats.percentile(99) * 1000:>8.2f}  {stats.sql}'
+            )
+
+        return '\n'.join(lines)
+
+    def export(self, sink: Callable[[dict[str, Any]], Any], dataclass_type: type = None):
+        for stats in self.get_stats(dataclass_type):
+            sink(stats.to_dict())
+
+    def reset(self):
+        with self._lock:
+            self.stats.clear()
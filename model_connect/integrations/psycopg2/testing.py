@@ -0,0 +1,895 @@
+"""
+In-memory stand-ins for psycopg2 connections, cursors and pools.
+
+They understand the SQL this library generates (select, count, insert with execute_values or
+from a select, on conflict, update, delete, returning, COPY and temporary staging tables), so
+the library's own overhead and its behavior under simulated network latency can be measured
+without a live Postgres:
+
+    connection = FakeConnection(latency=0.002)
+    connection.create_table('people', [{'name': 'bob'}])
+
+    with connection.cursor() as cursor:
+        people = list(stream_select(cursor, Person))
+
+Values are compared as plain python objects; there are no column types, constraints
+(other than ON CONFLICT targets) or transaction isolation between cursors.
+"""
+import csv
+import io
+import re
+import time
+from collections import namedtuple
+from itertools import count
+from threading import RLock
+from typing import Any, Callable, Iterable, Optional
+
+from psycopg2 import ProgrammingError
+from psycopg2.extras import RealDictCursor
+
+Column = namedtuple(
+    'Column',
+    ['name', 'type_code', 'display_size', 'internal_size', 'precision', 'scale', 'null_ok']
+)
+
+COPY_TEXT_ESCAPES = {'t': '\t', 'n': '\n', 'r': '\r', 'b': '\b', 'f': '\f', 'v': '\v'}
+
+MOGRIFY_TOKEN = re.compile(r'__fake_mogrify_(\d+)__')
+
+SELECT_PATTERN = re.compile(
+    r'^SELECT (?P<columns>.+?) FROM (?P<table>\w+)'
+    r'(?: WHERE (?P<where>.+?))?'
+    r'(?: GROUP BY (?P<group_by>.+?))?'
+    r'(?: ORDER BY (?P<order_by>.+?))?'
+    r'(?: LIMIT (?P<limit>%s|\d+))?'
+    r'(?: OFFSET (?P<offset>%s|\d+))?$',
+    re.IGNORECASE
+)
+
+INSERT_PATTERN = re.compile(
+    r'^INSERT INTO (?P<table>\w+) ?\((?P<columns>[^)]*)\) (?:VALUES (?P<values>.+?)|(?P<query>SELECT .+? FROM \w+))'
+    r'(?: ON CONFLICT ?\((?P<targets>[^)]*)\) DO (?P<do>NOTHING|UPDATE SET (?P<set>.+?)))?'
+    r'(?: RETURNING (?P<returning>.+))?$',
+    re.IGNORECASE
+)
+
+UPDATE_PATTERN = re.compile(
+    r'^UPDATE (?P<table>\w+) SET (?P<set>.+?)'
+    r'(?: WHERE (?P<where>.+?))?'
+    r'(?: RETURNING (?P<returning>.+))?$',
+    re.IGNORECASE
+)
+
+DELETE_PATTERN = re.compile(
+    r'^DELETE FROM (?P<table>\w+)'
+    r'(?: WHERE (?P<where>.+?))?'
+    r'(?: RETURNING (?P<returning>.+))?$',
+    re.IGNORECASE
+)
+
+CREATE_TABLE_AS_PATTERN = re.compile(
+    r'^CREATE TEMP(?:ORARY)? TABLE (?P<table>\w+) AS SELECT (?P<columns>.+?) FROM (?P<source>\w+) WITH NO DATA$',
+    re.IGNORECASE
+)
+
+TRUNCATE_PATTERN = re.compile(
+    r'^TRUNCATE (?:TABLE )?(?P<table>\w+)$',
+    re.IGNORECASE
+)
+
+DROP_TABLE_PATTERN = re.compile(
+    r'^DROP TABLE (?P<if_exists>IF EXISTS )?(?P<table>\w+)$',
+    re.IGNORECASE
+)
+
+CONDITION_PATTERN = re.compile(
+    r'^(?P<column>\w+) (?P<operator>NOT ILIKE|NOT LIKE|ILIKE|LIKE|NOT IN|IN|IS NOT|IS|<>|!=|<=|>=|=|<|>) %s$',
+    re.IGNORECASE
+)
+
+COPY_TO_PATTERN = re.compile(
+    r'^COPY \((?P<query>.+)\) TO STDOUT(?: WITH)?(?P<options>.*)$',
+    re.IGNORECASE
+)
+
+COPY_FROM_PATTERN = re.compile(
+    r'^COPY (?P<table>\w+) ?(?:\((?P<columns>[^)]*)\))? FROM STDIN(?: WITH)?(?P<options>.*)$',
+    re.IGNORECASE
+)
+
+
+class FakeRow(list):
+    """
+    Behaves like psycopg2's DictRow: indexable by position and by column name.
+    """
+    __slots__ = ('_index',)
+
+    def __init__(self, index: dict[str, int], values: Iterable):
+        super().__init__(values)
+        self._index = index
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            key = self._index[key]
+
+        return super().__getitem__(key)
+
+    def __contains__(self, key):
+        return key in self._index
+
+    def keys(self):
+        return iter(self._index)
+
+    def values(self):
+        return iter(self)
+
+    def items(self):
+        return zip(self._index, self)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except (KeyError, IndexError):
+            return default
+
+
+class FakeTable:
+    def __init__(
+            self,
+            name: str,
+            rows: Iterable[dict] = (),
+            columns: Iterable[str] = None,
+            serial: Optional[str] = 'id'
+    ):
+        self.name = name
+        self.columns = list(columns) if columns else None
+        self.serial = serial
+        self.next_serial = 1
+        self.rows: list[dict] = []
+
+        for row in rows:
+            self.insert(row)
+
+    def create_row(self, row: dict) -> dict:
+        if self.columns:
+            row = {
+                **{column: row.get(column) for column in self.columns},
+                **row
+            }
+
+        if self.serial is None:
+            return dict(row)
+
+        value = row.get(self.serial)
+
+        if value is None:
+            value = self.next_serial
+            self.next_serial += 1
+        elif isinstance(value, int):
+            self.next_serial = max(self.next_serial, value + 1)
+
+        return {self.serial: value, **{k: v for k, v in row.items() if k != self.serial}}
+
+    def insert(self, row: dict) -> dict:
+        row = self.create_row(row)
+        self.rows.append(row)
+        return row
+
+
+def compile_like(pattern: str, ignore_case: bool) -> re.Pattern:
+    regex = ''.join(
+        '.*' if char == '%' else
+        '.' if char == '_' else
+        re.escape(char)
+        for char in pattern
+    )
+
+    return re.compile(f'^{regex}$', re.DOTALL | (re.IGNORECASE if ignore_case else 0))
+
+
+def compile_condition(operator: str, value: Any) -> Callable[[Any], bool]:
+    operator = operator.upper()
+
+    if operator == 'IS':
+        return lambda x: x is value
+    if operator == 'IS NOT':
+        return lambda x: x is not value
+    if operator == 'IN':
+        values = tuple(value)
+        return lambda x: x is not None and x in values
+    if operator == 'NOT IN':
+        values = tuple(value)
+        return lambda x: x is not None and x not in values
+
+    if value is None:
+        return lambda x: False
+
+    if operator in ('LIKE', 'ILIKE', 'NOT LIKE', 'NOT ILIKE'):
+        regex = compile_like(value, 'ILIKE' in operator)
+        negate = operator.startswith('NOT')
+        return lambda x: x is not None and bool(regex.match(str(x))) != negate
+
+    comparisons = {
+        '=': lambda x: x == value,
+        '!=': lambda x: x != value,
+        '<>': lambda x: x != value,
+        '<': lambda x: x < value,
+        '<=': lambda x: x <= value,
+        '>': lambda x: x > value,
+        '>=': lambda x: x >= value,
+    }
+
+    comparison = comparisons[operator]
+
+    return lambda x: x is not None and comparison(x)
+
+
+def split_list(value: str) -> list[str]:
+    return [
+        item.strip() for
+        item in
+        value.split(',') if
+        item.strip()
+    ]
+
+
+def unescape_copy_text(value: str) -> Optional[str]:
+    if value == '\\N':
+        return None
+
+    if '\\' not in value:
+        return value
+
+    return re.sub(
+        r'\\(.)',
+        lambda match: COPY_TEXT_ESCAPES.get(match.group(1), match.group(1)),
+        value
+    )
+
+
+def parse_copy_options(options: str) -> tuple[str, bool]:
+    options = options.upper()
+    format_ = 'csv' if 'CSV' in options else 'text'
+    header = 'HEADER' in options
+
+    return format_, header
+
+
+class FakeCursor:
+    def __init__(
+            self,
+            connection: 'FakeConnection',
+            name: str = None,
+            cursor_factory: type = None
+    ):
+        self.connection = connection
+        self.name = name
+        self.real_dict = cursor_factory is not None and issubclass(cursor_factory, RealDictCursor)
+        self.description = None
+        self.rowcount = -1
+        self.itersize = 2000
+        self.closed = False
+        self.query = None
+        self._results: list = []
+        self._position = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __iter__(self):
+        while True:
+            row = self.fetchone()
+
+            if row is None:
+                return
+
+            yield row
+
+    def close(self):
+        self.closed = True
+
+    def mogrify(self, sql: str | bytes, vars_: Any = None) -> bytes:
+        if isinstance(sql, bytes):
+            sql = sql.decode()
+
+        index = self.connection.add_mogrified(sql, vars_)
+
+        return f'__fake_mogrify_{index}__'.encode()
+
+    def execute(self, sql: str | bytes, vars_: Any = None):
+        if isinstance(sql, bytes):
+            sql = sql.decode()
+
+        self.query = sql
+        self.connection.round_trip()
+
+        with self.connection.lock:
+            self._execute(sql, vars_)
+
+    def executemany(self, sql: str, vars_list: Iterable):
+        rowcount = 0
+
+        for vars_ in vars_list:
+            self.execute(sql, vars_)
+            rowcount += max(self.rowcount, 0)
+
+        self.rowcount = rowcount
+
+    def fetchone(self):
+        rows = self._fetch(1)
+        return rows[0] if rows else None
+
+    def fetchmany(self, size: int = None):
+        return self._fetch(self.itersize if size is None else size)
+
+    def fetchall(self):
+        return self._fetch(len(self._results) - self._position)
+
+    def copy_expert(self, sql: str, file, size: int = 8192):
+        sql = ' '.join(sql.split())
+
+        self.query = sql
+        self.connection.round_trip()
+
+        with self.connection.lock:
+            match = COPY_TO_PATTERN.match(sql)
+
+            if match:
+                return self._copy_to(match, file)
+
+            match = COPY_FROM_PATTERN.match(sql)
+
+            if match:
+                return self._copy_from(match, file)
+
+        raise ProgrammingError(f'Unsupported COPY statement: {sql}')
+
+    def _fetch(self, size: int) -> list:
+        if self.description is None:
+            raise ProgrammingError('no results to fetch')
+
+        if self.name is not None:
+            self.connection.round_trip()
+
+        rows = self._results[self._position:self._position + size]
+        self._position += len(rows)
+
+        return rows
+
+    def _set_results(self, columns: list[str], rows: list[dict]):
+        self.description = tuple(
+            Column(column, None, None, None, None, None, None) for
+            column in
+            columns
+        )
+
+        if self.real_dict:
+            self._results = [
+                {column: row.get(column) for column in columns} for
+                row in
+                rows
+            ]
+        else:
+            index = {column: position for position, column in enumerate(columns)}
+
+            self._results = [
+                FakeRow(index, [row.get(column) for column in columns]) for
+                row in
+                rows
+            ]
+
+        self._position = 0
+        self.rowcount = len(rows)
+
+    def _clear_results(self, rowcount: int):
+        self.description = None
+        self._results = []
+        self._position = 0
+        self.rowcount = rowcount
+
+    def _execute(self, sql: str, vars_: Any):
+        sql = ' '.join(sql.split())
+        vars_ = list(vars_ or ())
+
+        # Inline a query that was mogrified as a whole, i.e. COPY (SELECT ...) TO STDOUT
+        token = MOGRIFY_TOKEN.fullmatch(sql)
+
+        if token:
+            sql, vars_ = self.connection.get_mogrified(int(token.group(1)))
+            return self._execute(sql, vars_)
+
+        for pattern, handler in (
+                (SELECT_PATTERN, self._select),
+                (INSERT_PATTERN, self._insert),
+                (UPDATE_PATTERN, self._update),
+                (DELETE_PATTERN, self._delete),
+                (CREATE_TABLE_AS_PATTERN, self._create_table_as),
+                (TRUNCATE_PATTERN, self._truncate),
+                (DROP_TABLE_PATTERN, self._drop_table)
+        ):
+            match = pattern.match(sql)
+
+            if match:
+                return handler(match, vars_)
+
+        raise ProgrammingError(f'Unsupported statement: {sql}')
+
+    def _parse_where(self, where: Optional[str], vars_: list) -> list[tuple[str, Callable]]:
+        if not where:
+            return []
+
+        conditions = []
+
+        for condition in re.split(r' AND ', where, flags=re.IGNORECASE):
+            match = CONDITION_PATTERN.match(condition.strip())
+
+            if not match:
+                raise ProgrammingError(f'Unsupported condition: {condition}')
+
+            conditions.append((
+                match.group('column'),
+                compile_condition(match.group('operator'), vars_.pop(0))
+            ))
+
+        return conditions
+
+    def _filter(self, rows: Iterable[dict], conditions: list[tuple[str, Callable]]) -> list[dict]:
+        return [
+            row for
+            row in
+            rows if
+            all(condition(row.get(column)) for column, condition in conditions)
+        ]
+
+    def _returning(self, table: FakeTable, returning: Optional[str], rows: list[dict]):
+        if returning is None:
+            return self._clear_results(len(rows))
+
+        if returning.strip() == '*':
+            columns = self._get_columns(table, rows)
+        else:
+            columns = split_list(returning)
+
+        self._set_results(columns, rows)
+
+    def _get_columns(self, table: FakeTable, rows: list[dict]) -> list[str]:
+        if rows:
+            return list(rows[0])
+
+        if table.columns:
+            return ([table.serial] if table.serial and table.serial not in table.columns else []) + table.columns
+
+        return [table.serial] if table.serial else []
+
+    def _query(self, match: re.Match, vars_: list) -> tuple[list[str], list[dict]]:
+        table = self.connection.get_table(match.group('table'))
+
+        rows = self._filter(
+            table.rows,
+            self._parse_where(match.group('where'), vars_)
+        )
+
+        columns = match.group('columns').strip()
+
+        if columns.upper() == 'COUNT(*)':
+            return ['count'], [{'count': len(rows)}]
+
+        if columns == '*':
+            columns = self._get_columns(table, rows)
+        else:
+            columns = split_list(columns)
+
+        group_by = match.group('group_by')
+
+        if group_by:
+            group_by = split_list(group_by)
+
+            if not set(columns) <= set(group_by):
+                raise ProgrammingError('Selected columns must appear in the GROUP BY clause')
+
+            groups = {}
+
+            for row in rows:
+                key = tuple(row.get(column) for column in group_by)
+                groups.setdefault(key, row)
+
+            rows = list(groups.values())
+
+        order_by = match.group('order_by')
+
+        if order_by:
+            for option in reversed(split_list(order_by)):
+                column, _, direction = option.partition(' ')
+
+                rows = sorted(
+                    rows,
+                    key=lambda row: (row.get(column) is None, row.get(column)),
+                    reverse=direction.strip().upper() == 'DESC'
+                )
+
+        limit = match.group('limit')
+        offset = match.group('offset')
+
+        if limit is not None:
+            limit = vars_.pop(0) if limit == '%s' else int(limit)
+        if offset is not None:
+            offset = vars_.pop(0) if offset == '%s' else int(offset)
+
+        if offset:
+            rows = rows[offset:]
+        if limit is not None:
+            rows = rows[:limit]
+
+        return columns, rows
+
+    def _select(self, match: re.Match, vars_: list):
+        columns, rows = self._query(match, vars_)
+        self._set_results(columns, rows)
+
+    def _parse_values(self, values: str, vars_: list) -> list[tuple]:
+        result = []
+
+        for value in split_list(values):
+            token = MOGRIFY_TOKEN.fullmatch(value)
+
+            if token:
+                _, args = self.connection.get_mogrified(int(token.group(1)))
+                result.append(tuple(args))
+            elif value == '%s':
+                result.append(tuple(vars_.pop(0)))
+            else:
+                raise ProgrammingError(f'Unsupported VALUES item: {value}')
+
+        return result
+
+    def _insert(self, match: re.Match, vars_: list):
+        table = self.connection.get_table(match.group('table'))
+        columns = split_list(match.group('columns'))
+
+        if match.group('query') is not None:
+            select_columns, rows = self._query(SELECT_PATTERN.match(match.group('query')), vars_)
+            values = [tuple(row.get(column) for column in select_columns) for row in rows]
+        else:
+            values = self._parse_values(match.group('values'), vars_)
+
+        targets = match.group('targets')
+        do = match.group('do')
+
+        set_columns = []
+
+        if do and do.upper().startswith('UPDATE'):
+            for assignment in split_list(match.group('set')):
+                column, _, _ = assignment.partition('=')
+                set_columns.append(column.strip())
+
+        existing = {}
+
+        if targets is not None:
+            targets = split_list(targets)
+
+            for position, row in enumerate(table.rows):
+                existing[tuple(row.get(target) for target in targets)] = position
+
+        self.connection.begin_write()
+
+        returned = []
+
+        for value in values:
+            row = dict(zip(columns, value))
+
+            if targets is not None:
+                key = tuple(row.get(target) for target in targets)
+
+                # NULLs never conflict
+                if None not in key and key in existing:
+                    if do.upper() == 'NOTHING':
+                        continue
+
+                    position = existing[key]
+                    updated = {
+                        **table.rows[position],
+                        **{column: row.get(column) for column in set_columns}
+                    }
+                    table.rows[position] = updated
+                    returned.append(updated)
+                    continue
+
+            row = table.insert(row)
+            returned.append(row)
+
+            if targets is not None:
+                existing[tuple(row.get(target) for target in targets)] = len(table.rows) - 1
+
+        self._returning(table, match.group('returning'), returned)
+
+    def _update(self, match: re.Match, vars_: list):
+        table = self.connection.get_table(match.group('table'))
+
+        assignments = {}
+
+        for assignment in split_list(match.group('set')):
+            column, _, value = assignment.partition('=')
+
+            if value.strip() != '%s':
+                raise ProgrammingError(f'Unsupported assignment: {assignment}')
+
+            assignments[column.strip()] = vars_.pop(0)
+
+        conditions = self._parse_where(match.group('where'), vars_)
+
+        self.connection.begin_write()
+
+        returned = []
+
+        for position, row in enumerate(table.rows):
+            if all(condition(row.get(column)) for column, condition in conditions):
+                row = {**row, **assignments}
+                table.rows[position] = row
+                returned.append(row)
+
+        self._returning(table, match.group('returning'), returned)
+
+    def _delete(self, match: re.Match, vars_: list):
+        table = self.connection.get_table(match.group('table'))
+        conditions = self._parse_where(match.group('where'), vars_)
+
+        self.connection.begin_write()
+
+        kept = []
+        returned = []
+
+        for row in table.rows:
+            if all(condition(row.get(column)) for column, condition in conditions):
+                returned.append(row)
+            else:
+                kept.append(row)
+
+        table.rows = kept
+
+        self._returning(table, match.group('returning'), returned)
+
+    def _create_table_as(self, match: re.Match, vars_: list):
+        source = self.connection.get_table(match.group('source'))
+        columns = split_list(match.group('columns'))
+
+        if columns == ['*']:
+            columns = self._get_columns(source, source.rows)
+
+        self.connection.begin_write()
+        self.connection.create_table(match.group('table'), columns=columns, serial=None)
+        self._clear_results(-1)
+
+    def _truncate(self, match: re.Match, vars_: list):
+        self.connection.begin_write()
+        self.connection.get_table(match.group('table')).rows = []
+        self._clear_results(-1)
+
+    def _drop_table(self, match: re.Match, vars_: list):
+        name = match.group('table')
+
+        if name not in self.connection.tables and not match.group('if_exists'):
+            self.connection.get_table(name)
+
+        self.connection.begin_write()
+        self.connection.tables.pop(name, None)
+        self._clear_results(-1)
+
+    def _copy_to(self, match: re.Match, file):
+        query = match.group('query').strip()
+        token = MOGRIFY_TOKEN.fullmatch(query)
+        vars_ = []
+
+        if token:
+            query, vars_ = self.connection.get_mogrified(int(token.group(1)))
+            query = ' '.join(query.split())
+            vars_ = list(vars_ or ())
+
+        select = SELECT_PATTERN.match(query)
+
+        if not select:
+            raise ProgrammingError(f'Unsupported COPY query: {query}')
+
+        columns, rows = self._query(select, vars_)
+        format_, header = parse_copy_options(match.group('options'))
+
+        buffer = io.StringIO()
+
+        if format_ == 'csv':
+            writer = csv.writer(buffer, lineterminator='\n')
+
+            if header:
+                writer.writerow(columns)
+
+            for row in rows:
+                writer.writerow([
+                    '' if row.get(column) is None else row.get(column) for
+                    column in
+                    columns
+                ])
+        else:
+            for row in rows:
+                buffer.write('\t'.join(
+                    '\\N' if row.get(column) is None else str(row.get(column)) for
+                    column in
+                    columns
+                ))
+                buffer.write('\n')
+
+        data = buffer.getvalue()
+
+        if isinstance(file, io.TextIOBase):
+            file.write(data)
+        else:
+            file.write(data.encode())
+
+        self._clear_results(len(rows))
+
+    def _copy_from(self, match: re.Match, file):
+        table = self.connection.get_table(match.group('table'))
+        format_, header = parse_copy_options(match.group('options'))
+
+        data = file.read()
+
+        if isinstance(data, bytes):
+            data = data.decode()
+
+        lines = io.StringIO(data)
+
+        if format_ == 'csv':
+            records = csv.reader(lines)
+        else:
+            records = (
+                [unescape_copy_text(value) for value in line.rstrip('\n').split('\t')] for
+                line in
+                lines if
+                line.strip('\n')
+            )
+
+        columns = split_list(match.group('columns') or '')
+        null = '' if format_ == 'csv' else None
+
+        self.connection.begin_write()
+
+        inserted = 0
+
+        for position, record in enumerate(records):
+            if header and position == 0:
+                if not columns:
+                    columns = record
+                continue
+
+            if not columns:
+                columns = self._get_columns(table, table.rows)
+
+            table.insert({
+                column: None if value == null else value for
+                column, value in
+                zip(columns, record)
+            })
+
+            inserted += 1
+
+        self._clear_results(inserted)
+
+
+class FakeConnection:
+    def __init__(
+            self,
+            tables: dict[str, Iterable[dict]] = None,
+            latency: float = 0.0,
+            encoding: str = 'UTF8'
+    ):
+        self.latency = latency
+        self.encoding = encoding
+        self.autocommit = False
+        self.closed = 0
+        self.round_trips = 0
+        self.commits = 0
+        self.rollbacks = 0
+        self.lock = RLock()
+        self.tables: dict[str, FakeTable] = {}
+        self._mogrified: dict[int, tuple[str, Any]] = {}
+        self._mogrify_counter = count()
+        self._snapshot = None
+
+        for name, rows in (tables or {}).items():
+            self.create_table(name, rows)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+
+    def create_table(
+            self,
+            name: str,
+            rows: Iterable[dict] = (),
+            columns: Iterable[str] = None,
+            serial: Optional[str] = 'id'
+    ) -> FakeTable:
+        table = FakeTable(name, rows, columns, serial)
+        self.tables[name] = table
+        return table
+
+    def get_table(self, name: str) -> FakeTable:
+        try:
+            return self.tables[name]
+        except KeyError:
+            raise ProgrammingError(f'relation "{name}" does not exist')
+
+    def cursor(self, name: str = None, cursor_factory: type = None, **_) -> FakeCursor:
+        return FakeCursor(self, name, cursor_factory)
+
+    def round_trip(self):
+        self.round_trips += 1
+
+        if self.latency:
+            time.sleep(self.latency)
+
+    def add_mogrified(self, sql: str, vars_: Any) -> int:
+        index = next(self._mogrify_counter)
+        self._mogrified[index] = (sql, vars_)
+        return index
+
+    def get_mogrified(self, index: int) -> tuple[str, Any]:
+        return self._mogrified.pop(index)
+
+    def begin_write(self):
+        if self.autocommit or self._snapshot is not None:
+            return
+
+        # Keeps the table objects too, so that tables created or dropped since are undone
+        self._snapshot = {
+            name: (table, list(table.rows), table.next_serial) for
+            name, table in
+            self.tables.items()
+        }
+
+    def commit(self):
+        self.commits += 1
+        self._snapshot = None
+
+    def rollback(self):
+        self.rollbacks += 1
+
+        if self._snapshot is None:
+            return
+
+        self.tables = {}
+
+        for name, (table, rows, next_serial) in self._snapshot.items():
+            table.rows = rows
+            table.next_serial = next_serial
+            self.tables[name] = table
+
+        self._snapshot = None
+
+    def close(self):
+        self.closed = 1
+
+
+class FakeConnectionPool:
+    """
+    Hands out a single shared FakeConnection, i.e. for pooled_cursor and create_router.
+    """
+
+    def __init__(self, connection: FakeConnection = None):
+        self.connection = connection or FakeConnection()
+        self.checked_out = 0
+
+    def getconn(self, key: Any = None) -> FakeConnection:
+        self.checked_out += 1
+        return self.connection
+
+    def putconn(self, connection: FakeConnection, key: Any = None, close: bool = False):
+        self.checked_out -= 1
+
+    def closeall(self):
+        self.connection.close()
@@ -0,0 +1,214 @@
+from dataclasses import dataclass, field as dataclass_field
+from functools import cache, lru_cache
+from typing import Any, TypeVar, Generator
+
+from jinja2 import Template
+from psycopg2.extras import DictCursor
+
+from model_connect.constants import is_undefined
+from model_connect.integrations.psycopg2.common.processing import (
+    IdentifierFilterOptions,
+    process_filter_options
+)
+from model_connect.hooks import start_timer
+from model_connect.integrations.psycopg2.common.streaming import stream_decoded_rows
+from model_connect.registry import get_schema
+
+_T = TypeVar('_T')
+
+
+UPDATE_TEMPLATE = '''
+        UPDATE
+            {{ tablename }}
+        SET
+            {%- for column in columns %}
+            {{ column }} = %s
+            {%- if not loop.last %}
+            ,
+            {%- endif %}
+            {%- endfor %}
+        WHERE
+            {%- for filter in filter_options %}
+            {{ filter.column }} {{ filter.operator }} %s
+            {%- if not loop.last %}
+            AND
+            {%- endif %}
+            {%- endfor %}
+        RETURNING
+            *
+    '''
+
+
+@dataclass
+class UpdateSQL:
+    sql: str
+    vars: list[Any] = dataclass_field(
+        default_factory=list
+    )
+
+
+@cache
+def get_update_template() -> Template:
+    return Template(UPDATE_TEMPLATE)
+
+
+@lru_cache(maxsize=1024)
+def render_update_sql(
+        tablename: str,
+        columns: tuple[str, ...],
+        filters: tuple[tuple[str, str], ...]
+) -> str:
+    sql = get_update_template().render(
+        tablename=tablename,
+        columns=columns,
+        filter_options=[
+            {'column': column, 'operator': operator} for
+            column, operator in
+            filters
+        ]
+    )
+
+    return ' '.join(sql.split())
+
+
+def create_identifier_filter_options(
+        dataclass_type: type[_T],
+        data: _T
+) -> IdentifierFilterOptions:
+    return IdentifierFilterOptions({
+        name: getattr(data, name) for
+        name in
+        get_schema(dataclass_type).identifier_names
+    })
+
+
+def create_update_query(
+        dataclass_type: type[_T],
+        data: _T,
+        columns: list[str] = None,
+        filter_options: dict = None,
+        partial: bool = False
+) -> UpdateSQL:
+    vars_ = []
+
+    schema = get_schema(dataclass_type, 'psycopg2')
+
+    timer = start_timer('update', dataclass_type)
+
+    set_columns = []
+
+    for field in schema.update_fields:
+        if columns and field.column_name not in columns:
+            continue
+
+        value = getattr(data, field.model_field.name)
+
+        if partial and is_undefined(value):
+            continue
+
+        if field.encoder:
+            value = field.encoder(field, value)
+
+        set_columns.append(field.column_name)
+        vars_.append(value)
+
+    if not set_columns:
+        raise ValueError('No columns to update')
+
+    if timer:
+        timer.mark('encode', size=1)
+
+    if filter_options is None:
+        filter_options = create_identifier_filter_options(
+            dataclass_type,
+            data
+        )
+
+    filter_options = process_filter_options(
+        dataclass_type,
+        filter_options,
+        vars_
+    )
+
+    if not filter_options:
+        raise ValueError('Refusing to update without filter options')
+
+    if timer:
+        timer.mark('process_options')
+
+    sql = render_update_sql(
+        schema.tablename,
+        tuple(set_columns),
+        tuple((option.column, option.operator) for option in filter_options)
+    )
+
+    query = UpdateSQL(
+        sql,
+        vars_
+    )
+
+    if timer:
+        timer.mark('render', query=query)
+
+    return query
+
+
+def stream_update(
+        cursor: DictCursor,
+        dataclass_type: type[_T],
+        data: _T,
+        columns: list[str] = None,
+        filter_options: dict = None
+) -> Generator[_T, None, None]:
+    query = create_update_query(
+        dataclass_type,
+        data,
+        columns,
+        filter_options
+    )
+
+    timer = start_timer('update', dataclass_type)
+
+    cursor.execute(
+        query.sql,
+        query.vars
+    )
+
+    if timer:
+        timer.mark('execute', query=query)
+
+    results = stream_decoded_rows(cursor, dataclass_type, timer=timer)
+
+    for result in results:
+        yield result
+
+
+def stream_partial_update(
+        cursor: DictCursor,
+        dataclass_type: type[_T],
+        data: _T,
+        columns: list[str] = None,
+        filter_options: dict = None
+) -> Generator[_T, None, None]:
+    query = create_update_query(
+        dataclass_type,
+        data,
+        columns,
+        filter_options,
+        partial=True
+    )
+
+    timer = start_timer('update', dataclass_type)
+
+    cursor.execute(
+        query.sql,
+        query.vars
+    )
+
+    if timer:
+        timer.mark('execute', query=query)
+
+    results = stream_decoded_rows(cursor, dataclass_type, timer=timer)
+
+    for result in results:
+        yield result
@@ -0,0 +1,63 @@
+from model_connect.integrations.psycopg2.common.streaming import (
+    compile_insert_encoder,
+    compile_chunk_decoder
+)
+from model_connect.integrations.psycopg2.delete import render_delete_sql
+from model_connect.integrations.psycopg2.insert import render_insert_sql
+from model_connect.integrations.psycopg2.select import render_select_sql, render_select_count_sql
+from model_connect.integrations.psycopg2.update import render_update_sql
+from model_connect.schema import ModelSchema
+
+
+def warmup_schema(schema: ModelSchema):
+    psycopg2_schema = schema.integrations['psycopg2']
+    tablename = psycopg2_schema.tablename
+
+    compile_chunk_decoder(psycopg2_schema, schema.dataclass_type)
+    compile_insert_encoder(psycopg2_schema, psycopg2_schema.insert_columns)
+
+    identifier_filters = tuple(
+        (name, '=') for
+        name in
+        schema.identifier_names
+    )
+
+    # lru_cache keys on the exact call signature, so arguments are passed
+    # positionally, in the same way as the query builders pass them
+    for has_limit, has_skip in ((False, False), (True, False), (True, True)):
+        render_select_sql(tablename, psycopg2_schema.select_columns, (), (), (), has_limit, has_skip)
+
+    render_select_count_sql(tablename, ())
+
+    if psycopg2_schema.insert_columns:
+        render_insert_sql(tablename, psycopg2_schema.insert_columns, None, ('*',))
+
+    if psycopg2_schema.insert_columns and psycopg2_schema.on_conflict_targets:
+        render_insert_sql(
+            tablename,
+            psycopg2_schema.insert_columns,
+            ('NOTHING', psycopg2_schema.on_conflict_targets, ()),
+            ('*',)
+        )
+
+        render_insert_sql(
+            tablename,
+            psycopg2_schema.insert_columns,
+            ('UPDATE', psycopg2_schema.on_conflict_targets, psycopg2_schema.on_conflict_update_columns),
+            ('*',)
+        )
+
+    if not identifier_filters:
+        return
+
+    render_select_sql(tablename, psycopg2_schema.select_columns, identifier_filters, (), (), False, False)
+    render_delete_sql(tablename, identifier_filters)
+
+    update_columns = tuple(
+        field.column_name for
+        field in
+        psycopg2_schema.update_fields
+    )
+
+    if update_columns:
+        render_update_sql(tablename, update_columns, identifier_filters)
@@ -0,0 +1,298 @@
+import asyncio
+import io
+from dataclasses import dataclass, replace
+from queue import Empty, Full, Queue
+from threading import Condition, Event, Lock, Thread
+from time import monotonic
+from typing import Any, Callable, Iterable, Optional, TypeVar
+
+from psycopg2.pool import AbstractConnectionPool
+
+from model_connect.integrations.psycopg2.bulk_import import format_copy_value
+from model_connect.integrations.psycopg2.common.streaming import create_insert_encoder
+from model_connect.integrations.psycopg2.insert import insert_count
+from model_connect.integrations.psycopg2.pool import pooled_cursor
+from model_connect.registry import get_schema
+
+_T = TypeVar('_T')
+
+_WAKE = object()
+
+
+@dataclass(slots=True)
+class WriteBehindMetrics:
+    enqueued: int = 0
+    written: int = 0
+    failed: int = 0
+    batches: int = 0
+    blocked_puts: int = 0
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+    last_batch_size: int = 0
+    max_batch_size: int = 0
+    total_write_duration: float = 0.0
+    last_error: Optional[str] = None
+
+    @property
+    def mean_batch_size(self) -> float:
+        return (self.written + self.failed) / self.batches if self.batches else 0.0
+
+
+class WriteBehindInserter:
+    """
+    Accepts items from any number of threads or tasks into a bounded queue, and inserts them
+    from a background thread in batches of up to batch_size, at the latest flush_interval
+    seconds after the first item of a batch arrived. Each batch is written and committed on
+    its own pooled connection, with execute_values (method='insert') or COPY (method='copy').
+
+    put() blocks while the queue is full (up to put_timeout, then raises queue.Full). Items
+    that are queued but not yet written are lost if the process dies; close() writes them.
+    Failed batches are passed to on_error, if any, and counted in the metrics.
+    """
+
+    def __init__(
+            self,
+            dataclass_type: type[_T],
+            pool: AbstractConnectionPool,
+            batch_size: int = 1000,
+            flush_interval: float = 1.0,
+            max_queue_size: int = 10000,
+            put_timeout: float = None,
+            method: str = 'insert',
+            on_error: Callable[[list[_T], Exception], Any] = None
+    ):
+        assert method in ('insert', 'copy')
+
+        self.dataclass_type = dataclass_type
+        self.pool = pool
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.put_timeout = put_timeout
+        self.method = method
+        self.on_error = on_error
+        self._metrics = WriteBehindMetrics()
+        self._metrics_lock = Lock()
+        self._processed = 0
+        self._processed_changed = Condition(self._metrics_lock)
+        self._put_lock = Lock()
+        self._queue: Queue = Queue(max_queue_size)
+        self._closed = Event()
+        self._flushing = Event()
+        self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def start(self):
+        if self._thread is None:
+            self._thread = Thread(target=self.run, name='model-connect-write-behind', daemon=True)
+            self._thread.start()
+
+    def close(self, timeout: float = None):
+        """
+        Stops accepting items and waits for the queued ones to be written.
+        """
+        # Taken so that no put() is between its closed check and its enqueue
+        with self._put_lock:
+            self._closed.set()
+
+        self.start()
+        self.wake()
+        self._thread.join(timeout)
+
+    def put(self, item: _T):
+        if self.try_put(item):
+            return
+
+        started = monotonic()
+
+        if not self._put_lock.acquire(timeout=-1 if self.put_timeout is None else self.put_timeout):
+            raise Full()
+
+        try:
+            self.check_open()
+
+            try:
+                self._queue.put_nowait(item)
+            except Full:
+                with self._metrics_lock:
+                    self._metrics.blocked_puts += 1
+
+                timeout = None if self.put_timeout is None else max(self.put_timeout - (monotonic() - started), 0)
+                self._queue.put(item, timeout=timeout)
+
+            self.count_put()
+        finally:
+            self._put_lock.release()
+
+    def try_put(self, item: _T) -> bool:
+        """
+        Enqueues the item if that does not block, and returns whether it did.
+        """
+        if not self._put_lock.acquire(blocking=False):
+            return False
+
+        try:
+            self.check_open()
+
+            try:
+                self._queue.put_nowait(item)
+            except Full:
+                return False
+
+            self.count_put()
+            return True
+        finally:
+            self._put_lock.release()
+
+    def check_open(self):
+        if self._closed.is_set():
+            raise RuntimeError('The inserter is closed')
+
+    def count_put(self):
+        # Called under the put lock, so the count follows the queue order
+        with self._metrics_lock:
+            self._metrics.enqueued += 1
+            self._metrics.max_queue_depth = max(self._metrics.max_queue_depth, self._queue.qsize())
+
+    def put_all(self, items: Iterable[_T]):
+        for item in items:
+            self.put(item)
+
+    async def put_async(self, item: _T):
+        if not self.try_put(item):
+            # Wait for room in a worker thread, so that the event loop is not blocked
+            await asyncio.to_thread(self.put, item)
+
+    def flush(self):
+        """
+        Blocks until every item queued so far has been written (or has failed). Items queued
+        after the call are not waited for.
+        """
+        with self._metrics_lock:
+            target = self._metrics.enqueued
+
+        self.start()
+        self._flushing.set()
+        self.wake()
+
+        try:
+            with self._processed_changed:
+                self._processed_changed.wait_for(lambda: self._processed >= target)
+        finally:
+            self._flushing.clear()
+
+    def wake(self):
+        # Interrupts a worker waiting on an empty queue; a full queue does not block it anyway
+        try:
+            self._queue.put_nowait(_WAKE)
+        except Full:
+            pass
+
+    def metrics(self) -> WriteBehindMetrics:
+        with self._metrics_lock:
+            self._metrics.queue_depth = self._queue.qsize()
+
+            return replace(self._metrics)
+
+    def run(self):
+        while True:
+            batch = self.collect()
+
+            if batch:
+                self.write(batch)
+            elif self._closed.is_set():
+                return
+
+    def collect(self) -> list[_T]:
+        batch = []
+        deadline = None
+
+        while len(batch) < self.batch_size:
+            if self._closed.is_set() or (batch and self._flushing.is_set()):
+                timeout = 0
+            elif deadline is None:
+                timeout = self.flush_interval
+            else:
+                timeout = deadline - monotonic()
+
+            try:
+                if timeout <= 0:
+                    item = self._queue.get_nowait()
+                else:
+                    item = self._queue.get(timeout=timeout)
+            except Empty:
+                if batch or self._closed.is_set():
+                    break
+
+                continue
+
+            if item is _WAKE:
+                self._queue.task_done()
+                continue
+
+            if deadline is None:
+                deadline = monotonic() + self.flush_interval
+
+            batch.append(item)
+
+        return batch
+
+    def write(self, batch: list[_T]):
+        started = monotonic()
+        error = None
+
+        try:
+            with pooled_cursor(self.pool) as cursor:
+                if self.method == 'copy':
+                    self.copy(cursor, batch)
+                else:
+                    insert_count(cursor, self.dataclass_type, batch)
+        except Exception as e:
+            error = e
+
+        with self._metrics_lock:
+            self._metrics.batches += 1
+            self._metrics.last_batch_size = len(batch)
+            self._metrics.max_batch_size = max(self._metrics.max_batch_size, len(batch))
+            self._metrics.total_write_duration += monotonic() - started
+
+            if error is None:
+                self._metrics.written += len(batch)
+            else:
+                self._metrics.failed += len(batch)
+                self._metrics.last_error = f'{type(error).__name__}: {error}'
+
+        try:
+            if error is not None and self.on_error is not None:
+                self.on_error(batch, error)
+        except Exception as e:
+            # The worker must keep draining the queue
+            with self._metrics_lock:
+                self._metrics.last_error = f'{type(e).__name__}: {e}'
+        finally:
+            for _ in batch:
+                self._queue.task_done()
+
+            with self._processed_changed:
+                self._processed += len(batch)
+                self._processed_changed.notify_all()
+
+    def copy(self, cursor, batch: list[_T]):
+        schema = get_schema(self.dataclass_type, 'psycopg2')
+        encode = create_insert_encoder(self.dataclass_type, schema.insert_columns)
+
+        buffer = io.StringIO(''.join(
+            '\t'.join(format_copy_value(value) for value in encode(item)) + '\n' for
+            item in
+            batch
+        ))
+
+        cursor.copy_expert(
+            f'COPY {schema.tablename} ({", ".join(schema.insert_columns)}) FROM STDIN WITH (FORMAT text)',
+            buffer
+        )
@@ -1,11 +1,12 @@
 from dataclasses import dataclass, field
 
-from model_connect.constants import UNDEFINED, coalesce
+from model_connect import cache
+from model_connect.constants import UNDEFINED, coalesce, is_undefined
 from model_connect.options.model.model import Model
 from model_connect.options.model_field.model_field import ModelFields
 
 
-@dataclass
+@dataclass(slots=True)
 class ConnectOptions:
     model: Model = UNDEFINED
     model_fields: ModelFields = UNDEFINED
@@ -21,6 +22,16 @@ class ConnectOptions:
     def resolve(self, dataclass_type: type):
         self._dataclass_type = dataclass_type
 
+        metadata_cache = cache.get_cache()
+        key = None
+        entry = None
+
+        if metadata_cache is not None:
+            key = cache.fingerprint(dataclass_type, self)
+
+        if key is not None:
+            entry = metadata_cache.get(key)
+
         self.model = coalesce(
             self.model,
             Model()
@@ -31,5 +42,24 @@ class ConnectOptions:
             ModelFields()
         )
 
+        if entry is not None:
+            self.load_cache_entry(entry)
+
         self.model.resolve(self)
         self.model_fields.resolve(self)
+
+        if key is not None:
+            metadata_cache.set(key, self.create_cache_entry())
+
+    def load_cache_entry(self, entry: dict):
+        if is_undefined(self.model.name_single_parts):
+            self.model.name_single_parts = list(entry['name_single_parts'])
+
+        if is_undefined(self.model.name_plural_parts):
+            self.model.name_plural_parts = list(entry['name_plural_parts'])
+
+    def create_cache_entry(self) -> dict:
+        return {
+            'name_single_parts': list(self.model.name_single_parts),
+            'name_plural_parts': list(self.model.name_plural_parts)
+        }
@@ -2,9 +2,7 @@ import re
 from dataclasses import dataclass, field
 from typing import TypeVar, TYPE_CHECKING, Iterable
 
-import inflect
-
-from model_connect.constants import UNDEFINED, coalesce
+from model_connect.constants import UNDEFINED, coalesce, is_undefined
 from model_connect.integrations.base import BaseIntegrationModel, ModelIntegrations
 from model_connect.integrations import type_registry
 from model_connect.options.model.query_params import QueryParams
@@ -14,7 +12,18 @@ if TYPE_CHECKING:
 
 _T = TypeVar('_T', bound=BaseIntegrationModel)
 
-_inflect_engine = inflect.engine()
+_inflect_engine = None
+
+
+def get_inflect_engine():
+    global _inflect_engine
+
+    if _inflect_engine is None:
+        import inflect
+
+        _inflect_engine = inflect.engine()
+
+    return _inflect_engine
 
 
 def split_model_name(name: str):
@@ -29,7 +38,7 @@ def convert_name_parts_to_kebab_case(name_parts: Iterable[str]):
     return '-'.join(name_parts).lower()
 
 
-@dataclass
+@dataclass(slots=True)
 class Model:
     name_single_parts: Iterable[str] | str = UNDEFINED
     name_plural_parts: Iterable[str] | str = UNDEFINED
@@ -73,15 +82,11 @@ class Model:
             split_model_name(connect_options.dataclass_type.__name__)
         )
 
-        name_single = ''.join(self.name_single_parts)
-        name_plural = _inflect_engine.plural_noun(name_single)
+        if is_undefined(self.name_plural_parts) or self.name_plural_parts is None:
+            name_single = ''.join(self.name_single_parts)
+            name_plural = get_inflect_engine().plural_noun(name_single)
 
-        name_plural_parts = split_model_name(name_plural)
-
-        self.name_plural_parts = coalesce(
-            self.name_plural_parts,
-            name_plural_parts
-        )
+            self.name_plural_parts = split_model_name(name_plural)
 
         self.query_params = coalesce(
             self.query_params,
@@ -1,13 +1,13 @@
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
-from model_connect.constants import UNDEFINED, coalesce
+from model_connect.constants import UNDEFINED, coalesce, is_undefined
 
 if TYPE_CHECKING:
     from model_connect.options import ConnectOptions
 
 
-@dataclass
+@dataclass(slots=True)
 class QueryParams:
     enable_count: bool = UNDEFINED
     enable_pagination: bool = UNDEFINED
@@ -16,7 +16,10 @@ class QueryParams:
 
     pagination_limit_label: str = UNDEFINED
     pagination_offset_label: str = UNDEFINED
+    pagination_default_limit: int = UNDEFINED
+    pagination_max_limit: int | None = UNDEFINED
     count_flag_label: str = UNDEFINED
+    sort_label: str = UNDEFINED
 
     _connect_options: 'ConnectOptions' = field(
         init=False
@@ -50,7 +53,20 @@ class QueryParams:
             self.pagination_offset_label,
             '$skip'
         )
+
+        # None disables the cap, so only an unset limit gets the default
+        if is_undefined(self.pagination_max_limit):
+            self.pagination_max_limit = 1000
+
+        self.pagination_default_limit = coalesce(
+            self.pagination_default_limit,
+            min(100, coalesce(self.pagination_max_limit, 100))
+        )
         self.count_flag_label = coalesce(
             self.count_flag_label,
             '$count'
         )
+        self.sort_label = coalesce(
+            self.sort_label,
+            '$sort'
+        )
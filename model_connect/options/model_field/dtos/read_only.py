@@ -0,0 +1,20 @@
+class ReadOnlyDict(dict):
+    """
+    Dict whose items are fixed at construction, for mappings shared between model fields.
+    """
+    __slots__ = ()
+
+    def __reduce__(self):
+        return type(self), (dict(self),)
+
+    def _raise_read_only(self, *args, **kwargs):
+        raise TypeError(f'{type(self).__name__} is read-only')
+
+    __setitem__ = _raise_read_only
+    __delitem__ = _raise_read_only
+    __ior__ = _raise_read_only
+    clear = _raise_read_only
+    pop = _raise_read_only
+    popitem = _raise_read_only
+    setdefault = _raise_read_only
+    update = _raise_read_only
@@ -1,68 +1,98 @@
-from dataclasses import Field, dataclass, field
+from dataclasses import Field, dataclass, replace
+from functools import lru_cache
 from typing import Callable, Any, TYPE_CHECKING
 
 from model_connect.constants import UNDEFINED, iter_http_methods, coalesce
+from model_connect.options.model_field.dtos.read_only import ReadOnlyDict
 
 if TYPE_CHECKING:
     from model_connect.options import ConnectOptions
 
 
 class RequestDtos(dict[str, 'RequestDto']):
+    __slots__ = ()
+
     def resolve(
             self,
             options: 'ConnectOptions',
             dataclass_field: Field
-    ):
+    ) -> 'RequestDtos':
+        resolved = RequestDtos(self)
+
         for method in iter_http_methods():
             method = method.lower()
-            if method not in self:
-                self[method] = RequestDto()
+            if method not in resolved:
+                resolved[method] = RequestDto()
 
-        for name, dto in self.items():
-            self[name] = coalesce(
+        for name, dto in resolved.items():
+            dto = coalesce(
                 dto,
                 RequestDto()
             )
 
-            self[name].resolve(
-                options,
-                dataclass_field
+            resolved[name] = intern_request_dto(
+                dto.resolve(
+                    options,
+                    dataclass_field
+                )
             )
 
+        return resolved
+
+
+class FrozenRequestDtos(ReadOnlyDict, RequestDtos):
+    __slots__ = ()
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RequestDto:
     include: bool = UNDEFINED
     require: bool = UNDEFINED
     preprocessor: Callable[[Any], Any] = UNDEFINED
 
-    _connect_options: 'ConnectOptions' = field(
-        init=False
-    )
-
-    _dataclass_field: Field = field(
-        init=False
-    )
-
     def resolve(
             self,
             options: 'ConnectOptions',
             dataclass_field: Field
-    ):
-        self._connect_options = options
-        self._dataclass_field = dataclass_field
-
-        self.include = coalesce(
-            self.include,
-            True
+    ) -> 'RequestDto':
+        return replace(
+            self,
+            include=coalesce(
+                self.include,
+                True
+            ),
+            require=coalesce(
+                self.require,
+                False
+            ),
+            preprocessor=coalesce(
+                self.preprocessor,
+                None
+            )
         )
 
-        self.require = coalesce(
-            self.require,
-            False
-        )
 
-        self.preprocessor = coalesce(
-            self.preprocessor,
-            None
-        )
+@lru_cache(maxsize=1024)
+def get_interned_request_dto(dto: RequestDto) -> RequestDto:
+    return dto
+
+
+@lru_cache(maxsize=1024)
+def get_interned_request_dtos(items: tuple[tuple[str, RequestDto], ...]) -> FrozenRequestDtos:
+    return FrozenRequestDtos(items)
+
+
+def intern_request_dto(dto: RequestDto) -> RequestDto:
+    try:
+        return get_interned_request_dto(dto)
+    except TypeError:
+        return dto
+
+
+def intern_request_dtos(dtos: RequestDtos) -> FrozenRequestDtos:
+    items = tuple(dtos.items())
+
+    try:
+        return get_interned_request_dtos(items)
+    except TypeError:
+        return FrozenRequestDtos(items)
@@ -1,62 +1,93 @@
-from dataclasses import Field, dataclass, field
+from dataclasses import Field, dataclass, replace
+from functools import lru_cache
 from typing import Any, Callable, TYPE_CHECKING
 
 from model_connect.constants import UNDEFINED, iter_http_methods, coalesce
+from model_connect.options.model_field.dtos.read_only import ReadOnlyDict
 
 if TYPE_CHECKING:
     from model_connect.options import ConnectOptions
 
 
 class ResponseDtos(dict[str, 'ResponseDto']):
+    __slots__ = ()
+
     def resolve(
             self,
             connect_options: 'ConnectOptions',
             dataclass_field: Field
-    ):
+    ) -> 'ResponseDtos':
+        resolved = ResponseDtos(self)
+
         for method in iter_http_methods():
             method = method.lower()
-            if method not in self:
-                self[method] = ResponseDto()
+            if method not in resolved:
+                resolved[method] = ResponseDto()
 
-        for name, dto in self.items():
-            self[name] = coalesce(
+        for name, dto in resolved.items():
+            dto = coalesce(
                 dto,
                 ResponseDto()
             )
 
-            self[name].resolve(
-                connect_options,
-                dataclass_field
+            resolved[name] = intern_response_dto(
+                dto.resolve(
+                    connect_options,
+                    dataclass_field
+                )
             )
 
+        return resolved
+
+
+class FrozenResponseDtos(ReadOnlyDict, ResponseDtos):
+    __slots__ = ()
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ResponseDto:
     include: bool = UNDEFINED
     preprocessor: Callable[[Any], Any] = UNDEFINED
 
-    _connect_options: 'ConnectOptions' = field(
-        init=False
-    )
-
-    _dataclass_field: Field = field(
-        init=False
-    )
-
     def resolve(
             self,
             connect_options: 'ConnectOptions',
             dataclass_field: Field
-    ):
-        self._connect_options = connect_options
-        self._dataclass_field = dataclass_field
-
-        self.include = coalesce(
-            self.include,
-            True
+    ) -> 'ResponseDto':
+        return replace(
+            self,
+            include=coalesce(
+                self.include,
+                True
+            ),
+            preprocessor=coalesce(
+                self.preprocessor,
+                None
+            )
         )
 
-        self.preprocessor = coalesce(
-            self.preprocessor,
-            None
-        )
+
+@lru_cache(maxsize=1024)
+def get_interned_response_dto(dto: ResponseDto) -> ResponseDto:
+    return dto
+
+
+@lru_cache(maxsize=1024)
+def get_interned_response_dtos(items: tuple[tuple[str, ResponseDto], ...]) -> FrozenResponseDtos:
+    return FrozenResponseDtos(items)
+
+
+def intern_response_dto(dto: ResponseDto) -> ResponseDto:
+    try:
+        return get_interned_response_dto(dto)
+    except TypeError:
+        return dto
+
+
+def intern_response_dtos(dtos: ResponseDtos) -> FrozenResponseDtos:
+    items = tuple(dtos.items())
+
+    try:
+        return get_interned_response_dtos(items)
+    except TypeError:
+        return FrozenResponseDtos(items)
@@ -5,8 +5,8 @@ from typing import TYPE_CHECKING
 from model_connect.constants import UNDEFINED, coalesce
 from model_connect.integrations.base import BaseIntegrationModelField, ModelFieldIntegrations
 from model_connect.integrations import type_registry
-from model_connect.options.model_field.dtos.request import RequestDtos
-from model_connect.options.model_field.dtos.response import ResponseDtos
+from model_connect.options.model_field.dtos.request import RequestDtos, intern_request_dtos
+from model_connect.options.model_field.dtos.response import ResponseDtos, intern_response_dtos
 
 if TYPE_CHECKING:
     from model_connect.options import ConnectOptions
@@ -17,6 +17,8 @@ def has_default_value(dataclass_field: Field):
 
 
 class ModelFields(dict[str, 'ModelField']):
+    __slots__ = ()
+
     def resolve(
             self,
             options: 'ConnectOptions'
@@ -34,7 +36,7 @@ class ModelFields(dict[str, 'ModelField']):
             )
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelField:
     can_sort: bool = UNDEFINED
     can_filter: bool = UNDEFINED
@@ -154,8 +156,12 @@ class ModelField:
             ()
         )
 
-        self.request_dtos.resolve(connect_options, dataclass_field)
-        self.response_dtos.resolve(connect_options, dataclass_field)
+        self.request_dtos = intern_request_dtos(
+            self.request_dtos.resolve(connect_options, dataclass_field)
+        )
+        self.response_dtos = intern_response_dtos(
+            self.response_dtos.resolve(connect_options, dataclass_field)
+        )
 
         for integration in self.override_integrations:
             name = integration.integration_name
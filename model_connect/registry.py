@@ -1,26 +1,110 @@
+from threading import RLock
 from typing import TYPE_CHECKING, TypeVar, overload, Generator, Literal
 
+from model_connect.schema import compile_schema
+
 if TYPE_CHECKING:
     from model_connect.integrations.psycopg2 import Psycopg2Model, Psycopg2ModelField
     from model_connect.integrations.fastapi import FastAPIModel, FastAPIModelField
     from model_connect.options import Model, ModelField
     from model_connect.connect import ConnectOptions
+    from model_connect.integrations.psycopg2.schema import Psycopg2ModelSchema
+    from model_connect.schema import ModelSchema
 
 _registry = {}
+_schemas = {}
+_pending = {}
+_lock = RLock()
 _IntegrationModelT = TypeVar('_IntegrationModelT', bound='BaseIntegrationModel')
 _IntegrationModelFieldT = TypeVar('_IntegrationModelFieldT', bound='BaseIntegrationModelField')
 
 
-def add(dataclass_type: type, options: 'ConnectOptions'):
-    _registry[dataclass_type] = options
+def add(dataclass_type: type, options: 'ConnectOptions', schema: 'ModelSchema' = None):
+    with _lock:
+        _pending.pop(dataclass_type, None)
+        _schemas[dataclass_type] = schema
+        _registry[dataclass_type] = options
+
+
+def add_pending(dataclass_type: type, options: 'ConnectOptions'):
+    with _lock:
+        _registry.pop(dataclass_type, None)
+        _schemas.pop(dataclass_type, None)
+        _pending[dataclass_type] = options
+
+
+def resolve(dataclass_type: type):
+    with _lock:
+        if dataclass_type in _registry:
+            return
+
+        options = _pending[dataclass_type]
+        options.resolve(dataclass_type)
+
+        add(
+            dataclass_type,
+            options,
+            compile_schema(options)
+        )
+
+
+def resolve_all():
+    with _lock:
+        for dataclass_type in list(_pending):
+            resolve(dataclass_type)
 
 
 def get(dataclass_type: type) -> 'ConnectOptions':
+    try:
+        return _registry[dataclass_type]
+    except KeyError:
+        resolve(dataclass_type)
+
     return _registry[dataclass_type]
 
 
 def has(dataclass_type: type) -> bool:
-    return dataclass_type in _registry
+    return dataclass_type in _registry or dataclass_type in _pending
+
+
+def iterate() -> Generator[type, None, None]:
+    with _lock:
+        dataclass_types = [*_registry, *_pending]
+
+    for dataclass_type in dataclass_types:
+        yield dataclass_type
+
+
+@overload
+def get_schema(
+        dataclass_type: type,
+        integration: Literal['psycopg2']
+) -> 'Psycopg2ModelSchema':
+    ...
+
+
+@overload
+def get_schema(
+        dataclass_type: type,
+        integration: None = None
+) -> 'ModelSchema':
+    ...
+
+
+def get_schema(
+        dataclass_type: type,
+        integration: str = None
+):
+    try:
+        schema = _schemas[dataclass_type]
+    except KeyError:
+        resolve(dataclass_type)
+        schema = _schemas[dataclass_type]
+
+    if integration is None:
+        return schema
+
+    return schema.integrations[integration]
 
 
 @overload
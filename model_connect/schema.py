@@ -0,0 +1,98 @@
+from dataclasses import dataclass, fields
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Mapping
+
+if TYPE_CHECKING:
+    from model_connect.options import ConnectOptions, ModelField
+    from model_connect.options.model.query_params import QueryParams
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class ModelSchema:
+    dataclass_type: type
+    name_single_snake_case: str
+    name_plural_snake_case: str
+    name_single_kebab_case: str
+    name_plural_kebab_case: str
+    field_names: tuple[str, ...]
+    field_indexes: Mapping[str, int]
+    model_fields: Mapping[str, 'ModelField']
+    identifier_names: tuple[str, ...]
+    filterable: frozenset[str]
+    sortable: frozenset[str]
+    groupable: frozenset[str]
+    query_params: 'QueryParams'
+    integrations: Mapping[str, Any]
+
+
+def get_ordered_model_fields(options: 'ConnectOptions') -> tuple['ModelField', ...]:
+    # noinspection PyDataclass
+    return tuple(
+        options.model_fields[dataclass_field.name] for
+        dataclass_field in
+        fields(options.dataclass_type)
+    )
+
+
+def compile_schema(options: 'ConnectOptions') -> ModelSchema:
+    model = options.model
+    model_fields = get_ordered_model_fields(options)
+
+    field_names = tuple(
+        model_field.name for
+        model_field in
+        model_fields
+    )
+
+    integrations = {}
+
+    for name, integration in model.integrations.items():
+        integration_schema = integration.compile(options)
+
+        if integration_schema is not None:
+            integrations[name] = integration_schema
+
+    return ModelSchema(
+        dataclass_type=options.dataclass_type,
+        name_single_snake_case=model.name_single_snake_case,
+        name_plural_snake_case=model.name_plural_snake_case,
+        name_single_kebab_case=model.name_single_kebab_case,
+        name_plural_kebab_case=model.name_plural_kebab_case,
+        field_names=field_names,
+        field_indexes=MappingProxyType({
+            name: index for
+            index, name in
+            enumerate(field_names)
+        }),
+        model_fields=MappingProxyType({
+            model_field.name: model_field for
+            model_field in
+            model_fields
+        }),
+        identifier_names=tuple(
+            model_field.name for
+            model_field in
+            model_fields if
+            model_field.is_identifier
+        ),
+        filterable=frozenset(
+            model_field.name for
+            model_field in
+            model_fields if
+            model_field.can_filter
+        ),
+        sortable=frozenset(
+            model_field.name for
+            model_field in
+            model_fields if
+            model_field.can_sort
+        ),
+        groupable=frozenset(
+            model_field.name for
+            model_field in
+            model_fields if
+            model_field.can_group
+        ),
+        query_params=model.query_params,
+        integrations=MappingProxyType(integrations)
+    )
@@ -0,0 +1,18 @@
+import gc
+
+from model_connect import registry
+
+
+def warmup(freeze: bool = False):
+    registry.resolve_all()
+
+    for dataclass_type in registry.iterate():
+        schema = registry.get_schema(dataclass_type)
+        model = registry.get_model(dataclass_type)
+
+        for integration in model.integrations.values():
+            integration.warmup(schema)
+
+    if freeze:
+        gc.collect()
+        gc.freeze()
@@ -0,0 +1,200 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Optional
+from unittest import TestCase
+
+from fastapi import HTTPException
+from starlette.requests import ClientDisconnect, Request
+
+from model_connect import connect
+from model_connect.connect import connect_fastapi_integration, connect_psycopg2_integration
+from model_connect.integrations.fastapi.ingest import (
+    InvalidItem,
+    insert_request,
+    stream_insert_request,
+    stream_json_array_items,
+    stream_ndjson_items
+)
+from model_connect.integrations.psycopg2.testing import FakeConnection
+from model_connect.options import ConnectOptions, ModelFields, ModelField
+
+
+@dataclass
+class Person:
+    id: Optional[int]
+    name: str
+
+
+async def iterate_chunks(*chunks: bytes):
+    for chunk in chunks:
+        yield chunk
+
+
+def create_request(*chunks: bytes, disconnect: bool = False) -> Request:
+    messages = [
+        {'type': 'http.request', 'body': chunk, 'more_body': True} for
+        chunk in
+        chunks
+    ]
+
+    if disconnect:
+        messages.append({'type': 'http.disconnect'})
+    else:
+        messages.append({'type': 'http.request', 'body': b'', 'more_body': False})
+
+    async def receive():
+        return messages.pop(0)
+
+    scope = {
+        'type': 'http',
+        'method': 'POST',
+        'path': '/',
+        'headers': [(b'content-type', b'application/x-ndjson')]
+    }
+
+    return Request(scope, receive)
+
+
+async def collect(items):
+    return [item async for item in items]
+
+
+class Tests(TestCase):
+    def setUp(self):
+        connect_psycopg2_integration()
+        connect_fastapi_integration()
+
+        connect(
+            Person,
+            ConnectOptions(
+                model_fields=ModelFields(
+                    id=ModelField(
+                        is_identifier=True
+                    )
+                )
+            )
+        )
+
+        self.connection = FakeConnection()
+        self.connection.create_table('people', columns=['name'])
+
+    def test_ndjson(self):
+        actual = asyncio.run(collect(stream_ndjson_items(iterate_chunks(
+            b'{"name": "bob"}\n{"na',
+            b'me": "joe"}\n\n',
+            b'{"name": "jane"}'
+        ))))
+
+        self.assertEqual(
+            [{'name': 'bob'}, {'name': 'joe'}, {'name': 'jane'}],
+            actual
+        )
+
+    def test_ndjson_invalid_line(self):
+        actual = asyncio.run(collect(stream_ndjson_items(iterate_chunks(
+            b'{"name": "bob"}\n{"name"\n'
+        ))))
+
+        self.assertEqual({'name': 'bob'}, actual[0])
+        self.assertIsInstance(actual[1], InvalidItem)
+        self.assertEqual(['body', 1], actual[1].error['loc'])
+
+    def test_json_array(self):
+        actual = asyncio.run(collect(stream_json_array_items(iterate_chunks(
+            b' [{"name": "bob", "age": 1',
+            b'2}, {"name": "j\xc3',
+            b'\xa9"}, 1',
+            b'3 ]'
+        ))))
+
+        self.assertEqual(
+            [{'name': 'bob', 'age': 12}, {'name': 'j\xe9'}, 13],
+            actual
+        )
+
+    def test_json_array_strings(self):
+        actual = asyncio.run(collect(stream_json_array_items(iterate_chunks(
+            b'[{"name": "a]}\\',
+            b'"b"}, "[,", {"na',
+            b'me": null}, [1, [2]]]'
+        ))))
+
+        self.assertEqual(
+            [{'name': 'a]}"b'}, '[,', {'name': None}, [1, [2]]],
+            actual
+        )
+
+    def test_json_array_split_numbers(self):
+        actual = asyncio.run(collect(stream_json_array_items(iterate_chunks(
+            b'[-2500.',
+            b'0, 1e',
+            b'3, {"age": 1}',
+            b', 4',
+            b']'
+        ))))
+
+        self.assertEqual([-2500.0, 1000.0, {'age': 1}, 4], actual)
+
+    def test_json_array_invalid_item(self):
+        actual = asyncio.run(collect(stream_json_array_items(iterate_chunks(
+            b'[{"name": "bob"}, {"name" 1}, {"name": "joe"}]'
+        ))))
+
+        self.assertEqual({'name': 'bob'}, actual[0])
+        self.assertIsInstance(actual[1], InvalidItem)
+        self.assertEqual(['body', 1], actual[1].error['loc'])
+        self.assertEqual({'name': 'joe'}, actual[2])
+
+    def test_item_too_large(self):
+        with self.assertRaises(HTTPException) as context:
+            asyncio.run(collect(stream_json_array_items(
+                iterate_chunks(b'[{"name": "', b'x' * 60, b'x' * 60),
+                max_item_size=100
+            )))
+
+        self.assertEqual(413, context.exception.status_code)
+
+        with self.assertRaises(HTTPException) as context:
+            asyncio.run(collect(stream_ndjson_items(
+                iterate_chunks(b'{"name": "bob"}\n{"name": "', b'x' * 60, b'x' * 60),
+                max_item_size=100
+            )))
+
+        self.assertEqual(413, context.exception.status_code)
+
+    def test_insert_request(self):
+        request = create_request(
+            b'{"name": "bob"}\n{"name": "joe"}\n',
+            b'{"name"\n{"name": "jane"}\n'
+        )
+
+        with self.connection.cursor() as cursor:
+            summary = asyncio.run(insert_request(request, cursor, Person, chunk_size=2))
+
+        self.assertEqual(4, summary.received)
+        self.assertEqual(3, summary.inserted)
+        self.assertEqual(['body', 2], summary.errors[0]['loc'])
+        self.assertEqual(
+            ['bob', 'joe', 'jane'],
+            [row['name'] for row in self.connection.get_table('people').rows]
+        )
+
+    def test_disconnect_waits_for_pending_insert(self):
+        self.connection.latency = 0.05
+
+        request = create_request(
+            b'{"name": "bob"}\n{"name": "joe"}\n',
+            disconnect=True
+        )
+
+        async def run():
+            with self.connection.cursor() as cursor:
+                chunks = [chunk async for chunk in stream_insert_request(request, cursor, Person, chunk_size=1)]
+
+            return chunks
+
+        with self.assertRaises(ClientDisconnect):
+            asyncio.run(run())
+
+        # Both inserts finished before the error reached the caller
+        self.assertEqual(2, len(self.connection.get_table('people').rows))
@@ -1,6 +1,105 @@
+from dataclasses import dataclass
 from unittest import TestCase
 
+from model_connect import connect
+from model_connect.constants import UNDEFINED
+from model_connect.integrations.fastapi.request import (
+    RequestDtoValidationError,
+    parse_request_dto,
+    parse_request_dtos
+)
+from model_connect.options import ConnectOptions, ModelFields, ModelField
+from model_connect.options.model_field.dtos.request import RequestDtos, RequestDto
+
+
+@dataclass
+class Person:
+    id: int
+    name: str
+    age: int
+
+
+connect(
+    Person,
+    ConnectOptions(
+        model_fields=ModelFields(
+            id=ModelField(
+                request_dtos=RequestDtos(
+                    post=RequestDto(
+                        include=False
+                    )
+                )
+            ),
+            name=ModelField(
+                request_dtos=RequestDtos(
+                    post=RequestDto(
+                        require=True,
+                        preprocessor=str.strip
+                    )
+                )
+            ),
+            age=ModelField(
+                request_dtos=RequestDtos(
+                    post=RequestDto(
+                        preprocessor=int
+                    )
+                )
+            )
+        )
+    )
+)
+
 
 class Tests(TestCase):
     def test(self):
-        ...
+        actual = parse_request_dto(
+            Person,
+            {'id': 5, 'name': ' bob ', 'age': '12'}
+        )
+
+        self.assertEqual(Person(UNDEFINED, 'bob', 12), actual)
+
+    def test_missing_required(self):
+        with self.assertRaises(RequestDtoValidationError) as context:
+            parse_request_dto(Person, {'age': 12})
+
+        self.assertEqual(
+            [['body', 'name']],
+            [error['loc'] for error in context.exception.errors]
+        )
+
+    def test_bulk(self):
+        actual = parse_request_dtos(
+            Person,
+            [
+                {'name': 'bob', 'age': 12},
+                {'name': 'joe', 'age': 13},
+            ]
+        )
+
+        self.assertEqual(
+            [
+                Person(UNDEFINED, 'bob', 12),
+                Person(UNDEFINED, 'joe', 13),
+            ],
+            actual
+        )
+
+    def test_bulk_errors_by_index(self):
+        with self.assertRaises(RequestDtoValidationError) as context:
+            parse_request_dtos(
+                Person,
+                [
+                    {'name': 'bob', 'age': 12},
+                    {'age': 13},
+                    {'name': 'jane', 'age': 'old'},
+                ]
+            )
+
+        self.assertEqual(
+            [
+                ['body', 1, 'name'],
+                ['body', 2, 'age'],
+            ],
+            [error['loc'] for error in context.exception.errors]
+        )
@@ -0,0 +1,140 @@
+from dataclasses import dataclass
+from datetime import date
+from unittest import TestCase
+
+from fastapi import HTTPException
+
+from model_connect import connect
+from model_connect.integrations.fastapi.query_params import parse_query_params
+from model_connect.options import ConnectOptions, Model, ModelFields, ModelField
+from model_connect.options.model.query_params import QueryParams
+
+
+@dataclass
+class Person:
+    id: int
+    name: str
+    born: date
+    secret: str
+
+
+connect(
+    Person,
+    ConnectOptions(
+        model=Model(
+            query_params=QueryParams(
+                pagination_max_limit=50,
+                pagination_default_limit=10
+            )
+        ),
+        model_fields=ModelFields(
+            secret=ModelField(
+                can_filter=False,
+                can_sort=False
+            )
+        )
+    )
+)
+
+
+@dataclass
+class Event:
+    id: int
+
+
+connect(
+    Event,
+    ConnectOptions(
+        model=Model(
+            query_params=QueryParams(
+                pagination_max_limit=None
+            )
+        )
+    )
+)
+
+
+class Tests(TestCase):
+    def test_filters(self):
+        actual = parse_query_params(
+            Person,
+            [
+                ('id[gte]', '2'),
+                ('id[lt]', '10'),
+                ('name', 'bob'),
+                ('name', 'joe'),
+                ('born[in]', '2000-01-01,2001-01-01'),
+                ('secret', 'ignored'),
+                ('unknown', 'ignored'),
+            ]
+        )
+
+        self.assertEqual(
+            {
+                'id': {'>=': 2, '<': 10},
+                'name': {'IN': ('bob', 'joe')},
+                'born': {'IN': (date(2000, 1, 1), date(2001, 1, 1))},
+            },
+            actual.filter_options
+        )
+
+    def test_merges_filters_in_any_order(self):
+        for query_params in (
+                [('id', '3'), ('id[in]', '1,2')],
+                [('id[in]', '1,2'), ('id', '3')],
+                [('id[in]', '1'), ('id', '3'), ('id[in]', '2')],
+        ):
+            actual = parse_query_params(Person, query_params).filter_options
+
+            self.assertEqual(['IN'], list(actual['id']))
+            self.assertEqual([1, 2, 3], sorted(actual['id']['IN']))
+
+    def test_merges_repeated_list_filters(self):
+        actual = parse_query_params(
+            Person,
+            [('id[in]', '1'), ('id[in]', '2'), ('name[nin]', 'bob'), ('name[nin]', 'joe')]
+        )
+
+        self.assertEqual(
+            {'id': {'IN': (1, 2)}, 'name': {'NOT IN': ('bob', 'joe')}},
+            actual.filter_options
+        )
+
+    def test_sort_and_pagination(self):
+        actual = parse_query_params(
+            Person,
+            [
+                ('$sort', 'name,-id'),
+                ('$limit', '20'),
+                ('$skip', '40'),
+                ('$count', 'true'),
+            ]
+        )
+
+        self.assertEqual({'name': 'ASC', 'id': 'DESC'}, actual.sort_options)
+        self.assertEqual({'limit': 20, 'skip': 40}, actual.pagination_options)
+        self.assertTrue(actual.count)
+
+    def test_default_limit(self):
+        actual = parse_query_params(Person, [])
+
+        self.assertEqual({'limit': 10}, actual.pagination_options)
+        self.assertFalse(actual.count)
+
+    def test_rejects_large_limit(self):
+        with self.assertRaises(HTTPException) as context:
+            parse_query_params(Person, [('$limit', '51')])
+
+        self.assertEqual(422, context.exception.status_code)
+
+    def test_no_max_limit(self):
+        self.assertEqual({'limit': 100}, parse_query_params(Event, []).pagination_options)
+        self.assertEqual({'limit': 5000}, parse_query_params(Event, [('$limit', '5000')]).pagination_options)
+
+    def test_rejects_invalid_value(self):
+        with self.assertRaises(HTTPException):
+            parse_query_params(Person, [('id', 'abc')])
+
+    def test_rejects_unsortable(self):
+        with self.assertRaises(HTTPException):
+            parse_query_params(Person, [('$sort', 'secret')])
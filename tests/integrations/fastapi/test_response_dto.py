@@ -0,0 +1,88 @@
+import json
+from dataclasses import dataclass
+from unittest import TestCase
+
+from model_connect import connect
+from model_connect.integrations.fastapi.response import (
+    create_response_serializer,
+    serialize_response_dto,
+    serialize_response_dtos
+)
+from model_connect.options import ConnectOptions, ModelFields, ModelField
+from model_connect.options.model_field.dtos.response import ResponseDtos, ResponseDto
+
+
+@dataclass
+class Person:
+    id: int
+    name: str
+    password: str
+
+
+connect(
+    Person,
+    ConnectOptions(
+        model_fields=ModelFields(
+            name=ModelField(
+                response_dtos=ResponseDtos(
+                    get=ResponseDto(
+                        preprocessor=str.upper
+                    )
+                )
+            ),
+            password=ModelField(
+                response_dtos=ResponseDtos(
+                    get=ResponseDto(
+                        include=False
+                    ),
+                    post=ResponseDto(
+                        include=False
+                    )
+                )
+            )
+        )
+    )
+)
+
+
+class Tests(TestCase):
+    def test_serializer(self):
+        serializer = create_response_serializer(Person, 'GET')
+
+        self.assertEqual(
+            {'id': 1, 'name': 'BOB'},
+            serializer(Person(1, 'bob', 'secret'))
+        )
+
+    def test_serializer_per_method(self):
+        serializer = create_response_serializer(Person, 'post')
+
+        self.assertEqual(
+            {'id': 1, 'name': 'bob'},
+            serializer(Person(1, 'bob', 'secret'))
+        )
+
+    def test_serialize_one(self):
+        actual = serialize_response_dto(Person(1, 'bob', 'secret'))
+
+        self.assertEqual(
+            {'id': 1, 'name': 'BOB'},
+            json.loads(actual)
+        )
+
+    def test_serialize_many(self):
+        actual = serialize_response_dtos(
+            Person(i, 'bob', 'secret') for i in range(3)
+        )
+
+        self.assertEqual(
+            [
+                {'id': 0, 'name': 'BOB'},
+                {'id': 1, 'name': 'BOB'},
+                {'id': 2, 'name': 'BOB'},
+            ],
+            json.loads(actual)
+        )
+
+    def test_serialize_empty(self):
+        self.assertEqual(b'[]', serialize_response_dtos([]))
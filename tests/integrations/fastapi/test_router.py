@@ -0,0 +1,176 @@
+from dataclasses import dataclass
+from typing import Optional
+from unittest import TestCase
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from model_connect import connect
+from model_connect.connect import connect_psycopg2_integration, connect_fastapi_integration
+from model_connect.integrations.fastapi.router import create_router
+from model_connect.integrations.psycopg2.testing import FakeConnectionPool
+from model_connect.options import ConnectOptions, ModelFields, ModelField
+
+
+@dataclass
+class Person:
+    id: int
+    name: str
+
+
+@dataclass
+class Account:
+    id: Optional[int]
+    email: str
+    name: str
+
+
+@dataclass
+class Event:
+    name: str
+
+
+class Tests(TestCase):
+    def setUp(self):
+        connect_psycopg2_integration()
+        connect_fastapi_integration()
+
+    def test_routes(self):
+        connect(
+            Person,
+            ConnectOptions(
+                model_fields=ModelFields(
+                    id=ModelField(
+                        is_identifier=True
+                    )
+                )
+            )
+        )
+
+        router = create_router(Person, pool=None)
+
+        actual = {
+            (route.path, method)
+            for route in router.routes
+            for method in route.methods
+        }
+
+        self.assertEqual(
+            {
+                ('', 'GET'),
+                ('', 'POST'),
+                ('/bulk', 'POST'),
+                ('/{resource_id}', 'GET'),
+                ('/{resource_id}', 'PUT'),
+                ('/{resource_id}', 'PATCH'),
+                ('/{resource_id}', 'DELETE'),
+            },
+            actual
+        )
+
+    def test_routes_without_identifier(self):
+        connect(Event)
+
+        router = create_router(Event, pool=None)
+
+        actual = {
+            (route.path, method)
+            for route in router.routes
+            for method in route.methods
+        }
+
+        self.assertEqual(
+            {
+                ('', 'GET'),
+                ('', 'POST'),
+                ('/bulk', 'POST'),
+            },
+            actual
+        )
+
+    def create_client(self) -> TestClient:
+        connect(
+            Account,
+            ConnectOptions(
+                model_fields=ModelFields(
+                    id=ModelField(
+                        is_identifier=True,
+                        can_filter=False
+                    )
+                )
+            )
+        )
+
+        self.pool = FakeConnectionPool()
+        self.pool.connection.create_table('accounts', [
+            {'email': 'a@example.com', 'name': 'a'},
+            {'email': 'b@example.com', 'name': 'b'},
+            {'email': 'c@example.com', 'name': 'c'},
+        ], columns=['email', 'name'])
+
+        app = FastAPI()
+        app.include_router(create_router(Account, self.pool, chunk_size=2), prefix='/accounts')
+
+        return TestClient(app)
+
+    def get_names(self) -> list[str]:
+        return [row['name'] for row in self.pool.connection.get_table('accounts').rows]
+
+    def test_get_many(self):
+        client = self.create_client()
+
+        response = client.get('/accounts', params={'$count': 'true'})
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual('3', response.headers['X-Total-Count'])
+        self.assertEqual(['a', 'b', 'c'], [item['name'] for item in response.json()])
+        self.assertEqual(0, self.pool.checked_out)
+
+    def test_get_and_delete_by_unfilterable_identifier(self):
+        client = self.create_client()
+
+        response = client.get('/accounts/2')
+        self.assertEqual('b', response.json()['name'])
+
+        response = client.delete('/accounts/2')
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(['a', 'c'], self.get_names())
+        self.assertEqual(0, self.pool.checked_out)
+
+    def test_post_many(self):
+        client = self.create_client()
+
+        response = client.post(
+            '/accounts/bulk',
+            content=b'{"email": "d@example.com", "name": "d"}\n{"email": "e@example.com", "name": "e"}\n',
+            headers={'content-type': 'application/x-ndjson'}
+        )
+
+        self.assertEqual(201, response.status_code)
+        self.assertEqual({'received': 2, 'inserted': 2}, response.json())
+        self.assertEqual(['a', 'b', 'c', 'd', 'e'], self.get_names())
+        self.assertEqual(0, self.pool.checked_out)
+
+        response = client.post(
+            '/accounts/bulk',
+            content=b'[{"email": "f@example.com", "name": "f"}, {"email" 1}]',
+        )
+
+        self.assertEqual(422, response.status_code)
+        self.assertEqual(['a', 'b', 'c', 'd', 'e'], self.get_names())
+        self.assertEqual(0, self.pool.checked_out)
+
+    def test_put_missing_fields(self):
+        client = self.create_client()
+
+        response = client.put('/accounts/1', json={'name': 'x'})
+
+        self.assertEqual(422, response.status_code)
+        self.assertEqual(['body', 'email'], response.json()['detail'][0]['loc'])
+
+        response = client.put('/accounts/1', json={'email': 'x@example.com', 'name': 'x'})
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(['x', 'b', 'c'], self.get_names())
+        self.assertEqual(0, self.pool.checked_out)
@@ -0,0 +1,62 @@
+from dataclasses import dataclass
+from unittest import TestCase
+
+from model_connect import connect
+from model_connect.connect import connect_psycopg2_integration
+from model_connect.integrations.psycopg2.common.processing import IdentifierFilterOptions
+from model_connect.integrations.psycopg2.delete import create_delete_query
+from model_connect.options import ConnectOptions, ModelFields, ModelField
+
+
+@dataclass
+class Person:
+    id: int
+    name: str
+
+
+@dataclass
+class Account:
+    id: int
+    email: str
+
+
+class Tests(TestCase):
+    def setUp(self):
+        connect_psycopg2_integration()
+        connect(Person)
+        connect(
+            Account,
+            ConnectOptions(
+                model_fields=ModelFields(
+                    id=ModelField(
+                        is_identifier=True,
+                        can_filter=False
+                    )
+                )
+            )
+        )
+
+    def test(self):
+        query = create_delete_query(
+            Person,
+            filter_options={'id': 1}
+        )
+
+        self.assertEqual('DELETE FROM people WHERE id = %s RETURNING *', query.sql)
+        self.assertEqual([1], query.vars)
+
+    def test_without_filter_options(self):
+        with self.assertRaises(ValueError):
+            create_delete_query(Person)
+
+    def test_unfilterable_identifier(self):
+        with self.assertRaises(ValueError):
+            create_delete_query(Account, filter_options={'id': 5})
+
+        query = create_delete_query(
+            Account,
+            filter_options=IdentifierFilterOptions({'id': 5})
+        )
+
+        self.assertEqual('DELETE FROM accounts WHERE id = %s RETURNING *', query.sql)
+        self.assertEqual([5], query.vars)
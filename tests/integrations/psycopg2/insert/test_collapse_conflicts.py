@@ -0,0 +1,138 @@
+import io
+from dataclasses import dataclass, replace
+from typing import Optional
+from unittest import TestCase
+
+from model_connect import add_hook, connect, remove_hook
+from model_connect.connect import connect_psycopg2_integration
+from model_connect.integrations.psycopg2 import Psycopg2ModelField, create_insert_query, import_csv, stream_insert
+from model_connect.integrations.psycopg2.testing import FakeConnection
+from model_connect.options import ConnectOptions, ModelFields, ModelField
+
+
+@dataclass
+class Counter:
+    id: Optional[int]
+    key: str
+    value: int
+
+
+class Tests(TestCase):
+    def setUp(self):
+        connect_psycopg2_integration()
+
+        connect(
+            Counter,
+            ConnectOptions(
+                model_fields=ModelFields(
+                    id=ModelField(
+                        is_identifier=True
+                    ),
+                    key=ModelField(
+                        override_integrations=(
+                            Psycopg2ModelField(
+                                has_unique_constraint=True,
+                                encoder=lambda _, value: value and value.lower()
+                            ),
+                        )
+                    )
+                )
+            )
+        )
+
+        self.connection = FakeConnection()
+        self.connection.create_table('counters', [{'key': 'a', 'value': 1}], columns=['key', 'value'])
+
+        self.data = [
+            Counter(None, 'a', 10),
+            Counter(None, 'b', 20),
+            Counter(None, 'A', 30),
+            Counter(None, 'b', 40),
+        ]
+
+    def test_last_write_wins(self):
+        query = create_insert_query(
+            Counter,
+            iter(self.data),
+            on_conflict_options={'do': 'update', 'conflict_targets': ['key']}
+        )
+
+        self.assertEqual(2, query.collapsed)
+        self.assertEqual([('a', 30), ('b', 40)], query.vars)
+
+    def test_merge(self):
+        query = create_insert_query(
+            Counter,
+            self.data,
+            on_conflict_options={
+                'do': 'update',
+                'conflict_targets': ['key'],
+                'merge': lambda previous, item: replace(item, value=previous.value + item.value)
+            }
+        )
+
+        self.assertEqual([('a', 40), ('b', 60)], query.vars)
+
+    def test_do_nothing(self):
+        query = create_insert_query(
+            Counter,
+            self.data,
+            on_conflict_options={'do': 'nothing', 'conflict_targets': ['key']}
+        )
+
+        self.assertEqual(0, query.collapsed)
+        self.assertEqual(4, len(query.vars))
+
+    def test_stream_insert(self):
+        events = []
+        add_hook(events.append, Counter)
+
+        try:
+            with self.connection.cursor() as cursor:
+                results = list(stream_insert(
+                    cursor,
+                    Counter,
+                    self.data,
+                    on_conflict_options={'do': 'update', 'conflict_targets': ['key']}
+                ))
+        finally:
+            remove_hook(events.append, Counter)
+
+        self.assertEqual([30, 40], [result.value for result in results])
+        self.assertEqual(2, len(self.connection.get_table('counters').rows))
+        self.assertIn(('dedupe', 2), [(event.phase, event.size) for event in events])
+
+    def test_import(self):
+        stats = import_csv(
+            self.connection.cursor(),
+            Counter,
+            io.StringIO('key,value\na,5\nb,6\na,7\n'),
+            on_conflict_options={'do': 'update', 'conflict_targets': ['key']}
+        )
+
+        self.assertEqual(1, stats.collapsed)
+        self.assertEqual(
+            {'a': '7', 'b': '6'},
+            {row['key']: row['value'] for row in self.connection.get_table('counters').rows}
+        )
+
+    def test_null_conflict_targets(self):
+        query = create_insert_query(
+            Counter,
+            [Counter(None, None, 1), Counter(None, None, 2), Counter(None, 'a', 3), Counter(None, 'a', 4)],
+            on_conflict_options={'do': 'update', 'conflict_targets': ['key']}
+        )
+
+        self.assertEqual(1, query.collapsed)
+        self.assertEqual([(None, 1), (None, 2), ('a', 4)], query.vars)
+
+    def test_import_null_conflict_targets(self):
+        stats = import_csv(
+            self.connection.cursor(),
+            Counter,
+            io.StringIO('key,value\n,5\n,6\n'),
+            on_conflict_options={'do': 'update', 'conflict_targets': ['key']}
+        )
+
+        self.assertEqual(0, stats.collapsed)
+        self.assertEqual(3, len(self.connection.get_table('counters').rows))
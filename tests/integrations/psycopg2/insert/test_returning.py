@@ -0,0 +1,99 @@
+from dataclasses import dataclass
+from typing import Optional
+from unittest import TestCase
+
+from model_connect import connect
+from model_connect.connect import connect_psycopg2_integration
+from model_connect.integrations.psycopg2 import (
+    Psycopg2ModelField,
+    create_insert_query,
+    insert_count,
+    stream_insert
+)
+from model_connect.integrations.psycopg2.testing import FakeConnection
+from model_connect.options import ConnectOptions, ModelFields, ModelField
+
+
+@dataclass
+class Event:
+    id: Optional[int]
+    kind: str
+    payload: str
+
+
+class Tests(TestCase):
+    def setUp(self):
+        connect_psycopg2_integration()
+
+        connect(
+            Event,
+            ConnectOptions(
+                model_fields=ModelFields(
+                    id=ModelField(
+                        is_identifier=True
+                    ),
+                    kind=ModelField(
+                        override_integrations=(
+                            Psycopg2ModelField(
+                                decoder=lambda _, value: value.upper()
+                            ),
+                        )
+                    )
+                )
+            )
+        )
+
+        self.connection = FakeConnection()
+        self.connection.create_table('events', columns=['kind', 'payload'])
+
+        self.data = [
+            Event(None, 'click', '{}'),
+            Event(None, 'view', '{}'),
+        ]
+
+    def test_create_query(self):
+        for returning, expected in (
+                ('*', ' RETURNING *'),
+                ('identifiers', ' RETURNING id'),
+                (['id', 'kind'], ' RETURNING id , kind'),
+                (None, '')
+        ):
+            query = create_insert_query(Event, self.data, returning=returning)
+
+            self.assertEqual(f'INSERT INTO events ( kind , payload ) VALUES %s{expected}', query.sql)
+
+    def test_invalid(self):
+        with self.assertRaises(AssertionError):
+            create_insert_query(Event, self.data, returning=['missing'])
+
+    def test_stream_insert(self):
+        with self.connection.cursor() as cursor:
+            self.assertEqual(
+                [1, 2],
+                list(stream_insert(cursor, Event, self.data, returning='identifiers'))
+            )
+
+            self.assertEqual(
+                [{'id': 3, 'kind': 'CLICK'}, {'id': 4, 'kind': 'VIEW'}],
+                list(stream_insert(cursor, Event, self.data, returning=['id', 'kind']))
+            )
+
+            self.assertEqual(
+                [],
+                list(stream_insert(cursor, Event, self.data, returning=None))
+            )
+
+        self.assertEqual(6, len(self.connection.get_table('events').rows))
+
+    def test_insert_count(self):
+        with self.connection.cursor() as cursor:
+            self.assertEqual(2, insert_count(cursor, Event, self.data))
+            self.assertEqual(0, insert_count(cursor, Event, []))
+            self.assertEqual(0, insert_count(cursor, Event, iter([])))
+
+    def test_empty_generator(self):
+        with self.connection.cursor() as cursor:
+            self.assertEqual([], list(stream_insert(cursor, Event, iter([]))))
+            self.assertEqual([], list(stream_insert(cursor, Event, (event for event in []), returning=None)))
+
+        self.assertEqual(0, len(self.connection.get_table('events').rows))
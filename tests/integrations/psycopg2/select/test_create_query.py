@@ -150,3 +150,17 @@ class Tests(TestCase):
         )
 
         self.assertEqual('SELECT id FROM people GROUP BY id', query.sql)
+
+    def test_pagination(self):
+        connect(Person)
+
+        query = create_select_query(
+            Person,
+            pagination_options={
+                'limit': 10,
+                'skip': 20
+            }
+        )
+
+        self.assertEqual('SELECT id , name , age FROM people LIMIT %s OFFSET %s', query.sql)
+        self.assertEqual([10, 20], query.vars)
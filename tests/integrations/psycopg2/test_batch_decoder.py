@@ -0,0 +1,97 @@
+import json
+from dataclasses import dataclass
+from typing import Optional
+from unittest import TestCase
+
+from model_connect import connect
+from model_connect.connect import connect_psycopg2_integration
+from model_connect.integrations.psycopg2 import Psycopg2ModelField, stream_select
+from model_connect.integrations.psycopg2.common.streaming import stream_to_dataclass_type
+from model_connect.integrations.psycopg2.testing import FakeConnection
+from model_connect.options import ConnectOptions, ModelFields, ModelField
+
+
+@dataclass
+class Event:
+    id: Optional[int]
+    payload: dict
+    kind: str
+
+
+@dataclass
+class Sample:
+    id: Optional[int]
+    value: int
+
+
+class Tests(TestCase):
+    def setUp(self):
+        connect_psycopg2_integration()
+
+        self.batches = []
+
+        def decode_payloads(_, values):
+            self.batches.append(len(values))
+            return [json.loads(value) for value in values]
+
+        connect(
+            Event,
+            ConnectOptions(
+                model_fields=ModelFields(
+                    payload=ModelField(
+                        override_integrations=(
+                            Psycopg2ModelField(
+                                batch_decoder=decode_payloads
+                            ),
+                        )
+                    ),
+                    kind=ModelField(
+                        override_integrations=(
+                            Psycopg2ModelField(
+                                decoder=lambda _, value: value.upper()
+                            ),
+                        )
+                    )
+                )
+            )
+        )
+
+        self.rows = [
+            {'id': index, 'payload': json.dumps({'index': index}), 'kind': 'click'}
+            for index in range(5)
+        ]
+
+    def test_stream_select(self):
+        connection = FakeConnection({'events': self.rows})
+
+        events = list(stream_select(connection.cursor(), Event, chunk_size=2))
+
+        self.assertEqual([2, 2, 1], self.batches)
+        self.assertEqual(Event(4, {'index': 4}, 'CLICK'), events[4])
+
+    def test_stream_to_dataclass_type(self):
+        events = list(stream_to_dataclass_type(iter(self.rows), Event, chunk_size=3))
+
+        self.assertEqual([3, 2], self.batches)
+        self.assertEqual(Event(0, {'index': 0}, 'CLICK'), events[0])
+
+    def test_wrong_number_of_values(self):
+        connect(
+            Sample,
+            ConnectOptions(
+                model_fields=ModelFields(
+                    value=ModelField(
+                        override_integrations=(
+                            Psycopg2ModelField(
+                                batch_decoder=lambda _, values: values[1:]
+                            ),
+                        )
+                    )
+                )
+            )
+        )
+
+        connection = FakeConnection({'samples': [{'value': index} for index in range(3)]})
+
+        with self.assertRaises(ValueError):
+            list(stream_select(connection.cursor(), Sample))
@@ -0,0 +1,205 @@
+import io
+from dataclasses import dataclass
+from typing import Optional
+from unittest import TestCase
+
+from model_connect import connect
+from model_connect.connect import connect_psycopg2_integration
+from model_connect.integrations.psycopg2 import Psycopg2ModelField, import_csv, import_ndjson, import_records
+from model_connect.integrations.psycopg2.bulk_import import format_copy_value, render_merge_sql
+from model_connect.integrations.psycopg2.testing import FakeConnection
+from model_connect.options import ConnectOptions, ModelFields, ModelField
+
+
+@dataclass
+class Product:
+    id: Optional[int]
+    sku: str
+    name: str
+    price: str
+
+
+class Tests(TestCase):
+    def setUp(self):
+        connect_psycopg2_integration()
+
+        connect(
+            Product,
+            ConnectOptions(
+                model_fields=ModelFields(
+                    sku=ModelField(
+                        override_integrations=(
+                            Psycopg2ModelField(
+                                has_unique_constraint=True,
+                                encoder=lambda _, value: value.upper()
+                            ),
+                        )
+                    )
+                )
+            )
+        )
+
+        self.connection = FakeConnection()
+        self.connection.create_table('products', [
+            {'sku': 'A1', 'name': 'old', 'price': '1.00'}
+        ], columns=['sku', 'name', 'price'])
+
+    def test_format_copy_value(self):
+        self.assertEqual('\\N', format_copy_value(None))
+        self.assertEqual('t', format_copy_value(True))
+        self.assertEqual('a\\tb\\\\c\\nd', format_copy_value('a\tb\\c\nd'))
+        self.assertEqual('{"a":1}', format_copy_value({'a': 1}).replace(' ', ''))
+        self.assertEqual('\\\\x0102', format_copy_value(b'\x01\x02'))
+
+    def test_render_merge_sql(self):
+        self.assertEqual(
+            'INSERT INTO products ( sku , name ) SELECT sku , name FROM staging '
+            'ON CONFLICT ( sku ) DO UPDATE SET name = EXCLUDED.name',
+            render_merge_sql('products', 'staging', ('sku', 'name'), ('UPDATE', ('sku',), ('name',)))
+        )
+
+    def test_import_csv(self):
+        file = io.StringIO(
+            'code,name,price,comment\n'
+            'a1,new,2.00,x\n'
+            'b2,"tab\tbed",,y\n'
+            'c3,third,3.00,z\n'
+        )
+
+        stats = import_csv(
+            self.connection.cursor(),
+            Product,
+            file,
+            column_map={'code': 'sku'},
+            on_conflict_options={'do': 'update'},
+            batch_size=2
+        )
+
+        self.assertEqual(2, stats.batches)
+        self.assertEqual(3, stats.rows)
+        self.assertEqual(3, stats.merged)
+        self.assertEqual({'comment'}, stats.ignored_keys)
+        self.assertEqual(3, stats.copy.rows)
+        self.assertNotIn('products_import_staging', self.connection.tables)
+
+        rows = {row['sku']: row for row in self.connection.get_table('products').rows}
+
+        self.assertEqual(['A1', 'B2', 'C3'], sorted(rows))
+        self.assertEqual('new', rows['A1']['name'])
+        self.assertEqual('tab\tbed', rows['B2']['name'])
+        self.assertIsNone(rows['B2']['price'])
+
+    def test_import_ndjson_do_nothing(self):
+        file = io.StringIO(
+            '{"sku": "a1", "name": "new"}\n'
+            '\n'
+            '{"sku": "d4", "name": "fourth"}\n'
+        )
+
+        stats = import_ndjson(
+            self.connection.cursor(),
+            Product,
+            file,
+            on_conflict_options={'do': 'nothing'}
+        )
+
+        self.assertEqual(1, stats.merged)
+
+        rows = {row['sku']: row for row in self.connection.get_table('products').rows}
+
+        self.assertEqual('old', rows['A1']['name'])
+        self.assertEqual('1.00', rows['A1']['price'])
+        self.assertEqual('fourth', rows['D4']['name'])
+
+    def test_import_empty(self):
+        stats = import_csv(self.connection.cursor(), Product, io.StringIO('sku,name\n'))
+
+        self.assertEqual(0, stats.batches)
+        self.assertIn('read', stats.report())
+
+    def test_import_ndjson_varying_keys(self):
+        file = io.StringIO(
+            '{"sku": "a1", "name": "new"}\n'
+            '{"sku": "a1", "price": "9.99", "extra": 1}\n'
+            '{"sku": "b2", "name": "second"}\n'
+        )
+
+        stats = import_ndjson(
+            self.connection.cursor(),
+            Product,
+            file,
+            on_conflict_options={'do': 'update', 'conflict_targets': ['sku']}
+        )
+
+        self.assertEqual({'extra'}, stats.ignored_keys)
+        self.assertNotIn('products_import_staging', self.connection.tables)
+
+        rows = {row['sku']: row for row in self.connection.get_table('products').rows}
+
+        self.assertEqual('new', rows['A1']['name'])
+        self.assertEqual('9.99', rows['A1']['price'])
+        self.assertEqual('second', rows['B2']['name'])
+
+    def test_import_alternating_keys(self):
+        records = [
+            {'sku': f's{index}', 'name': f'name {index}', **({'price': '1.00'} if index % 2 else {})}
+            for index in range(100)
+        ]
+
+        round_trips = self.connection.round_trips
+        stats = import_records(self.connection.cursor(), Product, records)
+
+        # One staging table, and one COPY, merge and TRUNCATE per set of keys
+        self.assertEqual(9, self.connection.round_trips - round_trips)
+        self.assertEqual(100, stats.merged)
+        self.assertEqual(101, len(self.connection.get_table('products').rows))
+
+    def test_import_keeps_last_write_across_keys(self):
+        stats = import_records(
+            self.connection.cursor(),
+            Product,
+            [
+                {'sku': 'a1', 'name': 'first'},
+                {'sku': 'a1', 'name': 'second', 'price': '2.00'},
+                {'sku': 'a1', 'name': 'third'},
+            ],
+            on_conflict_options={'do': 'update', 'conflict_targets': ['sku']}
+        )
+
+        self.assertEqual(1, stats.batches)
+        self.assertEqual(
+            [{'id': 1, 'sku': 'A1', 'name': 'third', 'price': '2.00'}],
+            self.connection.get_table('products').rows
+        )
+
+    def test_import_drops_staging_table_on_error(self):
+        file = io.StringIO('{"sku": "a1", "name": "new"}\n{"name": "no sku"}\n')
+
+        with self.assertRaises(AssertionError):
+            import_ndjson(
+                self.connection.cursor(),
+                Product,
+                file,
+                on_conflict_options={'do': 'update', 'conflict_targets': ['sku']}
+            )
+
+        self.assertNotIn('products_import_staging', self.connection.tables)
+
+    def test_import_rolls_back_on_error(self):
+        self.connection.commit()
+
+        def records():
+            yield {'sku': 'a1', 'name': 'new'}
+            yield {'sku': 'b2', 'name': 'second'}
+            raise ValueError('read failed')
+
+        with self.assertRaises(ValueError):
+            import_records(self.connection.cursor(), Product, records(), batch_size=1)
+
+        self.connection.rollback()
+
+        self.assertNotIn('products_import_staging', self.connection.tables)
+        self.assertEqual(
+            [{'id': 1, 'sku': 'A1', 'name': 'old', 'price': '1.00'}],
+            self.connection.get_table('products').rows
+        )
@@ -0,0 +1,103 @@
+import json
+from dataclasses import dataclass
+from typing import Optional
+from unittest import TestCase, skipIf
+
+from model_connect import connect
+from model_connect.connect import connect_psycopg2_integration
+from model_connect.integrations.psycopg2 import Psycopg2ModelField, select_columns, stream_select_columns
+from model_connect.integrations.psycopg2.testing import FakeConnection
+from model_connect.options import ConnectOptions, ModelFields, ModelField
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+@dataclass
+class Reading:
+    id: Optional[int]
+    value: float
+    payload: dict
+    kind: str
+
+
+class Tests(TestCase):
+    def setUp(self):
+        connect_psycopg2_integration()
+
+        self.batches = []
+
+        def decode_payloads(_, values):
+            self.batches.append(len(values))
+            return [json.loads(value) for value in values]
+
+        connect(
+            Reading,
+            ConnectOptions(
+                model_fields=ModelFields(
+                    payload=ModelField(
+                        override_integrations=(
+                            Psycopg2ModelField(
+                                batch_decoder=decode_payloads
+                            ),
+                        )
+                    ),
+                    kind=ModelField(
+                        override_integrations=(
+                            Psycopg2ModelField(
+                                decoder=lambda _, value: value.upper()
+                            ),
+                        )
+                    )
+                )
+            )
+        )
+
+        self.connection = FakeConnection({
+            'readings': [
+                {'id': index, 'value': index / 2, 'payload': json.dumps({'index': index}), 'kind': 'temp'}
+                for index in range(5)
+            ]
+        })
+
+    def test_stream_select_columns(self):
+        chunks = list(stream_select_columns(self.connection.cursor(), Reading, chunk_size=2))
+
+        self.assertEqual(3, len(chunks))
+        self.assertEqual([2, 2, 1], self.batches)
+        self.assertEqual({
+            'id': [0, 1],
+            'value': [0.0, 0.5],
+            'payload': [{'index': 0}, {'index': 1}],
+            'kind': ['TEMP', 'TEMP']
+        }, chunks[0])
+
+    def test_select_columns(self):
+        table = select_columns(
+            self.connection.cursor(),
+            Reading,
+            ['id', 'value'],
+            filter_options={'id': {'>=': 3}}
+        )
+
+        self.assertEqual({'id': [3, 4], 'value': [1.5, 2.0]}, table)
+
+    def test_select_columns_empty(self):
+        table = select_columns(
+            self.connection.cursor(),
+            Reading,
+            ['id', 'kind'],
+            filter_options={'id': {'>=': 10}}
+        )
+
+        self.assertEqual({'id': [], 'kind': []}, table)
+
+    @skipIf(numpy is None, 'numpy is not installed')
+    def test_select_columns_numpy(self):
+        table = select_columns(self.connection.cursor(), Reading, array_type='numpy')
+
+        self.assertEqual('int64', table['id'].dtype)
+        self.assertEqual('float64', table['value'].dtype)
+        self.assertEqual(object, table['payload'].dtype)
@@ -0,0 +1,155 @@
+import io
+from dataclasses import dataclass
+from typing import Optional
+from queue import Queue
+from unittest import TestCase, skipIf
+
+from psycopg2 import ProgrammingError
+
+from model_connect import connect
+from model_connect.connect import connect_psycopg2_integration
+from model_connect.integrations.psycopg2 import copy_to, stream_export, export_parquet
+from model_connect.integrations.psycopg2.export import QueueWriter, create_copy_to_sql
+from model_connect.integrations.psycopg2.testing import FakeConnection
+
+try:
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+
+@dataclass
+class Person:
+    id: Optional[int]
+    name: str
+    age: int
+
+
+class Tests(TestCase):
+    def setUp(self):
+        connect_psycopg2_integration()
+        connect(Person)
+
+        self.connection = FakeConnection({
+            'people': [
+                {'id': index, 'name': f'person {index}', 'age': 20 + index}
+                for index in range(100)
+            ]
+        })
+
+    def test_create_copy_to_sql(self):
+        self.assertEqual(
+            "COPY (SELECT 1) TO STDOUT WITH (FORMAT csv, HEADER true, DELIMITER E';')",
+            create_copy_to_sql('SELECT 1', 'csv', True, ';')
+        )
+        self.assertEqual(
+            'COPY (SELECT 1) TO STDOUT WITH (FORMAT text)',
+            create_copy_to_sql('SELECT 1', 'text', True)
+        )
+
+    def test_create_copy_to_sql_quoting(self):
+        self.assertEqual(
+            r"COPY (SELECT 1) TO STDOUT WITH (FORMAT text, DELIMITER E'''', NULL E'\\N'' OR ''')",
+            create_copy_to_sql('SELECT 1', 'text', delimiter="'", null=r"\N' OR '")
+        )
+
+        with self.assertRaises(ValueError):
+            create_copy_to_sql('SELECT 1', 'csv', delimiter=';;')
+
+        with self.assertRaises(ValueError):
+            create_copy_to_sql('SELECT 1', 'csv', delimiter='')
+
+    def test_copy_to(self):
+        file = io.BytesIO()
+
+        with self.connection.cursor() as cursor:
+            rows = copy_to(
+                cursor,
+                Person,
+                file,
+                ['id', 'name'],
+                filter_options={'age': {'<': 22}},
+                sort_options={'id': 'desc'}
+            )
+
+        self.assertEqual(2, rows)
+        self.assertEqual(b'id,name\n1,person 1\n0,person 0\n', file.getvalue())
+
+    def test_stream_export(self):
+        with self.connection.cursor() as cursor:
+            chunks = list(stream_export(cursor, Person, format_='text', chunk_size=100))
+
+        data = b''.join(chunks)
+
+        self.assertEqual(100, data.count(b'\n'))
+        self.assertTrue(data.startswith(b'0\tperson 0\t20\n'))
+
+    def test_stream_export_closed_early(self):
+        with self.connection.cursor() as cursor:
+            chunks = stream_export(cursor, Person, chunk_size=10, max_pending_chunks=1)
+            next(chunks)
+            chunks.close()
+
+    def test_stream_export_error(self):
+        connection = FakeConnection()
+
+        with connection.cursor() as cursor:
+            with self.assertRaises(ProgrammingError):
+                list(stream_export(cursor, Person))
+
+    def test_queue_writer(self):
+        queue = Queue()
+        writer = QueueWriter(queue, 10)
+
+        for _ in range(5):
+            writer.write(b'1234')
+
+        writer.flush()
+
+        self.assertEqual([b'123412341234', b'12341234'], [queue.get_nowait() for _ in range(2)])
+
+    @skipIf(pyarrow is None, 'pyarrow is not installed')
+    def test_export_parquet(self):
+        file = io.BytesIO()
+
+        with self.connection.cursor() as cursor:
+            rows = export_parquet(cursor, Person, file, chunk_size=30)
+
+        file.seek(0)
+
+        self.assertEqual(100, rows)
+        self.assertEqual(100, pyarrow.parquet.read_table(file).num_rows)
+
+    @skipIf(pyarrow is None, 'pyarrow is not installed')
+    def test_export_parquet_null_first_chunk(self):
+        connection = FakeConnection({
+            'people': [
+                {'id': index, 'name': None if index < 30 else f'person {index}', 'age': 20 + index}
+                for index in range(100)
+            ]
+        })
+
+        file = io.BytesIO()
+
+        with connection.cursor() as cursor:
+            rows = export_parquet(cursor, Person, file, chunk_size=30)
+
+        file.seek(0)
+        table = pyarrow.parquet.read_table(file)
+
+        self.assertEqual(100, rows)
+        self.assertEqual(pyarrow.string(), table.schema.field('name').type)
+        self.assertEqual(70, table.column('name').drop_null().length())
+
+    @skipIf(pyarrow is None, 'pyarrow is not installed')
+    def test_export_parquet_empty(self):
+        file = io.BytesIO()
+
+        with self.connection.cursor() as cursor:
+            rows = export_parquet(cursor, Person, file, filter_options={'age': {'<': 0}})
+
+        file.seek(0)
+        table = pyarrow.parquet.read_table(file)
+
+        self.assertEqual(0, rows)
+        self.assertEqual(pyarrow.int64(), table.schema.field('age').type)
@@ -0,0 +1,137 @@
+from dataclasses import dataclass
+from typing import Optional
+from unittest import TestCase
+
+from model_connect import connect
+from model_connect.connect import connect_psycopg2_integration
+from model_connect.integrations.psycopg2 import Psycopg2ModelField
+from model_connect.integrations.psycopg2.index_advisor import (
+    parse_index_definition,
+    suggest_indexes,
+    find_unindexed_fields
+)
+from model_connect.integrations.psycopg2.stats import QueryStats
+from model_connect.options import ConnectOptions, ModelFields, ModelField
+
+
+@dataclass
+class Person:
+    id: Optional[int]
+    name: str
+    age: int
+    bio: str
+
+
+@dataclass
+class Member:
+    id: Optional[int]
+    full_name: str
+    email: str
+    computed: str
+
+
+class Tests(TestCase):
+    def setUp(self):
+        connect_psycopg2_integration()
+
+        connect(
+            Person,
+            ConnectOptions(
+                model_fields=ModelFields(
+                    bio=ModelField(
+                        can_filter=False
+                    )
+                )
+            )
+        )
+
+        self.indexes = {
+            'people': [
+                parse_index_definition(
+                    'people',
+                    'people_pkey',
+                    'CREATE UNIQUE INDEX people_pkey ON public.people USING btree (id)'
+                ),
+                parse_index_definition(
+                    'people',
+                    'ix_people_name_age',
+                    'CREATE INDEX ix_people_name_age ON public.people USING btree (name, age DESC)'
+                )
+            ]
+        }
+
+    def test_parse_index_definition(self):
+        index = self.indexes['people'][1]
+
+        self.assertEqual(('name', 'age'), index.columns)
+        self.assertEqual('btree', index.method)
+        self.assertFalse(index.unique)
+        self.assertTrue(self.indexes['people'][0].unique)
+
+    def test_suggest_indexes(self):
+        def create_stats(filter_columns, sort_columns, calls, duration):
+            stats = QueryStats(Person, 'select', 'x', 'SELECT', filter_columns, sort_columns)
+            stats.calls = calls
+            stats.total_duration = duration
+            return stats
+
+        suggestions = suggest_indexes(
+            [
+                create_stats(('name',), (('age', 'DESC'),), 100, 5.0),
+                create_stats(('age',), (('name', 'ASC'),), 10, 1.0),
+                create_stats(('age',), (), 50, 3.0),
+                create_stats(('id',), (), 50, 3.0),
+            ],
+            self.indexes
+        )
+
+        self.assertEqual(
+            [('age',), ('age', 'name')],
+            [suggestion.columns for suggestion in suggestions]
+        )
+        self.assertEqual(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_people_age ON people (age)',
+            suggestions[0].statement
+        )
+
+    def test_find_unindexed_fields(self):
+        fields = find_unindexed_fields(self.indexes, [Person])
+
+        self.assertEqual(['age'], [field.field_name for field in fields])
+
+    def test_find_unindexed_fields_renamed_column(self):
+        connect(
+            Member,
+            ConnectOptions(
+                model_fields=ModelFields(
+                    full_name=ModelField(
+                        override_integrations=(
+                            Psycopg2ModelField(
+                                column_name='name'
+                            ),
+                        )
+                    ),
+                    computed=ModelField(
+                        is_db_column=False
+                    )
+                )
+            )
+        )
+
+        indexes = {
+            'members': [
+                parse_index_definition(
+                    'members',
+                    'ix_members_name',
+                    'CREATE INDEX ix_members_name ON public.members USING btree (name)'
+                )
+            ]
+        }
+
+        fields = find_unindexed_fields(indexes, [Member])
+
+        self.assertEqual(['id', 'email'], [field.field_name for field in fields])
+        self.assertEqual(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_members_email ON members (email)',
+            fields[1].statement
+        )
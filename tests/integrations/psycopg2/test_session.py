@@ -0,0 +1,169 @@
+from dataclasses import dataclass
+from typing import Any, Optional
+from unittest import TestCase
+
+from model_connect import connect
+from model_connect.connect import connect_psycopg2_integration
+from model_connect.integrations.psycopg2 import Psycopg2ModelField, Session
+from model_connect.integrations.psycopg2.testing import FakeConnection
+from model_connect.options import ConnectOptions, ModelFields, ModelField
+
+
+@dataclass
+class Author:
+    id: Optional[int]
+    name: str
+
+
+@dataclass
+class Post:
+    id: Optional[int]
+    title: str
+    author_id: Optional[int] = None
+    author: Optional[Author] = None
+
+
+@dataclass
+class Employee:
+    id: Optional[int]
+    name: str
+    manager_id: Optional[int] = None
+    manager: Optional[Any] = None
+
+
+@dataclass
+class Left:
+    id: Optional[int]
+    right: Optional[Any] = None
+
+
+@dataclass
+class Right:
+    id: Optional[int]
+    left: Optional[Any] = None
+
+
+# Self and mutual references cannot be annotated directly on a dataclass
+Employee.__dataclass_fields__['manager'].type = Optional[Employee]
+Left.__dataclass_fields__['right'].type = Optional[Right]
+Right.__dataclass_fields__['left'].type = Optional[Left]
+
+
+class Tests(TestCase):
+    def setUp(self):
+        connect_psycopg2_integration()
+
+        connect(
+            Author,
+            ConnectOptions(
+                model_fields=ModelFields(
+                    id=ModelField(
+                        is_identifier=True
+                    )
+                )
+            )
+        )
+
+        connect(
+            Post,
+            ConnectOptions(
+                model_fields=ModelFields(
+                    id=ModelField(
+                        is_identifier=True
+                    ),
+                    author=ModelField(
+                        override_integrations=(
+                            Psycopg2ModelField(
+                                include_in_select=False
+                            ),
+                        )
+                    )
+                )
+            )
+        )
+
+        self.connection = FakeConnection()
+        self.connection.create_table('authors', columns=['name'])
+        self.connection.create_table('posts', columns=['title', 'author_id'])
+
+    def test_commit(self):
+        with self.connection.cursor() as cursor:
+            with Session(cursor) as session:
+                ann = Author(None, 'ann')
+                bob = Author(None, 'bob')
+
+                # Posts are added first but flushed after the authors they reference
+                session.add_all([
+                    Post(None, 'first', author=ann),
+                    Post(None, 'second', author=bob),
+                    Post(None, 'third', author=ann)
+                ])
+                session.add_all([ann, bob])
+
+                self.assertEqual(5, len(session))
+
+        self.assertEqual(0, len(session))
+        self.assertEqual(1, self.connection.commits)
+        self.assertEqual(2, session.stats.statements)
+        self.assertEqual((1, 2), (ann.id, bob.id))
+        self.assertEqual(
+            [(1, 'first', 1), (2, 'second', 2), (3, 'third', 1)],
+            [(row['id'], row['title'], row['author_id']) for row in self.connection.get_table('posts').rows]
+        )
+
+    def test_flush_threshold(self):
+        with self.connection.cursor() as cursor:
+            session = Session(cursor, flush_threshold=2)
+
+            author = Author(None, 'ann')
+            session.add(author)
+            session.add(Post(None, 'first', author=author))
+            self.assertEqual(2, len(session))
+
+            session.add(Post(None, 'second', author=author))
+
+        self.assertEqual(0, len(session))
+        self.assertEqual(1, author.id)
+        self.assertEqual(2, len(self.connection.get_table('posts').rows))
+
+    def test_rollback(self):
+        with self.connection.cursor() as cursor:
+            with self.assertRaises(RuntimeError):
+                with Session(cursor) as session:
+                    session.add(Author(None, 'ann'))
+                    session.flush()
+                    session.add(Author(None, 'bob'))
+                    raise RuntimeError()
+
+        self.assertEqual(0, len(session))
+        self.assertEqual([], self.connection.get_table('authors').rows)
+
+    def test_self_reference(self):
+        connect(Employee, ConnectOptions(model_fields=ModelFields(id=ModelField(is_identifier=True))))
+        self.connection.create_table('employees', columns=['name', 'manager_id'])
+
+        with self.connection.cursor() as cursor:
+            with Session(cursor) as session:
+                boss = Employee(None, 'ann')
+                session.add(boss)
+                session.flush()
+
+                session.add(Employee(None, 'bob', manager=boss))
+
+        self.assertEqual(
+            [('ann', None), ('bob', 1)],
+            [(row['name'], row['manager_id']) for row in self.connection.get_table('employees').rows]
+        )
+
+    def test_cycle(self):
+        for dataclass_type in (Left, Right):
+            connect(dataclass_type, ConnectOptions(model_fields=ModelFields(id=ModelField(is_identifier=True))))
+
+        with self.connection.cursor() as cursor:
+            session = Session(cursor)
+            session.add(Left(None))
+
+            with self.assertRaises(ValueError) as context:
+                session.flush()
+
+        self.assertIn('depend on each other', str(context.exception))
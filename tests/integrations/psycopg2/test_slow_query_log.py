@@ -0,0 +1,96 @@
+from dataclasses import dataclass
+from typing import Optional
+from unittest import TestCase
+
+from model_connect import connect
+from model_connect.connect import connect_psycopg2_integration
+from model_connect.integrations.psycopg2 import stream_select, select_count, SlowQueryLog
+from model_connect.integrations.psycopg2.slow_query_log import redact_all
+from model_connect.integrations.psycopg2.testing import FakeConnection
+
+
+@dataclass
+class Person:
+    id: Optional[int]
+    name: str
+
+
+class ExplainConnection:
+    def __init__(self):
+        self.executed = []
+        self.closed = False
+
+    def cursor(self):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def execute(self, sql, vars_):
+        self.executed.append((sql, vars_))
+
+    def fetchall(self):
+        return [('Seq Scan on people',)]
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+class Tests(TestCase):
+    def setUp(self):
+        connect_psycopg2_integration()
+        connect(Person)
+
+        self.connection = FakeConnection(
+            {'people': [{'name': 'bob'}, {'name': 'joe'}]},
+            latency=0.01
+        )
+
+    def test_threshold(self):
+        sunk = []
+
+        with SlowQueryLog(threshold=0.005, sink=sunk.append, redact=redact_all) as log:
+            list(stream_select(self.connection.cursor(), Person, filter_options={'name': 'bob'}))
+
+        with SlowQueryLog(threshold=10) as fast_log:
+            select_count(self.connection.cursor(), Person)
+
+        self.assertEqual(1, len(log.entries))
+        self.assertEqual([log.entries[0]], sunk)
+
+        entry = log.entries[0]
+
+        self.assertEqual('SELECT id , name FROM people WHERE name = %s', entry.sql)
+        self.assertEqual(['?'], entry.vars)
+        self.assertEqual(1, entry.rows)
+        self.assertGreaterEqual(entry.duration, 0.01)
+
+        self.assertEqual(0, len(fast_log.entries))
+
+    def test_explain(self):
+        explain_connection = ExplainConnection()
+
+        with SlowQueryLog(threshold=0, explain_connection_factory=lambda: explain_connection) as log:
+            select_count(self.connection.cursor(), Person, {'name': 'bob'})
+
+        entry = log.entries[0]
+
+        self.assertEqual(['Seq Scan on people'], entry.explain)
+        self.assertEqual(
+            [('EXPLAIN (ANALYZE, BUFFERS) SELECT COUNT(*) FROM people WHERE name = %s', ['bob'])],
+            explain_connection.executed
+        )
+        self.assertTrue(explain_connection.closed)
+
+    def test_ring_buffer(self):
+        with SlowQueryLog(threshold=0, max_entries=2) as log:
+            for _ in range(3):
+                select_count(self.connection.cursor(), Person)
+
+        self.assertEqual(2, len(log.entries))
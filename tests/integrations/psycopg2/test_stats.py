@@ -0,0 +1,63 @@
+from dataclasses import dataclass
+from typing import Optional
+from unittest import TestCase
+
+from model_connect import connect
+from model_connect.connect import connect_psycopg2_integration
+from model_connect.integrations.psycopg2 import stream_select, select_count, QueryStatsCollector
+from model_connect.integrations.psycopg2.testing import FakeConnection
+
+
+@dataclass
+class Person:
+    id: Optional[int]
+    name: str
+    age: int
+
+
+class Tests(TestCase):
+    def setUp(self):
+        connect_psycopg2_integration()
+        connect(Person)
+
+        self.connection = FakeConnection({
+            'people': [{'name': str(index), 'age': index} for index in range(10)]
+        })
+
+    def test_stats(self):
+        with QueryStatsCollector() as collector:
+            for age in range(3):
+                list(stream_select(
+                    self.connection.cursor(),
+                    Person,
+                    filter_options={'age': {'>': age}},
+                    sort_options={'name': 'desc'}
+                ))
+
+            select_count(self.connection.cursor(), Person, {'name': 'bob'})
+
+        stats = collector.get_stats(Person)
+        by_operation = {s.operation: s for s in stats}
+
+        self.assertEqual(2, len(stats))
+
+        select_stats = by_operation['select']
+
+        self.assertEqual(3, select_stats.calls)
+        self.assertEqual(9 + 8 + 7, select_stats.rows)
+        self.assertEqual(('age',), select_stats.filter_columns)
+        self.assertEqual((('name', 'DESC'),), select_stats.sort_columns)
+        self.assertEqual(
+            'SELECT id , name , age FROM people WHERE age > %s ORDER BY name DESC',
+            select_stats.sql
+        )
+        self.assertEqual(16, len(select_stats.fingerprint))
+
+        self.assertEqual(1, by_operation['select_count'].calls)
+        self.assertEqual(('name',), by_operation['select_count'].filter_columns)
+
+        exported = []
+        collector.export(exported.append)
+
+        self.assertEqual({'select', 'select_count'}, {item['operation'] for item in exported})
+        self.assertIn('people WHERE age > %s', collector.report())
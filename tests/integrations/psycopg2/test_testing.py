@@ -0,0 +1,141 @@
+import io
+from dataclasses import dataclass
+from typing import Optional
+from unittest import TestCase
+
+from model_connect import connect
+from model_connect.connect import connect_psycopg2_integration
+from model_connect.integrations.psycopg2 import (
+    stream_select,
+    select_count,
+    stream_insert,
+    stream_update,
+    stream_delete
+)
+from model_connect.integrations.psycopg2.testing import FakeConnection
+from model_connect.options import ConnectOptions, ModelFields, ModelField
+
+
+@dataclass
+class Person:
+    id: Optional[int]
+    name: str
+    age: int
+
+
+class Tests(TestCase):
+    def setUp(self):
+        connect_psycopg2_integration()
+
+        connect(
+            Person,
+            ConnectOptions(
+                model_fields=ModelFields(
+                    id=ModelField(
+                        is_identifier=True
+                    )
+                )
+            )
+        )
+
+        self.connection = FakeConnection()
+        self.connection.create_table('people', columns=['name', 'age'])
+
+        with self.connection.cursor() as cursor:
+            list(stream_insert(cursor, Person, [
+                Person(None, 'bob', 12),
+                Person(None, 'joe', 13),
+                Person(None, 'jane', 14),
+            ]))
+
+    def test_select(self):
+        with self.connection.cursor() as cursor:
+            people = list(stream_select(
+                cursor,
+                Person,
+                filter_options={'age': {'>': 12}},
+                sort_options={'name': 'asc'},
+                pagination_options={'limit': 1, 'skip': 1}
+            ))
+
+            self.assertEqual([Person(2, 'joe', 13)], people)
+            self.assertEqual(2, select_count(cursor, Person, {'age': {'>': 12}}))
+
+    def test_insert_on_conflict(self):
+        with self.connection.cursor() as cursor:
+            people = list(stream_insert(
+                cursor,
+                Person,
+                [Person(None, 'bob', 20), Person(None, 'ann', 30)],
+                on_conflict_options={'do': 'update', 'conflict_targets': ['name']}
+            ))
+
+            self.assertEqual([Person(1, 'bob', 20), Person(4, 'ann', 30)], people)
+            self.assertEqual(4, select_count(cursor, Person))
+
+    def test_update_and_delete(self):
+        with self.connection.cursor() as cursor:
+            people = list(stream_update(cursor, Person, Person(2, 'joseph', 31)))
+            self.assertEqual([Person(2, 'joseph', 31)], people)
+
+            people = list(stream_delete(cursor, Person, {'name': 'bob'}))
+            self.assertEqual([Person(1, 'bob', 12)], people)
+
+            self.assertEqual(2, select_count(cursor, Person))
+
+    def test_rollback(self):
+        self.connection.commit()
+
+        with self.connection.cursor() as cursor:
+            list(stream_delete(cursor, Person, {'age': {'>': 0}}))
+            self.assertEqual(0, select_count(cursor, Person))
+
+            self.connection.rollback()
+            self.assertEqual(3, select_count(cursor, Person))
+
+    def test_rollback_tables(self):
+        self.connection.commit()
+
+        with self.connection.cursor() as cursor:
+            cursor.execute('CREATE TEMP TABLE staging AS SELECT name FROM people WITH NO DATA')
+            cursor.execute('DROP TABLE people')
+
+            self.connection.rollback()
+
+        self.assertEqual(3, len(self.connection.get_table('people').rows))
+        self.assertNotIn('staging', self.connection.tables)
+
+    def test_copy(self):
+        with self.connection.cursor() as cursor:
+            select = cursor.mogrify('SELECT name , age FROM people WHERE age > %s', (12,))
+
+            output = io.StringIO()
+            cursor.copy_expert(f'COPY ({select.decode()}) TO STDOUT WITH (FORMAT csv, HEADER)', output)
+
+            self.assertEqual('name,age\njoe,13\njane,14\n', output.getvalue())
+
+            cursor.copy_expert(
+                'COPY people ( name , age ) FROM STDIN WITH (FORMAT csv)',
+                io.StringIO('ann,40\n')
+            )
+
+            people = list(stream_select(cursor, Person, filter_options={'name': 'ann'}))
+            self.assertEqual([Person(4, 'ann', '40')], people)
+
+    def test_latency(self):
+        connection = FakeConnection({'people': []}, latency=0.001)
+
+        with connection.cursor(name='server_side') as cursor:
+            list(stream_select(cursor, Person))
+
+        self.assertEqual(2, connection.round_trips)
+
+    def test_row(self):
+        with self.connection.cursor() as cursor:
+            cursor.execute('SELECT id , name FROM people WHERE id = %s', (1,))
+            row = cursor.fetchone()
+
+        self.assertEqual(1, row[0])
+        self.assertEqual('bob', row['name'])
+        self.assertEqual({'id': 1, 'name': 'bob'}, dict(row))
+        self.assertEqual(['id', 'name'], [column.name for column in cursor.description])
@@ -0,0 +1,176 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from queue import Full
+from threading import Event, Thread
+from typing import Optional
+from unittest import TestCase
+
+from model_connect import connect
+from model_connect.connect import connect_psycopg2_integration
+from model_connect.integrations.psycopg2 import WriteBehindInserter
+from model_connect.integrations.psycopg2.testing import FakeConnection, FakeConnectionPool
+from model_connect.options import ConnectOptions, ModelFields, ModelField
+
+
+@dataclass
+class Metric:
+    id: Optional[int]
+    name: str
+    value: int
+
+
+class Tests(TestCase):
+    def setUp(self):
+        connect_psycopg2_integration()
+
+        connect(
+            Metric,
+            ConnectOptions(
+                model_fields=ModelFields(
+                    id=ModelField(
+                        is_identifier=True
+                    )
+                )
+            )
+        )
+
+        self.connection = FakeConnection()
+        self.connection.create_table('metrics', columns=['name', 'value'])
+        self.pool = FakeConnectionPool(self.connection)
+
+    def get_rows(self):
+        return self.connection.get_table('metrics').rows
+
+    def test_batches(self):
+        with WriteBehindInserter(Metric, self.pool, batch_size=10, flush_interval=60) as inserter:
+            threads = [
+                Thread(target=inserter.put_all, args=([Metric(None, f't{t}', i) for i in range(25)],))
+                for t in range(4)
+            ]
+
+            for thread in threads:
+                thread.start()
+
+            for thread in threads:
+                thread.join()
+
+            inserter.flush()
+
+            self.assertEqual(100, len(self.get_rows()))
+
+        metrics = inserter.metrics()
+
+        self.assertEqual(100, metrics.enqueued)
+        self.assertEqual(100, metrics.written)
+        self.assertEqual(10, metrics.max_batch_size)
+        self.assertEqual(0, metrics.queue_depth)
+
+    def test_flush_under_load(self):
+        self.connection.latency = 0.001
+        stop = Event()
+
+        def produce():
+            index = 0
+
+            while not stop.is_set():
+                inserter.put(Metric(None, 'a', index))
+                index += 1
+
+        with WriteBehindInserter(Metric, self.pool, batch_size=10, flush_interval=60) as inserter:
+            producer = Thread(target=produce)
+            producer.start()
+
+            try:
+                inserter.put_all([Metric(None, 'b', i) for i in range(20)])
+
+                flusher = Thread(target=inserter.flush)
+                flusher.start()
+                flusher.join(5)
+
+                self.assertFalse(flusher.is_alive())
+                self.assertEqual(20, sum(row['name'] == 'b' for row in self.get_rows()))
+            finally:
+                stop.set()
+                producer.join()
+
+    def test_put_during_close(self):
+        for _ in range(20):
+            self.connection.get_table('metrics').rows = []
+            inserter = WriteBehindInserter(Metric, self.pool, flush_interval=60)
+            accepted = []
+
+            def produce():
+                for index in range(200):
+                    try:
+                        inserter.put(Metric(None, 'a', index))
+                    except RuntimeError:
+                        return
+
+                    accepted.append(index)
+
+            producer = Thread(target=produce)
+            producer.start()
+            inserter.close()
+            producer.join()
+
+            self.assertEqual(len(accepted), len(self.get_rows()))
+            self.assertEqual(len(accepted), inserter.metrics().written)
+
+    def test_flush_interval(self):
+        inserter = WriteBehindInserter(Metric, self.pool, flush_interval=0.01)
+        inserter.start()
+        inserter.put(Metric(None, 'a', 1))
+
+        for _ in range(200):
+            if self.get_rows():
+                break
+
+            time.sleep(0.01)
+
+        self.assertEqual(1, len(self.get_rows()))
+
+        inserter.close()
+
+    def test_close_writes_pending(self):
+        inserter = WriteBehindInserter(Metric, self.pool, flush_interval=60, method='copy')
+        inserter.put_all([Metric(None, 'a', 1), Metric(None, 'b\tc', 2)])
+        inserter.close()
+
+        self.assertEqual(['a', 'b\tc'], [row['name'] for row in self.get_rows()])
+
+        with self.assertRaises(RuntimeError):
+            inserter.put(Metric(None, 'c', 3))
+
+    def test_backpressure(self):
+        inserter = WriteBehindInserter(Metric, self.pool, max_queue_size=2, put_timeout=0.01)
+        inserter.put_all([Metric(None, 'a', 1), Metric(None, 'b', 2)])
+
+        with self.assertRaises(Full):
+            inserter.put(Metric(None, 'c', 3))
+
+        self.assertEqual(1, inserter.metrics().blocked_puts)
+        self.assertEqual(2, inserter.metrics().max_queue_depth)
+
+        inserter.close()
+
+    def test_put_async(self):
+        async def produce(inserter):
+            await asyncio.gather(*(inserter.put_async(Metric(None, 'a', i)) for i in range(5)))
+
+        with WriteBehindInserter(Metric, self.pool, max_queue_size=2) as inserter:
+            asyncio.run(produce(inserter))
+
+        self.assertEqual(5, len(self.get_rows()))
+
+    def test_error(self):
+        errors = []
+
+        self.connection.tables.pop('metrics')
+
+        with WriteBehindInserter(Metric, self.pool, on_error=lambda batch, e: errors.append(len(batch))) as inserter:
+            inserter.put(Metric(None, 'a', 1))
+
+        self.assertEqual([1], errors)
+        self.assertEqual(1, inserter.metrics().failed)
+        self.assertIn('does not exist', inserter.metrics().last_error)
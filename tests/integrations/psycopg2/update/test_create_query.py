@@ -0,0 +1,57 @@
+from dataclasses import dataclass
+from unittest import TestCase
+
+from model_connect import connect
+from model_connect.connect import connect_psycopg2_integration
+from model_connect.constants import UNDEFINED
+from model_connect.integrations.psycopg2.update import create_update_query
+from model_connect.options import ConnectOptions, ModelFields, ModelField
+
+
+@dataclass
+class Person:
+    id: int
+    name: str
+    age: int
+
+
+connect_options = ConnectOptions(
+    model_fields=ModelFields(
+        id=ModelField(
+            is_identifier=True
+        )
+    )
+)
+
+
+class Tests(TestCase):
+    def setUp(self):
+        connect_psycopg2_integration()
+        connect(Person, connect_options)
+
+    def test(self):
+        query = create_update_query(
+            Person,
+            Person(1, 'bob', 12)
+        )
+
+        self.assertEqual('UPDATE people SET name = %s , age = %s WHERE id = %s RETURNING *', query.sql)
+        self.assertEqual(['bob', 12, 1], query.vars)
+
+    def test_partial(self):
+        query = create_update_query(
+            Person,
+            Person(1, UNDEFINED, 12),
+            partial=True
+        )
+
+        self.assertEqual('UPDATE people SET age = %s WHERE id = %s RETURNING *', query.sql)
+        self.assertEqual([12, 1], query.vars)
+
+    def test_without_filters(self):
+        with self.assertRaises(ValueError):
+            create_update_query(
+                Person,
+                Person(1, 'bob', 12),
+                filter_options={}
+            )
@@ -0,0 +1,67 @@
+from dataclasses import FrozenInstanceError, dataclass
+from unittest import TestCase
+
+from model_connect import connect
+from model_connect.connect import connect_psycopg2_integration
+from model_connect.options import ConnectOptions, ModelFields, ModelField
+from model_connect.options.model_field.dtos.request import RequestDtos, RequestDto
+from model_connect.registry import get_model_field
+
+
+@dataclass
+class Person:
+    id: int
+    name: str
+    age: int
+
+
+class Tests(TestCase):
+    def setUp(self):
+        connect_psycopg2_integration()
+        connect(
+            Person,
+            ConnectOptions(
+                model_fields=ModelFields(
+                    id=ModelField(
+                        request_dtos=RequestDtos(
+                            post=RequestDto(
+                                include=False
+                            )
+                        )
+                    )
+                )
+            )
+        )
+
+    def test_slots(self):
+        self.assertFalse(hasattr(get_model_field(Person, 'id'), '__dict__'))
+        self.assertFalse(hasattr(get_model_field(Person, 'id', 'psycopg2'), '__dict__'))
+        self.assertFalse(hasattr(get_model_field(Person, 'id').request_dtos, '__dict__'))
+
+    def test_default_dtos_are_shared(self):
+        name = get_model_field(Person, 'name')
+        age = get_model_field(Person, 'age')
+
+        self.assertIs(name.request_dtos, age.request_dtos)
+        self.assertIs(name.response_dtos, age.response_dtos)
+        self.assertIs(name.request_dtos['get'], name.request_dtos['put'])
+
+    def test_overridden_dtos_are_not_shared(self):
+        id_ = get_model_field(Person, 'id')
+        name = get_model_field(Person, 'name')
+
+        self.assertIsNot(id_.request_dtos, name.request_dtos)
+        self.assertFalse(id_.request_dtos['post'].include)
+        self.assertTrue(name.request_dtos['post'].include)
+        self.assertIs(id_.request_dtos['get'], name.request_dtos['get'])
+
+    def test_shared_dtos_are_read_only(self):
+        name = get_model_field(Person, 'name')
+
+        with self.assertRaises(FrozenInstanceError):
+            name.request_dtos['post'].include = False
+
+        with self.assertRaises(TypeError):
+            name.request_dtos['post'] = RequestDto(include=False)
+
+        self.assertTrue(get_model_field(Person, 'age').request_dtos['post'].include)
@@ -0,0 +1,126 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from dataclasses import dataclass
+from unittest import TestCase
+from unittest.mock import patch
+
+from model_connect import connect
+from model_connect import cache
+from model_connect.cache import describe, enable_cache, disable_cache, fingerprint
+from model_connect.connect import connect_psycopg2_integration
+from model_connect.integrations.psycopg2 import Psycopg2ModelField
+from model_connect.options import ConnectOptions, Model, ModelFields, ModelField
+from model_connect.registry import get_schema
+
+
+@dataclass
+class Person:
+    id: int
+    name: str
+
+
+def encode_tags(_, value):
+    return sorted(value, key=lambda tag: tag.lower())
+
+
+def create_tag_options() -> ConnectOptions:
+    return ConnectOptions(
+        model_fields=ModelFields(
+            name=ModelField(
+                override_integrations=(
+                    Psycopg2ModelField(
+                        encoder=encode_tags
+                    ),
+                )
+            )
+        )
+    )
+
+
+class Tests(TestCase):
+    def setUp(self):
+        connect_psycopg2_integration()
+
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'metadata.json')
+
+    def tearDown(self):
+        disable_cache()
+        self.directory.cleanup()
+
+    def test_round_trip(self):
+        enable_cache(self.path)
+        connect(Person)
+        disable_cache()
+
+        with open(self.path) as f:
+            data = json.load(f)
+
+        self.assertEqual(cache.CACHE_VERSION, data['version'])
+        self.assertEqual(1, len(data['entries']))
+
+        metadata_cache = enable_cache(self.path)
+
+        with patch('model_connect.options.model.model.get_inflect_engine') as get_inflect_engine:
+            connect(Person)
+
+        get_inflect_engine.assert_not_called()
+
+        self.assertEqual(1, metadata_cache.hits)
+        self.assertEqual('people', get_schema(Person, 'psycopg2').tablename)
+
+    def test_fingerprint_mismatch(self):
+        self.assertEqual(
+            fingerprint(Person, ConnectOptions()),
+            fingerprint(Person, ConnectOptions())
+        )
+
+        self.assertNotEqual(
+            fingerprint(Person, ConnectOptions()),
+            fingerprint(Person, ConnectOptions(model=Model(name_plural_parts=['Persons'])))
+        )
+
+        @dataclass
+        class Person2:
+            id: int
+            name: str
+            age: int
+
+        self.assertNotEqual(
+            fingerprint(Person, ConnectOptions()),
+            fingerprint(Person2, ConnectOptions())
+        )
+
+    def test_fingerprint_nested_code(self):
+        # Registered integrations vary between test runs, so only the options are compared
+        script = (
+            'import json\n'
+            'from model_connect.cache import describe\n'
+            'from tests.test_cache import create_tag_options\n'
+            'print(json.dumps(describe(create_tag_options()), sort_keys=True))\n'
+        )
+
+        output = subprocess.run(
+            [sys.executable, '-c', script],
+            capture_output=True,
+            check=True,
+            text=True
+        )
+
+        expected = json.dumps(describe(create_tag_options()), sort_keys=True)
+
+        self.assertEqual(expected, output.stdout.strip())
+        self.assertIsNotNone(fingerprint(Person, create_tag_options()))
+
+    def test_corrupt_file(self):
+        with open(self.path, 'w') as f:
+            f.write('{not json')
+
+        metadata_cache = enable_cache(self.path)
+        connect(Person)
+
+        self.assertEqual(1, metadata_cache.misses)
+        self.assertEqual('people', get_schema(Person, 'psycopg2').tablename)
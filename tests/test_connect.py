@@ -0,0 +1,64 @@
+from dataclasses import dataclass
+from threading import Thread
+from unittest import TestCase
+
+from model_connect import connect, resolve_all
+from model_connect.connect import connect_psycopg2_integration
+from model_connect.constants import UNDEFINED
+from model_connect.options import ConnectOptions
+from model_connect.registry import get_schema, get_model, has
+
+
+class Tests(TestCase):
+    def setUp(self):
+        connect_psycopg2_integration()
+
+    def test_lazy(self):
+        @dataclass
+        class Person:
+            id: int
+
+        options = ConnectOptions()
+
+        connect(Person, options, lazy=True)
+
+        self.assertTrue(has(Person))
+        self.assertIs(UNDEFINED, options.model)
+
+        self.assertEqual('people', get_schema(Person, 'psycopg2').tablename)
+        self.assertIsNot(UNDEFINED, options.model)
+
+    def test_lazy_threads(self):
+        @dataclass
+        class Person:
+            id: int
+
+        connect(Person, lazy=True)
+
+        schemas = []
+
+        threads = [
+            Thread(target=lambda: schemas.append(get_schema(Person)))
+            for _ in range(8)
+        ]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(1, len({id(schema) for schema in schemas}))
+
+    def test_resolve_all(self):
+        @dataclass
+        class Person:
+            id: int
+
+        options = ConnectOptions()
+
+        connect(Person, options, lazy=True)
+        resolve_all()
+
+        self.assertIsNot(UNDEFINED, options.model)
+        self.assertEqual('people', get_model(Person, 'psycopg2').tablename)
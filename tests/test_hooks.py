@@ -0,0 +1,113 @@
+from dataclasses import dataclass
+from typing import Optional
+from unittest import TestCase
+
+from model_connect import connect, add_hook, remove_hook
+from model_connect.hooks import HookEvent, QueryRecorder
+from model_connect.connect import connect_psycopg2_integration
+from model_connect.integrations.psycopg2 import stream_select, stream_insert, select_count
+from model_connect.integrations.psycopg2.testing import FakeConnection
+
+
+@dataclass
+class Person:
+    id: Optional[int]
+    name: str
+
+
+class Tests(TestCase):
+    def setUp(self):
+        connect_psycopg2_integration()
+        connect(Person)
+
+        self.connection = FakeConnection({
+            'people': [{'name': str(index)} for index in range(5)]
+        })
+
+        self.events = []
+
+    def tearDown(self):
+        remove_hook(self.events.append)
+        remove_hook(self.events.append, Person)
+
+    def test_select_phases(self):
+        add_hook(self.events.append, Person)
+
+        people = list(stream_select(self.connection.cursor(), Person, chunk_size=2))
+
+        self.assertEqual(5, len(people))
+        self.assertEqual(
+            [
+                'process_options', 'render', 'execute',
+                'fetch', 'decode', 'fetch', 'decode', 'fetch', 'decode', 'fetch',
+                'rows'
+            ],
+            [event.phase for event in self.events]
+        )
+
+        self.assertEqual(5, self.events[-1].size)
+        self.assertEqual('SELECT id , name FROM people', self.events[1].query.sql)
+        self.assertTrue(all(event.duration >= 0 for event in self.events))
+
+    def test_insert_and_count(self):
+        add_hook(self.events.append)
+
+        list(stream_insert(self.connection.cursor(), Person, [Person(None, 'bob')]))
+        select_count(self.connection.cursor(), Person)
+
+        self.assertEqual(
+            [
+                ('insert', 'process_options'), ('insert', 'encode'), ('insert', 'render'),
+                ('insert', 'execute'), ('insert', 'fetch'), ('insert', 'decode'),
+                ('insert', 'fetch'), ('insert', 'rows'),
+                ('select_count', 'process_options'), ('select_count', 'render'),
+                ('select_count', 'execute'), ('select_count', 'fetch'), ('select_count', 'rows')
+            ],
+            [(event.operation, event.phase) for event in self.events]
+        )
+
+    def test_remove_hook(self):
+        add_hook(self.events.append, Person)
+        remove_hook(self.events.append, Person)
+
+        list(stream_select(self.connection.cursor(), Person))
+
+        self.assertEqual([], self.events)
+
+    def test_failing_hook(self):
+        def fail(event):
+            raise RuntimeError(event.phase)
+
+        add_hook(fail, Person)
+        add_hook(self.events.append, Person)
+
+        try:
+            with self.assertLogs('model_connect.hooks', 'ERROR'):
+                people = list(stream_select(self.connection.cursor(), Person, chunk_size=2))
+        finally:
+            remove_hook(fail, Person)
+
+        self.assertEqual(5, len(people))
+        self.assertEqual('rows', self.events[-1].phase)
+
+    def test_query_recorder_keys_on_timer(self):
+        class Recorder(QueryRecorder):
+            def __init__(self):
+                super().__init__()
+                self.records = []
+
+            def record(self, event, durations):
+                self.records.append(durations)
+
+        with self.assertRaises(TypeError):
+            QueryRecorder()
+
+        recorder = Recorder()
+        query = object()
+
+        # An abandoned query whose query object (and id) is reused by the next one
+        recorder.on_event(HookEvent('execute', 'select', Person, 1.0, query=query, timer_id=1))
+        recorder.on_event(HookEvent('execute', 'select', Person, 0.5, query=query, timer_id=2))
+        recorder.on_event(HookEvent('rows', 'select', Person, 0.6, query=query, timer_id=2))
+
+        self.assertEqual([{'execute': 0.5}], recorder.records)
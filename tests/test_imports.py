@@ -0,0 +1,34 @@
+import subprocess
+import sys
+from unittest import TestCase
+
+
+def get_imported_modules(statement: str, modules: tuple[str, ...]) -> list[str]:
+    output = subprocess.check_output(
+        [
+            sys.executable,
+            '-c',
+            f'import sys\n{statement}\nprint(*[m for m in {modules!r} if m in sys.modules])'
+        ],
+        text=True
+    )
+
+    return output.split()
+
+
+class Tests(TestCase):
+    def test_package_does_not_import_integrations(self):
+        actual = get_imported_modules(
+            'import model_connect',
+            ('inflect', 'jinja2', 'psycopg2', 'fastapi')
+        )
+
+        self.assertEqual([], actual)
+
+    def test_psycopg2_does_not_import_fastapi(self):
+        actual = get_imported_modules(
+            'from model_connect.integrations.psycopg2 import stream_select',
+            ('fastapi', 'psycopg2')
+        )
+
+        self.assertEqual(['psycopg2'], actual)
@@ -0,0 +1,61 @@
+from dataclasses import dataclass, FrozenInstanceError
+from unittest import TestCase
+
+from model_connect import connect
+from model_connect.connect import connect_psycopg2_integration
+from model_connect.options import ConnectOptions, ModelFields, ModelField
+from model_connect.registry import get_schema
+
+
+@dataclass
+class Person:
+    id: int
+    name: str
+    age: int
+
+
+class Tests(TestCase):
+    def setUp(self):
+        connect_psycopg2_integration()
+        connect(
+            Person,
+            ConnectOptions(
+                model_fields=ModelFields(
+                    id=ModelField(
+                        is_identifier=True
+                    ),
+                    age=ModelField(
+                        can_filter=False
+                    )
+                )
+            )
+        )
+
+    def test(self):
+        schema = get_schema(Person)
+
+        self.assertEqual(('id', 'name', 'age'), schema.field_names)
+        self.assertEqual(2, schema.field_indexes['age'])
+        self.assertEqual(('id',), schema.identifier_names)
+        self.assertEqual(frozenset({'id', 'name'}), schema.filterable)
+        self.assertEqual('people', schema.name_plural_snake_case)
+
+    def test_psycopg2(self):
+        schema = get_schema(Person, 'psycopg2')
+
+        self.assertEqual('people', schema.tablename)
+        self.assertEqual(('id', 'name', 'age'), schema.select_columns)
+        self.assertEqual(('name', 'age'), schema.insert_columns)
+        self.assertEqual(('id',), schema.on_conflict_targets)
+        self.assertEqual(('name', 'age'), schema.on_conflict_update_columns)
+
+    def test_immutable(self):
+        schema = get_schema(Person)
+
+        with self.assertRaises(FrozenInstanceError):
+            schema.field_names = ()
+
+        with self.assertRaises(TypeError):
+            schema.field_indexes['id'] = 1
+
+        self.assertFalse(hasattr(schema, '__dict__'))
@@ -0,0 +1,46 @@
+from dataclasses import dataclass
+from unittest import TestCase
+
+from model_connect import connect, warmup
+from model_connect.connect import connect_psycopg2_integration, connect_fastapi_integration
+from model_connect.integrations.fastapi.response import compile_response_serializer, create_response_serializer
+from model_connect.integrations.psycopg2 import create_select_query
+from model_connect.integrations.psycopg2.select import render_select_sql
+from model_connect.options import ConnectOptions, ModelFields, ModelField
+
+
+class Tests(TestCase):
+    def setUp(self):
+        connect_psycopg2_integration()
+        connect_fastapi_integration()
+
+    def test_warmup(self):
+        @dataclass
+        class Person:
+            id: int
+            name: str
+
+        connect(
+            Person,
+            ConnectOptions(
+                model_fields=ModelFields(
+                    id=ModelField(
+                        is_identifier=True
+                    )
+                )
+            ),
+            lazy=True
+        )
+
+        warmup()
+
+        hits = render_select_sql.cache_info().hits
+        query = create_select_query(Person, filter_options={'id': 1})
+
+        self.assertEqual('SELECT id , name FROM people WHERE id = %s', query.sql)
+        self.assertEqual(hits + 1, render_select_sql.cache_info().hits)
+
+        hits = compile_response_serializer.cache_info().hits
+        create_response_serializer(Person, 'get')
+
+        self.assertEqual(hits + 1, compile_response_serializer.cache_info().hits)